@@ -1,10 +1,5 @@
-from processing.parser import parse_resume, parse_text_file, extract_required_experience
-from processing.cleaner import clean_text
-from nlp.extractor import split_into_sections, build_profile
-
-from scoring.similarity import compute_similarity, compute_semantic_similarity
-from scoring.engine import calculate_match_score
-from scoring.final_score import compute_final_score
+from processing.parser import parse_text_file
+from pipeline.screening import screen_batch
 
 from recommendations.advisor import (
     generate_recommendations,
@@ -16,44 +11,20 @@ if __name__ == "__main__":
     jd_path = "data/jds/sample_jd.txt"
 
     # -------------------------
-    # Resume pipeline
-    # -------------------------
-    raw_resume = parse_resume(resume_path)
-    clean_resume = clean_text(raw_resume)
-    sections = split_into_sections(clean_resume)
-    profile = build_profile(sections)
-
-    # -------------------------
-    # JD pipeline
+    # Resume + JD pipeline, similarity and scoring
     # -------------------------
     jd_text = parse_text_file(jd_path)
-    clean_jd = clean_text(jd_text)
+    result = screen_batch(jd_text, [resume_path], workers=1)[0]
 
-    # -------------------------
-    # Similarity
-    # -------------------------
-    similarity_score = compute_similarity(clean_resume, clean_jd)
-    semantic_score = compute_semantic_similarity(clean_resume, clean_jd)
+    if result["error"]:
+        raise SystemExit(f"Could not process {resume_path}: {result['error']}")
 
-    # -------------------------
-    # Skill matching
-    # -------------------------
-    skill_result = calculate_match_score(profile, clean_jd)
-
-    # -------------------------
-    # Final weighted score
-    # -------------------------
-    required_exp = extract_required_experience(clean_jd)
-    has_degree = "btech" in profile.get("education", [])
-
-    final_score_result = compute_final_score(
-        skill_match_percent=skill_result["skill_match_percent"],
-        semantic_similarity=semantic_score,
-        experience_years=profile["experience_years"],
-        required_experience=required_exp,
-        has_required_degree=has_degree,
-        keyword_similarity=similarity_score
-    )
+    clean_resume = result["clean_text"]
+    profile = result["profile"]
+    similarity_score = result["tfidf"]
+    semantic_score = result["semantic"]
+    skill_result = result["skill_result"]
+    final_score_result = result["final_score"]
 
     # -------------------------
     # Under-emphasized strengths
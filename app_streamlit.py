@@ -4,13 +4,9 @@ import os
 import time
 import pandas as pd
 
-from processing.parser import parse_resume, parse_text_file, extract_required_experience
-from processing.cleaner import clean_text
-from nlp.extractor import split_into_sections, build_profile
-
-from scoring.similarity import compute_similarity, compute_semantic_similarity
-from scoring.engine import calculate_match_score
-from scoring.final_score import compute_final_score
+from processing.parser import parse_text_file
+from pipeline.screening import screen_batch
+from storage.profile_store import get_profile_store
 
 from recommendations.advisor import (
     generate_recommendations,
@@ -19,8 +15,17 @@ from recommendations.advisor import (
 
 from reports.pdf_generator import generate_pdf_report_bytes
 from utils.logger import log_time
-from utils.identity import extract_candidate_identity
 from utils.highlighter import find_skill_context
+from utils.model_registry import warm_up
+from utils import profiler
+
+
+# Start loading spaCy / SBERT in the background while files are uploaded
+warm_up(background=True)
+
+# Parse workers per click: each loads its own spaCy model, and several
+# sessions may be screening at once
+UI_WORKERS = min(4, os.cpu_count() or 1)
 
 
 # -------------------------
@@ -44,6 +49,18 @@ resume_files = st.file_uploader(
 jd_file = st.file_uploader("Upload Job Description (TXT)", type=["txt"])
 
 
+# -------------------------
+# Profiling (off by default)
+# -------------------------
+profile_on, trace_memory = profiler.settings()
+profile_on = st.sidebar.checkbox("Profile pipeline stages", value=profile_on)
+trace_memory = st.sidebar.checkbox(
+    "Trace memory allocations (slower)",
+    value=trace_memory,
+    disabled=not profile_on
+)
+
+
 # -------------------------
 # Analyze Button
 # -------------------------
@@ -62,116 +79,88 @@ if st.button("Analyze Match"):
                 tmp_jd.write(jd_text)
                 jd_path = tmp_jd.name
 
+            # Samples are kept per run, so concurrent sessions don't mix
+            stage_profile = profiler.profile_run("Resume Screening", enabled=profile_on, trace_memory=trace_memory)
+
             try:
                 start_time = time.time()
+                stage_profile.start()
 
                 # -------------------------
-                # JD pipeline (once)
+                # JD text
                 # -------------------------
                 jd_raw = parse_text_file(jd_path)
-                clean_jd = clean_text(jd_raw)
 
                 results = []
                 top_candidate_data = None   # used for PDF when only one resume
 
                 # -------------------------
-                # Loop over resumes
+                # Screen all resumes (parallel parsing, batched similarity)
+                # Uploads are parsed from memory; profiles are stored by
+                # the uploaded bytes, so repeat uploads skip parsing and NLP.
                 # -------------------------
-                for resume_file in resume_files:
-
-                    resume_suffix = os.path.splitext(resume_file.name)[1]
-
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=resume_suffix) as tmp_resume:
-                        tmp_resume.write(resume_file.read())
-                        resume_path = tmp_resume.name
-
-                    try:
-                        # -------------------------
-                        # Resume pipeline
-                        # -------------------------
-                        raw_resume = parse_resume(resume_path)
-                        clean_resume = clean_text(raw_resume)
-                        sections = split_into_sections(clean_resume)
-                        profile = build_profile(sections)
-
-                        # -------------------------
-                        # Similarity
-                        # -------------------------
-                        tfidf_score = compute_similarity(clean_resume, clean_jd)
-                        semantic_score = compute_semantic_similarity(clean_resume, clean_jd)
-
-                        # -------------------------
-                        # Skill matching
-                        # -------------------------
-                        skill_result = calculate_match_score(profile, clean_jd)
-
-                        # -------------------------
-                        # Skill context
-                        # -------------------------
-                        skill_context = find_skill_context(
-                            clean_resume,
-                            skill_result["matched_skills"]
-                        )
+                screened = screen_batch(
+                    jd_raw,
+                    [(resume_file.name, resume_file.getvalue()) for resume_file in resume_files],
+                    workers=UI_WORKERS,
+                    store=get_profile_store()
+                )
 
-                        # -------------------------
-                        # Final weighted score
-                        # -------------------------
-                        required_exp = extract_required_experience(clean_jd)
-                        has_degree = "btech" in profile.get("education", [])
-
-                        final_score_result = compute_final_score(
-                            skill_match_percent=skill_result["skill_match_percent"],
-                            semantic_similarity=semantic_score,
-                            experience_years=profile["experience_years"],
-                            required_experience=required_exp,
-                            has_required_degree=has_degree,
-                            keyword_similarity=tfidf_score
-                        )
+                for item in screened:
 
-                        # -------------------------
-                        # Candidate identity
-                        # -------------------------
-                        candidate_name = extract_candidate_identity(raw_resume)
-
-                        # -------------------------
-                        # Store result
-                        # -------------------------
-                        row = {
-                            "Candidate": candidate_name,
-                            "Final Match %": round(final_score_result["final_match_percent"], 2),
-                            "Matched Skills": ", ".join(skill_result["matched_skills"]) if skill_result["matched_skills"] else "None",
-                            "Missing Skills": ", ".join(skill_result["missing_skills"]) if skill_result["missing_skills"] else "None",
-                        }
+                    if item["error"]:
+                        st.warning(f"Could not process {item['path']}: {item['error']}")
+                        continue
 
-                        results.append(row)
+                    clean_resume = item["clean_text"]
+                    profile = item["profile"]
+                    skill_result = item["skill_result"]
+                    final_score_result = item["final_score"]
+                    candidate_name = item["candidate_name"]
 
-                        # Save data for PDF when only one resume is uploaded
-                        if len(resume_files) == 1:
-                            under_emphasized = find_under_emphasized_strengths(
-                                resume_text=clean_resume,
-                                jd_skills=skill_result["jd_skills"]
-                            )
+                    # -------------------------
+                    # Skill context
+                    # -------------------------
+                    skill_context = find_skill_context(
+                        clean_resume,
+                        skill_result["matched_skills"]
+                    )
 
-                            suggestions = generate_recommendations(
-                                skill_result,
-                                under_emphasized=under_emphasized
-                            )
+                    # -------------------------
+                    # Store result
+                    # -------------------------
+                    row = {
+                        "Candidate": candidate_name,
+                        "Final Match %": round(final_score_result["final_match_percent"], 2),
+                        "Matched Skills": ", ".join(skill_result["matched_skills"]) if skill_result["matched_skills"] else "None",
+                        "Missing Skills": ", ".join(skill_result["missing_skills"]) if skill_result["missing_skills"] else "None",
+                    }
 
-                            top_candidate_data = {
-                                "final_score": final_score_result["final_match_percent"],
-                                "matched_skills": skill_result["matched_skills"],
-                                "missing_skills": skill_result["missing_skills"],
-                                "recommendations": suggestions,
-                                "profile": profile,
-                                "skill_context": skill_context,
-                                "tfidf": tfidf_score,
-                                "semantic": semantic_score,
-                                "candidate_name": candidate_name
-                            }
-
-                    finally:
-                        if os.path.exists(resume_path):
-                            os.remove(resume_path)
+                    results.append(row)
+
+                    # Save data for PDF when only one resume is uploaded
+                    if len(resume_files) == 1:
+                        under_emphasized = find_under_emphasized_strengths(
+                            resume_text=clean_resume,
+                            jd_skills=skill_result["jd_skills"]
+                        )
+
+                        suggestions = generate_recommendations(
+                            skill_result,
+                            under_emphasized=under_emphasized
+                        )
+
+                        top_candidate_data = {
+                            "final_score": final_score_result["final_match_percent"],
+                            "matched_skills": skill_result["matched_skills"],
+                            "missing_skills": skill_result["missing_skills"],
+                            "recommendations": suggestions,
+                            "profile": profile,
+                            "skill_context": skill_context,
+                            "tfidf": item["tfidf"],
+                            "semantic": item["semantic"],
+                            "candidate_name": candidate_name
+                        }
 
                 # -------------------------
                 # Rank results
@@ -188,8 +177,10 @@ if st.button("Analyze Match"):
                 # -------- Ranked Table --------
                 st.subheader("🏆 Ranked Candidates")
 
-                df = pd.DataFrame(results)
-                df = df[["Rank", "Candidate", "Final Match %", "Matched Skills", "Missing Skills"]]
+                df = pd.DataFrame(
+                    results,
+                    columns=["Rank", "Candidate", "Final Match %", "Matched Skills", "Missing Skills"]
+                )
                 st.dataframe(df, use_container_width=True)
 
                 # -------------------------
@@ -219,7 +210,7 @@ if st.button("Analyze Match"):
                     st.subheader("📍 Skill Hits in Context")
 
                     if top_candidate_data["skill_context"]:
-                        for snippet, data in top_candidate_data["skill_context"].items():
+                        for data in top_candidate_data["skill_context"].values():
                             skills_list = ", ".join([s.title() for s in data["skills"]])
                             st.markdown(f"**Skills found here:** {skills_list}")
                             st.markdown(
@@ -297,9 +288,20 @@ if st.button("Analyze Match"):
                 total_time = log_time(start_time, "Resume Screening")
                 st.caption(f"⏱ Processing time: {total_time}s")
 
+                report = stage_profile.stop()
+                if report:
+                    with st.expander("⏱ Stage timings"):
+                        memory = f"RSS change: {report['rss_delta_mb']} MB"
+                        if report["peak_traced_mb"] is not None:
+                            memory += f" · Peak traced allocations: {report['peak_traced_mb']} MB"
+                        memory += f" · Process peak RSS: {report['process_peak_rss_mb']} MB"
+                        st.caption(memory)
+                        st.dataframe(pd.DataFrame(report["stages"]), use_container_width=True)
+
             except Exception as e:
                 st.error(f"Something went wrong: {e}")
 
             finally:
+                stage_profile.stop()
                 if os.path.exists(jd_path):
                     os.remove(jd_path)
@@ -0,0 +1,69 @@
+"""
+Vector index benchmark: IVF recall and latency vs. exact search.
+
+Synthetic 384-d embeddings (the all-MiniLM-L6-v2 size) are drawn around
+random topic centres, so neighbourhoods look like real resume clusters
+rather than uniform noise. Queries are drawn from the same distribution.
+
+Usage:
+    python benchmarks/ann_recall.py
+    python benchmarks/ann_recall.py --sizes 10000 100000 --nprobe 1 4 8 16 32
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from retrieval.vector_index import VectorIndex                  # noqa: E402
+
+DIM = 384
+
+
+def synthetic_embeddings(n: int, n_topics: int = 200, noise: float = 0.6, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    topics = rng.standard_normal((n_topics, DIM)).astype(np.float32)
+    labels = rng.integers(0, n_topics, n)
+    return topics[labels] + noise * rng.standard_normal((n, DIM)).astype(np.float32)
+
+
+def recall_at_k(approx, exact) -> float:
+    hits = sum(len({i for i, _ in a} & {i for i, _ in e}) for a, e in zip(approx, exact))
+    return hits / sum(len(e) for e in exact)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        vectors = synthetic_embeddings(size)
+        queries = synthetic_embeddings(args.queries, seed=1)
+        ids = [f"resume-{i}" for i in range(size)]
+
+        index = VectorIndex(DIM)
+        start = time.perf_counter()
+        index.add(ids, vectors)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        exact = [index.exact_search(q, args.k) for q in queries]
+        exact_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        print(f"\n{size} vectors, {index.n_lists} lists, built in {build_s:.1f}s")
+        print(f"{'nprobe':>8}{'recall@' + str(args.k):>12}{'ms/query':>12}{'speedup':>10}")
+        print(f"{'exact':>8}{1.0:>12.3f}{exact_ms:>12.2f}{1.0:>10.1f}")
+
+        for nprobe in args.nprobe:
+            start = time.perf_counter()
+            approx = [index.search(q, args.k, nprobe=nprobe) for q in queries]
+            ms = (time.perf_counter() - start) / len(queries) * 1000
+            print(f"{nprobe:>8}{recall_at_k(approx, exact):>12.3f}{ms:>12.2f}{exact_ms / ms:>10.1f}")
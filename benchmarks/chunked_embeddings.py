@@ -0,0 +1,154 @@
+"""
+Chunked embeddings benchmark: whole-document SBERT encoding (truncated at
+the model's 256 word pieces) vs. section / sliding-window chunks pooled by
+max, mean or best chunk.
+
+Accuracy: Spearman correlation of each mode's semantic similarity with
+the human scores in evaluation/labels.csv.
+
+Throughput: --docs long resumes (--words words each, about three pages),
+assembled from synthetic resumes (benchmarks/synthetic.py), encoded with
+the embedding store bypassed (cold) and then again through a fresh store
+(warm: every chunk is a cache hit).
+
+Usage:
+    python benchmarks/chunked_embeddings.py
+    python benchmarks/chunked_embeddings.py --docs 500 --words 1200
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Fresh embedding / parse caches, so "cold" and "warm" mean what they say
+os.environ["RESUME_SCREENER_CACHE_DIR"] = tempfile.mkdtemp(prefix="chunk-bench-")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import numpy as np                                                               # noqa: E402
+from scipy.stats import spearmanr                                                # noqa: E402
+
+from benchmarks.synthetic import load_resume_lines, load_roles, make_resume, to_text   # noqa: E402
+from evaluation.engine import load_labels                                        # noqa: E402
+from pipeline.screening import process_resumes                                   # noqa: E402
+from processing.cleaner import clean_text                                        # noqa: E402
+from processing.parser import parse_text_file                                    # noqa: E402
+from scoring.chunking import best_chunk_similarity, chunk_documents, pool_chunks  # noqa: E402
+from scoring.job_profile import JobProfile                                       # noqa: E402
+from scoring.similarity import (                                                 # noqa: E402
+    compute_semantic_similarity_batch,
+    encode_chunked,
+    encode_texts
+)
+from utils.model_registry import get_model                                       # noqa: E402
+
+MODES = [
+    ("whole document", None, None),
+    ("section / max", "section", "max"),
+    ("section / mean", "section", "mean"),
+    ("section / best", "section", "best"),
+    ("window / max", "window", "max"),
+    ("window / mean", "window", "mean"),
+    ("window / best", "window", "best"),
+]
+
+
+def accuracy(labels_path: str):
+    labels = load_labels(os.path.join(REPO_ROOT, labels_path),
+                         os.path.join(REPO_ROOT, "data", "resumes"),
+                         os.path.join(REPO_ROOT, "data", "jds"))
+    processed = process_resumes([row["resume_path"] for row in labels], workers=1)
+    jobs = {}
+    pairs = []
+    for row, item in zip(labels, processed):
+        if item["error"] is None:
+            if row["jd_path"] not in jobs:
+                jobs[row["jd_path"]] = JobProfile.build(parse_text_file(row["jd_path"]))
+            pairs.append((jobs[row["jd_path"]], item["clean_text"], row["human_score"]))
+
+    human = [score for _, _, score in pairs]
+    results = {}
+    for name, chunking, pooling in MODES:
+        scores = [
+            compute_semantic_similarity_batch(job, [text], chunking=chunking, pooling=pooling or "max")[0]
+            for job, text, _ in pairs
+        ]
+        results[name] = spearmanr(human, scores)[0]
+    return results, len(pairs)
+
+
+def long_resumes(n_docs: int, n_words: int, seed: int = 0):
+    rng = random.Random(seed)
+    roles, filler = load_roles(), load_resume_lines()
+
+    texts = []
+    for _ in range(n_docs):
+        parts, size = [], 0
+        while size < n_words:
+            part = to_text(make_resume(rng, roles, filler))
+            parts.append(part)
+            size += len(part.split())
+        texts.append(clean_text(" ".join(parts)))
+    return texts
+
+
+def throughput(texts, jd_embedding, batch_size: int):
+    results = {}
+    for name, chunking, pooling in MODES:
+        row = {}
+        for label, use_cache in (("cold", False), ("warm", True)):
+            if use_cache:
+                # Fill the store first; the timed pass is then all hits
+                _encode(texts, chunking, batch_size, use_cache=True)
+
+            start = time.perf_counter()
+            vectors, offsets = _encode(texts, chunking, batch_size, use_cache)
+            if chunking is None:
+                scores = vectors @ jd_embedding
+            elif pooling == "best":
+                scores = best_chunk_similarity(vectors, offsets, jd_embedding)
+            else:
+                scores = pool_chunks(vectors, offsets, pooling) @ jd_embedding
+            row[label] = len(texts) / (time.perf_counter() - start)
+
+        chunks = len(vectors)
+        row["chunks_per_doc"] = chunks / len(texts)
+        results[name] = row
+        assert len(scores) == len(texts)
+    return results
+
+
+def _encode(texts, chunking, batch_size, use_cache):
+    if chunking is None:
+        return encode_texts(texts, batch_size=batch_size, use_cache=use_cache), None
+    return encode_chunked(texts, chunking, batch_size=batch_size, use_cache=use_cache)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--labels", default=os.path.join("evaluation", "labels.csv"))
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--words", type=int, default=900, help="words per resume (~300 per page)")
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    get_model("semantic")   # load time kept out of the measurements
+
+    spearman, n_pairs = accuracy(args.labels)
+
+    texts = long_resumes(args.docs, args.words)
+    jd_embedding = encode_texts([clean_text(parse_text_file(os.path.join(REPO_ROOT, "data", "jds", "sample_jd.txt")))])[0]
+    jd_embedding = jd_embedding / (np.linalg.norm(jd_embedding) or 1.0)
+    speed = throughput(texts, jd_embedding, args.batch_size)
+
+    unique = len(set(chunk_documents(texts, "section")[0]))
+    total = len(chunk_documents(texts, "section")[0])
+    print(f"accuracy: {n_pairs} labelled pairs; throughput: {args.docs} resumes x ~{args.words} words "
+          f"({total - unique} of {total} section chunks repeated)\n")
+    print(f"{'mode':<18}{'spearman':>10}{'chunks/doc':>12}{'cold docs/s':>13}{'warm docs/s':>13}")
+    for name, _, _ in MODES:
+        row = speed[name]
+        print(f"{name:<18}{spearman[name]:>10.3f}{row['chunks_per_doc']:>12.1f}{row['cold']:>13.1f}{row['warm']:>13.1f}")
@@ -0,0 +1,107 @@
+"""
+Skill-matcher benchmark: old substring loop vs. token trie vs. spaCy PhraseMatcher.
+
+Vocabularies of 30, 1,000 and 10,000 skills are built from the real SKILLS
+list padded with synthetic multi-word terms. The text is the sample
+resumes in data/resumes (cleaned), repeated to resume length.
+
+Usage:
+    python benchmarks/skill_matcher.py
+    python benchmarks/skill_matcher.py --sizes 30 1000 10000 --repeat 20
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from processing.cleaner import clean_text                       # noqa: E402
+from processing.parser import parse_resume                      # noqa: E402
+from nlp.skill_matcher import SkillMatcher                      # noqa: E402
+from nlp.skills import SKILLS, SKILL_SYNONYMS                   # noqa: E402
+
+WORDS = [
+    "cloud", "data", "stream", "graph", "query", "cache", "vector", "secure",
+    "mobile", "edge", "batch", "event", "model", "search", "test", "build",
+    "deploy", "monitor", "network", "storage", "compute", "pipeline", "service",
+]
+
+
+def build_vocabulary(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    vocab = list(dict.fromkeys(SKILLS))
+
+    while len(vocab) < size:
+        n_words = rng.choice([1, 2, 2, 3])
+        term = " ".join(rng.choice(WORDS) for _ in range(n_words)) + f" {len(vocab)}"
+        vocab.append(term)
+
+    return vocab[:size]
+
+
+def load_text() -> str:
+    paths = sorted(glob.glob(os.path.join(REPO_ROOT, "data", "resumes", "*.pdf")))
+    text = " ".join(clean_text(parse_resume(p)) for p in paths)
+    return text
+
+
+def substring_loop(vocab, text):
+    found = set()
+    for skill in vocab:
+        if skill in text:
+            found.add(SKILL_SYNONYMS.get(skill, skill))
+    return found
+
+
+def timeit(fn, repeat):
+    fn()   # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def load_spacy():
+    try:
+        import spacy
+        from spacy.matcher import PhraseMatcher
+        return spacy.load("en_core_web_sm"), PhraseMatcher
+    except Exception:
+        return None, None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[30, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    text = load_text()
+    nlp, PhraseMatcher = load_spacy()
+
+    print(f"text: {len(text)} chars; spaCy: {'yes' if nlp else 'not installed'}\n")
+    print(f"{'vocab':>7}{'build trie':>12}{'loop':>10}{'trie':>10}{'spaCy':>10}{'spaCy+nlp()':>13}   (ms per doc)")
+
+    for size in args.sizes:
+        vocab = build_vocabulary(size)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(vocab, SKILL_SYNONYMS)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        loop_ms = timeit(lambda: substring_loop(vocab, text), args.repeat)
+        trie_ms = timeit(lambda: matcher.extract(text), args.repeat)
+
+        spacy_ms = spacy_full_ms = "-"
+        if nlp:
+            phrase_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+            phrase_matcher.add("SKILLS", list(nlp.tokenizer.pipe(vocab)))
+            doc = nlp.make_doc(text)
+            spacy_ms = f"{timeit(lambda: phrase_matcher(doc), args.repeat):.2f}"
+            spacy_full_ms = f"{timeit(lambda: phrase_matcher(nlp(text)), args.repeat):.2f}"
+
+        print(f"{size:>7}{build_ms:>12.1f}{loop_ms:>10.2f}{trie_ms:>10.2f}{spacy_ms:>10}{spacy_full_ms:>13}")
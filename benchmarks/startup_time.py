@@ -0,0 +1,125 @@
+"""
+Startup benchmark: import time of each top-level module.
+
+Every import runs in a fresh interpreter so nothing is shared between
+measurements. With --baseline, the same modules are also timed in a
+temporary git worktree of that revision, to compare before/after.
+
+Usage:
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --baseline HEAD~1 --repeat 5
+    python benchmarks/startup_time.py --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "processing.cleaner",
+    "processing.parser",
+    "nlp.disambiguation",
+    "nlp.skills",
+    "nlp.extractor",
+    "scoring.final_score",
+    "scoring.engine",
+    "scoring.similarity",
+    "recommendations.advisor",
+    "reports.pdf_generator",
+    "utils.identity",
+    "utils.highlighter",
+    "app",
+]
+
+TIMER = (
+    "import time, importlib; "
+    "t = time.perf_counter(); "
+    "importlib.import_module({module!r}); "
+    "print(time.perf_counter() - t)"
+)
+
+
+def time_import(module: str, cwd: str, repeat: int):
+    """
+    Median import time in seconds, or None if the import fails.
+    """
+    samples = []
+
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", TIMER.format(module=module)],
+            cwd=cwd,
+            capture_output=True,
+            text=True
+        )
+        if proc.returncode != 0:
+            return None
+        samples.append(float(proc.stdout.strip().splitlines()[-1]))
+
+    return statistics.median(samples)
+
+
+def time_all(cwd: str, repeat: int) -> dict:
+    return {m: time_import(m, cwd, repeat) for m in MODULES}
+
+
+def time_revision(revision: str, repeat: int) -> dict:
+    """
+    Times the modules as they exist at `revision`, using a throwaway worktree.
+    """
+    worktree = tempfile.mkdtemp(prefix="startup-bench-")
+
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", worktree, revision],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True
+    )
+    try:
+        return time_all(worktree, repeat)
+    finally:
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", worktree],
+            cwd=REPO_ROOT,
+            capture_output=True
+        )
+
+
+def _fmt(seconds):
+    return "error" if seconds is None else f"{seconds:.3f}s"
+
+
+def print_report(current: dict, baseline: dict = None) -> None:
+    if baseline is None:
+        print(f"{'module':<28}{'import':>10}")
+        for module, seconds in current.items():
+            print(f"{module:<28}{_fmt(seconds):>10}")
+        return
+
+    print(f"{'module':<28}{'before':>10}{'after':>10}{'speedup':>10}")
+    for module, after in current.items():
+        before = baseline.get(module)
+        speedup = f"{before / after:.1f}x" if before and after else "-"
+        print(f"{module:<28}{_fmt(before):>10}{_fmt(after):>10}{speedup:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", help="git revision to compare against (e.g. HEAD~1)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module (median is reported)")
+    parser.add_argument("--json", help="also write results to this JSON file")
+    args = parser.parse_args()
+
+    current = time_all(REPO_ROOT, args.repeat)
+    baseline = time_revision(args.baseline, args.repeat) if args.baseline else None
+
+    print_report(current, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"current": current, "baseline": baseline}, f, indent=2)
@@ -0,0 +1,307 @@
+"""
+Benchmark suite: end-to-end screening over synthetic corpora.
+
+For each corpus size (default 10, 1,000 and 10,000 resumes, PDF and DOCX
+mixed, see benchmarks/synthetic.py) one JD is screened against every
+resume with pipeline.screening.screen_batch, twice: once with empty parse /
+embedding caches and once with them warm. Each size runs in a fresh
+interpreter with its own cache directory, so sizes don't share caches or
+memory. Reported per size: docs/sec, per-stage timings from
+utils/profiler.py (count, total, mean, p95) and peak RSS (parent plus pool
+workers).
+
+Startup is measured separately, in a fresh interpreter: import time, the
+first resume (models and taxonomy loaded on the way: cold) and the second
+(warm).
+
+Results are saved as JSON; `compare` diffs two result files and exits
+with status 1 if anything got slower / bigger than --threshold.
+
+Usage:
+    python benchmarks/suite.py run --output bench.json
+    python benchmarks/suite.py run --sizes 10 1000 --workers 4 --output bench.json
+    python benchmarks/suite.py compare baseline.json bench.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+CORPUS_ROOT = os.path.join(os.environ.get("RESUME_SCREENER_CACHE_DIR", ".cache"), "bench_corpus")
+
+DEFAULT_SIZES = [10, 1000, 10000]
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_MIN_MS = 1.0
+
+
+# -------------------------
+# Measurements (each runs in its own interpreter)
+# -------------------------
+def _corpus_files(corpus_dir: str) -> Tuple[List[str], str]:
+    with open(os.path.join(corpus_dir, "manifest.json"), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    paths = [os.path.join(corpus_dir, r["file"]) for r in manifest["resumes"]]
+    return paths, os.path.join(corpus_dir, manifest["jds"][0]["file"])
+
+
+def measure_throughput(corpus_dir: str, workers: Optional[int]) -> dict:
+    start = time.perf_counter()
+    from pipeline.screening import screen_batch
+    from processing.parser import parse_text_file
+    from utils import profiler
+    from utils.model_registry import load_times, warm_up
+    import_s = time.perf_counter() - start
+
+    warm_up(background=False)
+
+    paths, jd_path = _corpus_files(corpus_dir)
+    jd_text = parse_text_file(jd_path)
+    profiler.enable(True)
+
+    passes = {}
+    for name in ("cold_cache", "warm_cache"):
+        run = profiler.profile_run(name, export_path=None).start()
+        start = time.perf_counter()
+        results = screen_batch(jd_text, paths, workers=workers)
+        wall = time.perf_counter() - start
+        report = run.stop()
+
+        passes[name] = {
+            "wall_s": round(wall, 3),
+            "docs_per_sec": round(len(paths) / wall, 2),
+            "errors": sum(1 for r in results if r["error"] is not None),
+            "stages": {
+                row["stage"]: {k: row[k] for k in ("count", "total_ms", "mean_ms", "p95_ms")}
+                for row in report["stages"]
+            }
+        }
+
+    return {
+        "docs": len(paths),
+        "import_s": round(import_s, 3),
+        "model_load_s": load_times(),
+        "peak_rss_mb": profiler.peak_rss_mb(),
+        **passes
+    }
+
+
+def measure_startup(corpus_dir: str) -> dict:
+    start = time.perf_counter()
+    from pipeline.screening import screen_batch
+    from processing.parser import parse_text_file
+    from utils.model_registry import load_times
+    import_s = time.perf_counter() - start
+
+    paths, jd_path = _corpus_files(corpus_dir)
+    jd_text = parse_text_file(jd_path)
+
+    timings = []
+    for path in paths[:2]:
+        start = time.perf_counter()
+        screen_batch(jd_text, [path], workers=1)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "import_s": round(import_s, 3),
+        "first_doc_s": round(timings[0], 3),
+        "cold_s": round(import_s + timings[0], 3),
+        "warm_doc_s": round(timings[-1], 3),
+        "model_load_s": load_times()
+    }
+
+
+def _run_child(command: str, corpus_dir: str, workers: Optional[int] = None) -> dict:
+    """
+    Runs one measurement in a fresh interpreter with empty caches.
+    """
+    args = [sys.executable, os.path.abspath(__file__), command, corpus_dir]
+    if workers:
+        args += ["--workers", str(workers)]
+
+    with tempfile.TemporaryDirectory(prefix="bench-cache-") as cache_dir:
+        env = dict(os.environ, RESUME_SCREENER_CACHE_DIR=cache_dir)
+        start = time.perf_counter()
+        proc = subprocess.run(args, cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"{command} failed:\n{proc.stderr.strip()}")
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["process_s"] = round(elapsed, 3)
+    return result
+
+
+# -------------------------
+# Run
+# -------------------------
+def _revision() -> Optional[str]:
+    proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True)
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+def run_suite(sizes: List[int], workers: Optional[int], seed: int, corpus_root: str = CORPUS_ROOT) -> dict:
+    from benchmarks.synthetic import generate_corpus
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": _revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "workers": workers or os.cpu_count(),
+            "seed": seed
+        },
+        "sizes": {}
+    }
+
+    for size in sizes:
+        corpus_dir = os.path.abspath(os.path.join(corpus_root, f"{size}-seed{seed}"))
+        print(f"corpus of {size} resumes: {corpus_dir}", flush=True)
+        generate_corpus(corpus_dir, n_resumes=max(size, 2), n_jds=1, seed=seed)
+
+        if "startup" not in results:
+            results["startup"] = _run_child("startup", corpus_dir)
+        results["sizes"][str(size)] = _run_child("throughput", corpus_dir, workers)
+
+    return results
+
+
+def print_results(results: dict, top_stages: int = 10) -> None:
+    startup = results["startup"]
+    print(f"\nstartup: import {startup['import_s']:.2f}s, first resume {startup['first_doc_s']:.2f}s "
+          f"(cold total {startup['cold_s']:.2f}s), next resume {startup['warm_doc_s']:.3f}s")
+
+    print(f"\n{'docs':>8}{'cold docs/s':>14}{'warm docs/s':>14}{'peak RSS MB':>14}{'errors':>8}")
+    for run in results["sizes"].values():
+        print(f"{run['docs']:>8}{run['cold_cache']['docs_per_sec']:>14.1f}{run['warm_cache']['docs_per_sec']:>14.1f}"
+              f"{run['peak_rss_mb'] or 0:>14.1f}{run['cold_cache']['errors']:>8}")
+
+    largest = list(results["sizes"].values())[-1]
+    stages = sorted(largest["cold_cache"]["stages"].items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+    print(f"\nstages at {largest['docs']} docs, empty caches:")
+    print(f"{'stage':<28}{'count':>8}{'total ms':>12}{'mean ms':>10}{'p95 ms':>10}")
+    for stage, row in stages[:top_stages]:
+        print(f"{stage:<28}{row['count']:>8}{row['total_ms']:>12.1f}{row['mean_ms']:>10.2f}{row['p95_ms']:>10.2f}")
+
+
+# -------------------------
+# Compare
+# -------------------------
+def flatten_metrics(results: dict) -> Dict[str, Tuple[float, bool]]:
+    """
+    {metric: (value, higher_is_better)} for every comparable number.
+    """
+    metrics = {}
+    startup = results.get("startup", {})
+    for key in ("import_s", "cold_s", "warm_doc_s"):
+        if key in startup:
+            metrics[f"startup.{key}"] = (startup[key], False)
+
+    for size, run in results.get("sizes", {}).items():
+        metrics[f"{size}.peak_rss_mb"] = (run["peak_rss_mb"], False)
+        for name in ("cold_cache", "warm_cache"):
+            metrics[f"{size}.{name}.docs_per_sec"] = (run[name]["docs_per_sec"], True)
+            for stage, row in run[name]["stages"].items():
+                metrics[f"{size}.{name}.{stage}.total_ms"] = (row["total_ms"], False)
+
+    return metrics
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD, min_ms: float = DEFAULT_MIN_MS) -> List[dict]:
+    """
+    One row per metric present in both runs. "status" is "regression" /
+    "improvement" when the metric moved by more than `threshold` (relative)
+    and, for timings in ms, by at least `min_ms`; otherwise "".
+    """
+    before, after = flatten_metrics(baseline), flatten_metrics(current)
+    rows = []
+
+    for metric in before.keys() & after.keys():
+        (old, higher_is_better), (new, _) = before[metric], after[metric]
+        if old is None or new is None:
+            continue
+
+        change = (new - old) / old if old else 0.0
+        worse = -change if higher_is_better else change
+
+        status = ""
+        if abs(change) > threshold and not (metric.endswith("_ms") and abs(new - old) < min_ms):
+            status = "regression" if worse > 0 else "improvement"
+
+        rows.append({"metric": metric, "before": old, "after": new, "change": change, "status": status})
+
+    return sorted(rows, key=lambda r: r["metric"])
+
+
+def print_comparison(rows: List[dict], show_all: bool = False) -> None:
+    print(f"{'metric':<56}{'before':>12}{'after':>12}{'change':>10}")
+    for row in rows:
+        if show_all or row["status"]:
+            print(f"{row['metric']:<56}{row['before']:>12.2f}{row['after']:>12.2f}{row['change']:>+10.1%}"
+                  f"  {row['status'].upper()}")
+
+    regressions = sum(r["status"] == "regression" for r in rows)
+    improvements = sum(r["status"] == "improvement" for r in rows)
+    print(f"\n{len(rows)} metrics compared: {regressions} regression(s), {improvements} improvement(s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="generate corpora (if needed) and benchmark them")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run_parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--corpus-root", default=CORPUS_ROOT)
+    run_parser.add_argument("--output", help="write results to this JSON file")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions between two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="relative change counted as a regression (default 0.1 = 10%%)")
+    compare_parser.add_argument("--min-ms", type=float, default=DEFAULT_MIN_MS,
+                                help="ignore stage timing changes smaller than this")
+    compare_parser.add_argument("--all", action="store_true", help="list every metric, not only changed ones")
+
+    # Internal: one measurement in this interpreter, printed as JSON
+    for name in ("throughput", "startup"):
+        child = commands.add_parser(name)
+        child.add_argument("corpus_dir")
+        child.add_argument("--workers", type=int, default=None)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_suite(args.sizes, args.workers, args.seed, args.corpus_root)
+        print_results(results)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"\nsaved to {args.output}")
+
+    elif args.command == "compare":
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, "r", encoding="utf-8") as f:
+            current = json.load(f)
+        rows = compare(baseline, current, args.threshold, args.min_ms)
+        print_comparison(rows, args.all)
+        sys.exit(1 if any(r["status"] == "regression" for r in rows) else 0)
+
+    elif args.command == "throughput":
+        print(json.dumps(measure_throughput(args.corpus_dir, args.workers)))
+
+    else:
+        print(json.dumps(measure_startup(args.corpus_dir)))
@@ -0,0 +1,308 @@
+"""
+Synthetic resume / JD corpora for the benchmark suite, generated offline.
+
+Resumes are assembled from the skill vocabulary and job titles in the
+taxonomy (nlp/skills.py), role profiles taken from the sample JDs in
+data/jds, and real lines from the sample resumes in data/resumes, then
+written as PDF (reportlab) and DOCX (python-docx). JDs are written as TXT,
+the format the app takes them in. Everything is seeded, so the same
+arguments always give byte-identical text.
+
+A manifest.json next to the files lists every document with what was put
+into it (role, skills, years, degree), and lets an existing corpus be
+reused instead of regenerated.
+
+Usage:
+    python benchmarks/synthetic.py --out /tmp/corpus --resumes 1000 --jds 10
+    python benchmarks/synthetic.py --out /tmp/corpus --resumes 100 --formats docx
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+from typing import Dict, List, Sequence
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from nlp.extractor import SECTION_HEADERS                           # noqa: E402
+from nlp.skills import SKILLS, SKILL_SYNONYMS, extract_skills      # noqa: E402
+from nlp.taxonomy import get_taxonomy                               # noqa: E402
+from processing.parser import parse_resume, parse_text_file         # noqa: E402
+
+# Bump when the generated text changes, so cached corpora are rebuilt
+GENERATOR_VERSION = 1
+
+RESUME_FORMATS = ("pdf", "docx")
+
+FIRST_NAMES = [
+    "Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Meera", "Arjun", "Kavya",
+    "Daniel", "Sofia", "Liam", "Emma", "Noah", "Olivia", "Mateo", "Chloe",
+    "Kenji", "Yuki", "Omar", "Layla", "Lucas", "Maya", "Ethan", "Zara"
+]
+LAST_NAMES = [
+    "Sharma", "Iyer", "Patel", "Reddy", "Gupta", "Nair", "Singh", "Menon",
+    "Smith", "Garcia", "Chen", "Kim", "Nguyen", "Okafor", "Rossi", "Silva",
+    "Tanaka", "Haddad", "Novak", "Larsen", "Cohen", "Murphy", "Costa", "Ali"
+]
+COMPANIES = [
+    "Acme Labs", "Brightpath Systems", "Northwind Analytics", "Bluefin Cloud",
+    "Cedar Health", "Quantum Retail", "Helios Fintech", "Orbit Logistics",
+    "Lumen Media", "Atlas Robotics", "Granite Security", "Nimbus Travel"
+]
+UNIVERSITIES = [
+    "National Institute of Technology", "State University", "Institute of Engineering",
+    "City College", "University of Technology", "Regional Engineering College"
+]
+DEGREES = [
+    ("B.Tech in Computer Science", "btech"),
+    ("M.Tech in Software Engineering", "mtech"),
+    ("BSc in Computer Science", "bsc"),
+    ("MSc in Data Science", "msc")
+]
+BULLETS = [
+    "Built {a} services with {b}, cutting response times by {n}%.",
+    "Designed and maintained a {a} pipeline backed by {b}.",
+    "Migrated legacy modules to {a} and added {b} based monitoring.",
+    "Worked as {title} on a team of {n} shipping {a} features weekly.",
+    "Led code reviews for {a} and {b} repositories.",
+    "Automated deployments using {a}, reducing release effort by {n}%.",
+    "Wrote integration tests for {a} and {b} components.",
+    "Mentored {n} interns on {a} best practices."
+]
+PROJECT_BULLETS = [
+    "{name}: a {a} application using {b} and {c}.",
+    "{name}: open-source {a} toolkit with {b} bindings.",
+    "{name}: dashboard built with {a}, served by {b}."
+]
+PROJECT_NAMES = ["Pathfinder", "Ledger", "Beacon", "Mosaic", "Relay", "Harbor", "Sprout", "Vantage"]
+
+
+# -------------------------
+# Source material
+# -------------------------
+def load_roles() -> List[dict]:
+    """
+    One role per sample JD: its title line and the skills it asks for.
+    """
+    roles = []
+    for path in sorted(glob.glob(os.path.join(REPO_ROOT, "data", "jds", "*.txt"))):
+        text = parse_text_file(path)
+        parts = os.path.splitext(os.path.basename(path))[0].split("_")
+        title = parts[1] if len(parts) > 2 else "Software"
+        skills = sorted(extract_skills(text.lower())) or sorted(SKILLS)[:5]
+        roles.append({"name": title, "skills": skills, "text": text})
+    return roles
+
+
+def load_resume_lines() -> List[str]:
+    """
+    Non-header lines from the sample resumes, used as realistic filler.
+    """
+    headers = {h for names in SECTION_HEADERS.values() for h in names}
+    lines = []
+    for path in sorted(glob.glob(os.path.join(REPO_ROOT, "data", "resumes", "*.pdf"))):
+        for line in parse_resume(path).splitlines():
+            line = line.strip()
+            if len(line) > 25 and line.lower().strip(":") not in headers:
+                lines.append(line)
+    return lines
+
+
+def _surface(skill: str, rng: random.Random) -> str:
+    # Sometimes write a skill the way people do ("reactjs", "k8s")
+    variants = [s for s, canonical in SKILL_SYNONYMS.items() if canonical == skill]
+    return rng.choice(variants) if variants and rng.random() < 0.3 else skill
+
+
+# -------------------------
+# Documents (as a title plus (header, lines) sections)
+# -------------------------
+def make_resume(rng: random.Random, roles: List[dict], filler: Sequence[str]) -> dict:
+    role = rng.choice(roles)
+    vocabulary = sorted(SKILLS)
+    titles = get_taxonomy().job_titles
+
+    core = rng.sample(role["skills"], k=max(1, int(len(role["skills"]) * rng.uniform(0.4, 1.0))))
+    extra = rng.sample(vocabulary, k=rng.randint(1, 6))
+    skills = sorted(set(core) | set(extra))
+
+    years = rng.choice([0, 1, 2, 3, 4, 5, 6, 8, 10, 12])
+    degree, degree_key = rng.choice(DEGREES)
+    title = rng.choice(titles)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    long_form = rng.random() < 0.1
+
+    def _bullet(template):
+        a, b, c = (_surface(rng.choice(skills), rng) for _ in range(3))
+        return template.format(a=a, b=b, c=c, n=rng.randint(2, 60), title=title, name=rng.choice(PROJECT_NAMES))
+
+    experience = []
+    for _ in range(rng.randint(3, 6) if long_form else rng.randint(1, 3)):
+        start = rng.randint(2008, 2022)
+        experience.append(f"{rng.choice(titles).title()} - {rng.choice(COMPANIES)} ({start}-{start + rng.randint(1, 4)})")
+        experience.extend(_bullet(rng.choice(BULLETS)) for _ in range(rng.randint(2, 5)))
+        experience.extend(rng.sample(filler, k=min(len(filler), rng.randint(0, 3))))
+
+    summary = f"{title.title()} with {years}+ years of experience" if years else f"Aspiring {title}"
+    summary += f" working with {', '.join(_surface(s, rng) for s in core[:3])}."
+
+    return {
+        "title": name,
+        "sections": [
+            ("", [f"{name.lower().replace(' ', '.')}@example.com | +91 9{rng.randint(100000000, 999999999)}", summary]),
+            ("Skills", [", ".join(_surface(s, rng) for s in skills)]),
+            ("Experience", experience),
+            ("Projects", [_bullet(rng.choice(PROJECT_BULLETS)) for _ in range(rng.randint(1, 4 if long_form else 2))]),
+            ("Education", [f"{degree}, {rng.choice(UNIVERSITIES)}, {rng.randint(2005, 2024)}"])
+        ],
+        "truth": {"role": role["name"], "skills": skills, "experience_years": years, "degree": degree_key}
+    }
+
+
+def make_jd(rng: random.Random, roles: List[dict]) -> dict:
+    role = rng.choice(roles)
+    vocabulary = sorted(SKILLS)
+    skills = sorted(set(role["skills"]) | set(rng.sample(vocabulary, k=rng.randint(0, 3))))
+    years = rng.choice([0, 1, 2, 3, 5, 7])
+    title = rng.choice(get_taxonomy().job_titles).title()
+
+    return {
+        "title": f"JOB TITLE: {title}",
+        "sections": [
+            ("", [f"LOCATION: {rng.choice(['Remote', 'Bengaluru', 'Berlin', 'Austin'])}",
+                  f"EXPERIENCE: {years}+ years"]),
+            ("ABOUT THE ROLE", [f"Join {rng.choice(COMPANIES)} to build {role['name'].lower()} systems."]),
+            ("RESPONSIBILITIES", [f"- Work with {_surface(s, rng)}" for s in rng.sample(skills, k=min(3, len(skills)))]),
+            ("REQUIRED SKILLS", [f"- {', '.join(_surface(s, rng) for s in skills)}"])
+        ],
+        "truth": {"role": role["name"], "skills": skills, "experience_years": years}
+    }
+
+
+def to_text(document: dict) -> str:
+    lines = [document["title"]]
+    for header, body in document["sections"]:
+        lines.append("")
+        if header:
+            lines.append(header.upper())
+        lines.extend(body)
+    return "\n".join(lines) + "\n"
+
+
+# -------------------------
+# Writers
+# -------------------------
+def write_txt(document: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(to_text(document))
+
+
+def write_pdf(document: dict, path: str) -> None:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    from textwrap import wrap
+
+    pdf = canvas.Canvas(path, pagesize=A4)
+    width, height = A4
+    y = height - 60
+
+    for line in to_text(document).splitlines():
+        for chunk in wrap(line, 95) or [""]:
+            if y < 60:
+                pdf.showPage()
+                y = height - 60
+            pdf.setFont("Helvetica", 10)
+            pdf.drawString(50, y, chunk)
+            y -= 14
+
+    pdf.save()
+
+
+def write_docx(document: dict, path: str) -> None:
+    import docx
+
+    doc = docx.Document()
+    doc.add_heading(document["title"], level=1)
+    for header, body in document["sections"]:
+        if header:
+            doc.add_heading(header.upper(), level=2)
+        for line in body:
+            doc.add_paragraph(line)
+    doc.save(path)
+
+
+WRITERS = {"pdf": write_pdf, "docx": write_docx, "txt": write_txt}
+
+
+# -------------------------
+# Corpus
+# -------------------------
+def generate_corpus(
+    out_dir: str,
+    n_resumes: int,
+    n_jds: int = 5,
+    formats: Sequence[str] = RESUME_FORMATS,
+    seed: int = 0
+) -> Dict:
+    """
+    Writes `n_resumes` resumes (cycling through `formats`) and `n_jds` TXT
+    JDs into `out_dir` and returns the manifest. An existing corpus built
+    with the same arguments is reused as is.
+    """
+    formats = list(formats)
+    settings = {
+        "generator_version": GENERATOR_VERSION,
+        "n_resumes": n_resumes,
+        "n_jds": n_jds,
+        "formats": formats,
+        "seed": seed
+    }
+
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("settings") == settings:
+            return manifest
+
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    roles = load_roles()
+    filler = load_resume_lines()
+
+    resumes = []
+    for i in range(n_resumes):
+        fmt = formats[i % len(formats)]
+        document = make_resume(rng, roles, filler)
+        file_name = f"resume_{i:05d}.{fmt}"
+        WRITERS[fmt](document, os.path.join(out_dir, file_name))
+        resumes.append({"file": file_name, "format": fmt, **document["truth"]})
+
+    jds = []
+    for i in range(n_jds):
+        document = make_jd(rng, roles)
+        file_name = f"jd_{i:03d}.txt"
+        write_txt(document, os.path.join(out_dir, file_name))
+        jds.append({"file": file_name, **document["truth"]})
+
+    manifest = {"settings": settings, "resumes": resumes, "jds": jds}
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--resumes", type=int, default=10)
+    parser.add_argument("--jds", type=int, default=5)
+    parser.add_argument("--formats", nargs="+", choices=RESUME_FORMATS, default=list(RESUME_FORMATS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    manifest = generate_corpus(args.out, args.resumes, args.jds, args.formats, args.seed)
+    print(f"{len(manifest['resumes'])} resumes, {len(manifest['jds'])} JDs in {args.out}")
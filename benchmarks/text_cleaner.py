@@ -0,0 +1,88 @@
+"""
+Text-cleaner benchmark: the old three-regex cleaner vs. the one-pass
+translate cleaner (with and without the clean-to-raw offset map).
+
+The corpus is 1,000 long resumes built from the sample resumes in
+data/resumes: lines shuffled and repeated to --chars characters, with
+bullets, tabs and non-ASCII punctuation mixed in like real PDF text.
+
+Usage:
+    python benchmarks/text_cleaner.py
+    python benchmarks/text_cleaner.py --docs 1000 --chars 20000
+"""
+import argparse
+import glob
+import os
+import random
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from processing.cleaner import clean_text, clean_text_with_offsets     # noqa: E402
+from processing.parser import parse_resume                             # noqa: E402
+
+NOISE = ["•", "–", "\t", "  ", "\n\n", "’", "é", "|", "→", "(", ")", ":"]
+
+
+def regex_clean_text(text: str) -> str:
+    """
+    The previous implementation, kept as the reference.
+    """
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9\s\.\,\-\+]", " ", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+def build_corpus(n_docs: int, n_chars: int, seed: int = 0):
+    rng = random.Random(seed)
+    paths = sorted(glob.glob(os.path.join(REPO_ROOT, "data", "resumes", "*.pdf")))
+    lines = [line for p in paths for line in parse_resume(p).splitlines() if line.strip()]
+
+    corpus = []
+    for _ in range(n_docs):
+        parts, size = [], 0
+        while size < n_chars:
+            line = rng.choice(lines)
+            if rng.random() < 0.3:
+                line = rng.choice(NOISE) + " " + line
+            parts.append(line)
+            size += len(line) + 1
+        corpus.append("\n".join(parts))
+    return corpus
+
+
+def timeit(fn, corpus):
+    start = time.perf_counter()
+    for text in corpus:
+        fn(text)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--chars", type=int, default=20000)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.docs, args.chars)
+    total_mb = sum(len(t) for t in corpus) / 1e6
+
+    mismatches = sum(regex_clean_text(t) != clean_text(t) for t in corpus)
+    print(f"{args.docs} docs, {total_mb:.1f} M chars; outputs differing from the regex cleaner: {mismatches}\n")
+
+    baseline = timeit(regex_clean_text, corpus)
+    print(f"{'cleaner':<26}{'total s':>10}{'ms/doc':>10}{'MB/s':>10}{'speedup':>10}")
+    for name, fn in [
+        ("regex (3 passes)", regex_clean_text),
+        ("translate (1 pass)", clean_text),
+        ("translate + offsets", clean_text_with_offsets)
+    ]:
+        seconds = baseline if fn is regex_clean_text else timeit(fn, corpus)
+        print(f"{name:<26}{seconds:>10.2f}{seconds / args.docs * 1000:>10.2f}"
+              f"{total_mb / seconds:>10.1f}{baseline / seconds:>10.2f}")
@@ -1,78 +1,101 @@
-import csv
+"""
+Evaluates the screener against the human scores in evaluation/labels.csv.
+
+Per-pair signals are computed once (in parallel) and cached, see
+evaluation/engine.py; the default weights are then scored, and with
+--search a grid or random sweep of weight vectors is ranked by Spearman
+correlation with bootstrap confidence intervals.
+
+Usage:
+    python -m evaluation.auto_eval
+    python -m evaluation.auto_eval --search grid --step 0.05 --top 10
+    python -m evaluation.auto_eval --search random --samples 5000 --json sweep.json
+"""
+import argparse
+import json
+import time
+
+import numpy as np
 from scipy.stats import spearmanr
 
-from processing.parser import parse_resume, parse_text_file, extract_required_experience
-from processing.cleaner import clean_text
-from nlp.extractor import split_into_sections, build_profile
-from scoring.similarity import compute_similarity, compute_semantic_similarity
-from scoring.engine import calculate_match_score
-from scoring.final_score import compute_final_score
-
-
-def run_model(resume_path, jd_path):
-    # Resume pipeline
-    raw_resume = parse_resume(resume_path)
-    clean_resume = clean_text(raw_resume)
-    sections = split_into_sections(clean_resume)
-    profile = build_profile(sections)
-
-    # JD pipeline
-    jd_raw = parse_text_file(jd_path)
-    clean_jd = clean_text(jd_raw)
-
-    # Similarities
-    tfidf_score = compute_similarity(clean_resume, clean_jd)
-    semantic_score = compute_semantic_similarity(clean_resume, clean_jd)
-
-    # Skill matching
-    skill_result = calculate_match_score(profile, clean_jd)
-
-    # Final weighted score
-    required_exp = extract_required_experience(clean_jd)
-    has_degree = "btech" in profile.get("education", [])
-
-    final_score = compute_final_score(
-        skill_match_percent=skill_result["skill_match_percent"],
-        semantic_similarity=semantic_score,
-        experience_years=profile["experience_years"],
-        required_experience=required_exp,
-        has_required_degree=has_degree,
-        keyword_similarity=tfidf_score
+from evaluation.engine import (
+    SignalCache,
+    compute_signals,
+    final_scores,
+    load_labels,
+    random_weights,
+    search,
+    weight_grid
+)
+from scoring.final_score import DEFAULT_WEIGHTS, SIGNALS
+
+
+def _print_rows(rows, confidence):
+    print(f"{'  '.join(f'{name:>10}' for name in SIGNALS)}{'spearman':>10}{f'{confidence:.0%} CI':>18}")
+    for row in rows:
+        weights = "  ".join(f"{row['weights'][name]:>10.2f}" for name in SIGNALS)
+        interval = f"[{row['ci_low']:.2f}, {row['ci_high']:.2f}]"
+        print(f"{weights}{row['spearman']:>10.3f}{interval:>18}")
+
+
+def main(args) -> None:
+    labels = load_labels(args.labels)
+    human = np.array([row["human_score"] for row in labels])
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else SignalCache()
+    signals = compute_signals(
+        [(row["resume_path"], row["jd_path"]) for row in labels],
+        workers=args.workers,
+        cache=cache
     )
-
-    return float(final_score["final_match_percent"])
-
-
-# -------------------------
-# Evaluation Runner
-# -------------------------
-human_scores = []
-model_scores = []
-
-with open("evaluation/labels.csv", newline="") as f:
-    reader = csv.DictReader(f)
-
-    for row in reader:
-        resume_path = f"data/resumes/{row['resume_file']}"
-        jd_path = f"data/jds/{row['jd_file']}"
-
-        human_scores.append(int(row["human_score"]))
-
-        try:
-            model_score = run_model(resume_path, jd_path)
-        except Exception as e:
-            print("Error processing:", resume_path, jd_path, e)
-            continue
-
-        model_scores.append(model_score)
-
-# -------------------------
-# Spearman Correlation
-# -------------------------
-corr, p_value = spearmanr(human_scores, model_scores)
-
-print("\n===== EVALUATION RESULTS =====")
-print("Human scores :", human_scores)
-print("Model scores :", [round(x, 2) for x in model_scores])
-print("Spearman correlation:", round(corr, 2))
-print("P-value:", round(p_value, 4))
+    signal_seconds = time.perf_counter() - start
+
+    for row, error in zip(labels, signals["error"]):
+        if error:
+            print("Error processing:", row["resume_path"], row["jd_path"], error)
+
+    valid = np.array([e is None for e in signals["error"]])
+    model_scores = final_scores(signals, DEFAULT_WEIGHTS)[0][valid]
+    corr, p_value = spearmanr(human[valid], model_scores)
+
+    start = time.perf_counter()
+    default = search(signals, human, DEFAULT_WEIGHTS, n_boot=args.bootstrap, confidence=args.confidence, seed=args.seed)[0]
+
+    print("\n===== EVALUATION RESULTS =====")
+    print("Human scores :", [int(x) if float(x).is_integer() else x for x in human[valid]])
+    print("Model scores :", [round(float(x), 2) for x in model_scores])
+    print("Spearman correlation:", round(corr, 2))
+    print("P-value:", round(p_value, 4))
+    print(f"{args.confidence:.0%} bootstrap CI: [{default['ci_low']:.2f}, {default['ci_high']:.2f}]")
+
+    rows = []
+    if args.search != "none":
+        weights = weight_grid(args.step) if args.search == "grid" else random_weights(args.samples, args.seed)
+        rows = search(signals, human, weights, n_boot=args.bootstrap, confidence=args.confidence, seed=args.seed)
+
+        print(f"\n===== WEIGHT SEARCH ({args.search}, {len(rows)} weight vectors) =====")
+        _print_rows(rows[:args.top], args.confidence)
+
+    search_seconds = time.perf_counter() - start
+    print(f"\nsignals: {signal_seconds:.2f}s ({len(labels)} pairs), scoring + bootstrap: {search_seconds:.2f}s")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"default": default, "search": rows}, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--labels", default="evaluation/labels.csv")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="recompute every signal")
+    parser.add_argument("--search", choices=["none", "grid", "random"], default="none")
+    parser.add_argument("--step", type=float, default=0.1, help="grid step")
+    parser.add_argument("--samples", type=int, default=2000, help="random weight vectors")
+    parser.add_argument("--bootstrap", type=int, default=1000, help="bootstrap resamples")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--top", type=int, default=15, help="weight vectors to print")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write results to this JSON file")
+    main(parser.parse_args())
@@ -0,0 +1,385 @@
+"""
+Evaluation engine: per-pair signals computed once, weights searched cheaply.
+
+compute_signals() runs parsing / NLP for every distinct resume in a process
+pool (pipeline.screening.process_resumes), encodes all texts in one batch,
+and caches the raw per-pair inputs of compute_final_score on disk, keyed by
+file contents and pipeline version. Re-running, or trying other weights,
+then never touches the pipeline again.
+
+search() scores every weight vector against every pair in one
+compute_final_scores_batch call and reports Spearman correlation with the
+human labels, with a bootstrap confidence interval, for each vector.
+"""
+import csv
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from processing.parser import parse_text_file
+from pipeline.screening import process_resumes
+from scoring.engine import calculate_match_score
+from scoring.final_score import SIGNALS, compute_final_scores_batch, weight_matrix
+from scoring.job_profile import JobProfile
+from scoring.similarity import (
+    SEMANTIC_MODEL_NAME,
+    compute_semantic_similarity_batch,
+    compute_similarity_batch,
+    encode_texts
+)
+from storage.profile_store import content_hash, pipeline_version
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.environ.get("RESUME_SCREENER_CACHE_DIR", ".cache"),
+    "eval_signals.json"
+)
+
+# Bump when the cached signal fields change
+SIGNALS_VERSION = 1
+
+# Inputs of compute_final_scores_batch, in its argument order, plus semantic
+# similarity (reported, not weighted)
+SIGNAL_FIELDS = (
+    "skill_match_percent",
+    "experience_years",
+    "required_experience",
+    "has_required_degree",
+    "keyword_similarity",
+    "semantic_similarity"
+)
+
+
+# -------------------------
+# Labels
+# -------------------------
+def load_labels(path: str = "evaluation/labels.csv", resume_dir: str = "data/resumes", jd_dir: str = "data/jds") -> List[dict]:
+    """
+    Rows of labels.csv as {"resume_path", "jd_path", "human_score"}.
+    """
+    with open(path, newline="") as f:
+        return [
+            {
+                "resume_path": os.path.join(resume_dir, row["resume_file"]),
+                "jd_path": os.path.join(jd_dir, row["jd_file"]),
+                "human_score": float(row["human_score"])
+            }
+            for row in csv.DictReader(f)
+        ]
+
+
+# -------------------------
+# Signal cache
+# -------------------------
+class SignalCache:
+    """
+    Per-pair signals in one JSON file, keyed by resume + JD content hashes
+    and everything the signals depend on (pipeline version, SBERT model).
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.records: Dict[str, dict] = json.load(f)
+        except (OSError, ValueError):
+            self.records = {}
+
+    @staticmethod
+    def key(resume_hash: str, jd_hash: str) -> str:
+        return f"{resume_hash}-{jd_hash}-{pipeline_version()}-{SEMANTIC_MODEL_NAME}-s{SIGNALS_VERSION}"
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.records.get(key)
+
+    def put_many(self, records: Dict[str, dict]) -> None:
+        with self._lock:
+            self.records.update(records)
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # Write-then-rename so an interrupted run never leaves partial JSON
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.records, f)
+            os.replace(tmp_path, self.path)
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# -------------------------
+# Signals
+# -------------------------
+def compute_signals(
+    pairs: Iterable[Tuple[str, str]],
+    workers: Optional[int] = None,
+    cache: Optional[SignalCache] = None
+) -> dict:
+    """
+    Signals for (resume_path, jd_path) pairs, as arrays in pair order:
+    one per SIGNAL_FIELDS entry, plus "error" (None or a message per pair;
+    failed pairs have NaN signals).
+
+    Only pairs missing from `cache` are computed: each distinct resume is
+    processed once (in a pool of `workers` processes), each distinct JD is
+    profiled once, and all resume texts are encoded in one batch. Keyword
+    similarity is fitted per pair (JD + resume), so a pair's signals don't
+    depend on which other pairs are evaluated with it.
+    """
+    pairs = list(pairs)
+    signals = {name: np.full(len(pairs), np.nan) for name in SIGNAL_FIELDS}
+    errors: List[Optional[str]] = [None] * len(pairs)
+
+    # Unreadable files fail only the pairs they appear in
+    hashes, read_errors = {}, {}
+    for path in dict.fromkeys(path for pair in pairs for path in pair):
+        try:
+            hashes[path] = content_hash(_read_bytes(path))
+        except OSError as e:
+            read_errors[path] = str(e)
+
+    keys: List[Optional[str]] = [None] * len(pairs)
+    todo = []
+    for i, (resume, jd) in enumerate(pairs):
+        unreadable = [path for path in (resume, jd) if path in read_errors]
+        if unreadable:
+            errors[i] = read_errors[unreadable[0]]
+            continue
+
+        keys[i] = key = SignalCache.key(hashes[resume], hashes[jd])
+        record = cache.get(key) if cache is not None else None
+        if record is None:
+            todo.append(i)
+        else:
+            for name in SIGNAL_FIELDS:
+                signals[name][i] = record[name]
+
+    if todo:
+        fresh = _compute_pairs([pairs[i] for i in todo], workers)
+        new_records = {}
+        for i, (record, error) in zip(todo, fresh):
+            if error:
+                errors[i] = error
+                continue
+            for name in SIGNAL_FIELDS:
+                signals[name][i] = record[name]
+            new_records[keys[i]] = record
+
+        if cache is not None and new_records:
+            cache.put_many(new_records)
+
+    signals["error"] = errors
+    return signals
+
+
+def _compute_pairs(pairs: List[Tuple[str, str]], workers: Optional[int]) -> List[Tuple[Optional[dict], Optional[str]]]:
+    resume_paths = list(dict.fromkeys(resume for resume, _ in pairs))
+    jd_paths = list(dict.fromkeys(jd for _, jd in pairs))
+
+    processed = dict(zip(resume_paths, process_resumes(resume_paths, workers)))
+
+    jobs, jd_errors = {}, {}
+    for path in jd_paths:
+        try:
+            jobs[path] = JobProfile.build(parse_text_file(path))
+        except Exception as e:
+            jd_errors[path] = str(e)
+
+    ok = [path for path in resume_paths if processed[path]["error"] is None]
+    embeddings = dict(zip(ok, encode_texts([processed[path]["clean_text"] for path in ok]))) if ok else {}
+
+    outcomes = []
+    for resume_path, jd_path in pairs:
+        item, job = processed[resume_path], jobs.get(jd_path)
+        if item["error"] is not None:
+            outcomes.append((None, item["error"]))
+            continue
+        if job is None:
+            outcomes.append((None, jd_errors[jd_path]))
+            continue
+
+        profile, clean_resume = item["profile"], item["clean_text"]
+        outcomes.append(({
+            "skill_match_percent": calculate_match_score(profile, job)["skill_match_percent"],
+            "experience_years": profile["experience_years"],
+            "required_experience": job.required_experience,
+            "has_required_degree": bool(job.has_required_degree(profile)),
+            "keyword_similarity": compute_similarity_batch(job, [clean_resume])[0],
+            "semantic_similarity": compute_semantic_similarity_batch(
+                job, [clean_resume], resume_embeddings=embeddings[resume_path][None, :]
+            )[0]
+        }, None))
+
+    return outcomes
+
+
+def final_scores(signals: dict, weights=None) -> np.ndarray:
+    """
+    (n_weights x n_pairs) final scores, rounded like compute_final_score.
+    """
+    return np.round(compute_final_scores_batch(
+        *(signals[name] for name in SIGNAL_FIELDS[:5]),
+        weights=weights
+    ), 2)
+
+
+# -------------------------
+# Spearman (vectorized)
+# -------------------------
+def _ranks(values: np.ndarray) -> np.ndarray:
+    from scipy.stats import rankdata
+    return rankdata(values, axis=-1)
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    # Along the last axis; NaN where either side is constant
+    x = x - x.mean(axis=-1, keepdims=True)
+    y = y - y.mean(axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (x * y).sum(axis=-1) / np.sqrt((x * x).sum(axis=-1) * (y * y).sum(axis=-1))
+
+
+def spearman_rows(scores: np.ndarray, human: np.ndarray) -> np.ndarray:
+    """
+    Spearman correlation of every row of `scores` with `human`
+    (same as scipy.stats.spearmanr, ties averaged).
+    """
+    return _pearson(_ranks(np.atleast_2d(scores)), _ranks(human))
+
+
+def _resample_ranks(values: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rank (ties averaged) of every original item inside each bootstrap
+    resample, given how often each item was drawn (`counts`, n x n_boot).
+    One sort of `values` instead of one per resample.
+
+    Returns (order, ranks, sorted_counts), the last two with rows in
+    `order` (sorted by value).
+    """
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    sorted_counts = counts[order]
+
+    # The copies of an item (or of a tied group) fill the resample
+    # positions just after everything smaller: their mean rank is
+    # cumulative count - (count - 1) / 2
+    new_group = np.r_[True, sorted_values[1:] != sorted_values[:-1]]
+    if new_group.all():
+        ranks = np.cumsum(sorted_counts, axis=0) - (sorted_counts - 1) / 2
+    else:
+        first = np.flatnonzero(new_group)
+        group_counts = np.add.reduceat(sorted_counts, first, axis=0)
+        group_ranks = np.cumsum(group_counts, axis=0) - (group_counts - 1) / 2
+        ranks = np.repeat(group_ranks, np.diff(np.r_[first, len(values)]), axis=0)
+
+    return order, ranks, sorted_counts
+
+
+def bootstrap_ci(
+    scores: np.ndarray,
+    human: np.ndarray,
+    n_boot: int = 1000,
+    confidence: float = 0.95,
+    seed: int = 0
+) -> np.ndarray:
+    """
+    Percentile bootstrap interval of spearman_rows, as (n_rows x 2).
+    Every row is evaluated on the same resamples of the pairs.
+
+    A resample is kept as per-pair draw counts c: its Spearman correlation
+    is the c-weighted Pearson correlation of the pairs' ranks within it,
+    whose mean is always (n + 1) / 2. So each row costs one sort and a few
+    passes over (n x n_boot), and rows ranking the pairs identically share
+    one computation.
+    """
+    scores = np.atleast_2d(scores)
+    n = scores.shape[1]
+    rng = np.random.default_rng(seed)
+    samples = rng.integers(0, n, size=(n_boot, n))
+    counts = np.bincount((samples + np.arange(n_boot)[:, None] * n).ravel(), minlength=n_boot * n)
+    counts = counts.reshape(n_boot, n).T.astype(np.float64)
+
+    offset = n * ((n + 1) / 2) ** 2
+    human_order, sorted_human_ranks, sorted_counts = _resample_ranks(np.asarray(human, dtype=np.float64), counts)
+    weighted_human = np.empty_like(sorted_human_ranks)
+    weighted_human[human_order] = sorted_counts * sorted_human_ranks
+    human_variance = np.einsum("ib,ib->b", weighted_human[human_order], sorted_human_ranks) - offset
+
+    unique_ranks, inverse = np.unique(_ranks(scores), axis=0, return_inverse=True)
+    tail = (1 - confidence) / 2 * 100
+
+    intervals = np.empty((len(unique_ranks), 2))
+    for i, ranks in enumerate(unique_ranks):
+        order, x, sorted_counts = _resample_ranks(ranks, counts)
+        covariance = np.einsum("ib,ib->b", x, weighted_human[order]) - offset
+        variance = np.einsum("ib,ib,ib->b", x, sorted_counts, x) - offset
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlations = covariance / np.sqrt(variance * human_variance)
+            intervals[i] = np.nanpercentile(correlations, [tail, 100 - tail])
+
+    return intervals[inverse.ravel()]
+
+
+# -------------------------
+# Weight search
+# -------------------------
+def weight_grid(step: float = 0.1) -> np.ndarray:
+    """
+    Every weight vector over SIGNALS with entries on a `step` grid summing to 1.
+    """
+    units = int(round(1 / step))
+    grid = np.array([
+        combo for combo in np.ndindex(*(units + 1,) * (len(SIGNALS) - 1))
+        if sum(combo) <= units
+    ])
+    return np.column_stack([grid, units - grid.sum(axis=1)]) / units
+
+
+def random_weights(n: int, seed: int = 0) -> np.ndarray:
+    """
+    `n` weight vectors drawn uniformly from the simplex.
+    """
+    return np.random.default_rng(seed).dirichlet(np.ones(len(SIGNALS)), size=n)
+
+
+def search(
+    signals: dict,
+    human: np.ndarray,
+    weights=None,
+    n_boot: int = 1000,
+    confidence: float = 0.95,
+    seed: int = 0
+) -> List[dict]:
+    """
+    Spearman correlation (with bootstrap CI) of every weight vector in
+    `weights` (anything weight_matrix() accepts; default: the 0.1 grid),
+    best first. Pairs that failed to process are left out.
+    """
+    w = weight_grid() if weights is None else weight_matrix(weights)
+
+    valid = np.array([e is None for e in signals["error"]])
+    kept = {name: signals[name][valid] for name in SIGNAL_FIELDS[:5]}
+    human = np.asarray(human, dtype=np.float64)[valid]
+
+    scores = final_scores(kept, w)
+    correlations = spearman_rows(scores, human)
+    intervals = bootstrap_ci(scores, human, n_boot=n_boot, confidence=confidence, seed=seed)
+
+    rows = [
+        {
+            "weights": {name: round(float(value), 4) for name, value in zip(SIGNALS, row)},
+            "spearman": float(rho),
+            "ci_low": float(low),
+            "ci_high": float(high)
+        }
+        for row, rho, (low, high) in zip(w, correlations, intervals)
+    ]
+    return sorted(rows, key=lambda r: -np.nan_to_num(r["spearman"], nan=-2))
+
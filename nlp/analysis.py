@@ -0,0 +1,81 @@
+from typing import Iterable, List
+
+from utils.model_registry import get_model, register_model
+from utils.profiler import profiled
+
+
+# -------------------------
+# spaCy model (loaded lazily, only if available)
+# -------------------------
+def _load_spacy():
+    """
+    Returns the spaCy pipeline, or None if spaCy / the model is unavailable.
+    """
+    try:
+        import spacy
+        return spacy.load("en_core_web_sm")
+    except Exception:
+        return None
+
+
+register_model("spacy", _load_spacy)
+
+
+# -------------------------
+# Shared per-document analysis
+# -------------------------
+class DocumentAnalysis:
+    """
+    One document, lowercased and tokenized once, shared by every extractor.
+
+    Skill matching uses a PhraseMatcher on the LOWER attribute, which only
+    needs tokens, so the tagger / parser / NER components are never run.
+    Extracted skills are cached here, so a JD analyzed once can be matched
+    against any number of resumes.
+    """
+
+    def __init__(self, lowered_text: str, doc=None):
+        self.text = lowered_text
+        self.doc = doc
+
+        self._skills = None
+        self._skills_taxonomy = None   # taxonomy version the cached skills came from
+
+    def cached_skills(self, taxonomy_hash: str):
+        if self._skills_taxonomy == taxonomy_hash:
+            return self._skills
+        return None
+
+    def cache_skills(self, taxonomy_hash: str, skills: list) -> None:
+        self._skills = skills
+        self._skills_taxonomy = taxonomy_hash
+
+
+@profiled("nlp.spacy")
+def analyze_document(text: str) -> DocumentAnalysis:
+    nlp = get_model("spacy")
+    lowered = text.lower()
+
+    doc = nlp.make_doc(lowered) if nlp is not None else None
+    return DocumentAnalysis(lowered, doc)
+
+
+@profiled("nlp.spacy_batch")
+def analyze_documents(texts: Iterable[str], batch_size: int = 64) -> List[DocumentAnalysis]:
+    """
+    Batch version of analyze_document (tokenizes with nlp.tokenizer.pipe).
+    """
+    lowered = [t.lower() for t in texts]
+    nlp = get_model("spacy")
+
+    if nlp is None:
+        return [DocumentAnalysis(t) for t in lowered]
+
+    docs = nlp.tokenizer.pipe(lowered, batch_size=batch_size)
+    return [DocumentAnalysis(t, doc) for t, doc in zip(lowered, docs)]
+
+
+def as_analysis(text_or_analysis) -> DocumentAnalysis:
+    if isinstance(text_or_analysis, DocumentAnalysis):
+        return text_or_analysis
+    return analyze_document(text_or_analysis)
@@ -1,38 +1,35 @@
 from typing import List
 
-# Context keywords for each ambiguous skill
-DISAMBIGUATION_RULES = {
-    "spring": {
-        "tech": ["java", "boot", "mvc", "hibernate", "microservice"],
-        "non_tech": ["season", "weather", "flowers"]
-    },
-    "react": {
-        "tech": ["javascript", "node", "frontend", "library", "framework"],
-        "non_tech": ["feel", "emotion", "respond"]
-    },
-    "docker": {
-        "tech": ["container", "kubernetes", "devops", "deployment"],
-        "non_tech": ["ship", "harbor", "dock"]
-    }
-}
+from nlp.taxonomy import get_taxonomy
+from utils.profiler import profiled
 
 
+# Context keywords for each ambiguous skill live in the taxonomy file
+# ("disambiguation" section); DISAMBIGUATION_RULES reads the live copy.
+def __getattr__(name):
+    if name == "DISAMBIGUATION_RULES":
+        return get_taxonomy().disambiguation
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@profiled("nlp.disambiguation")
 def disambiguate_skills(skills: List[str], text: str) -> List[str]:
     """
     Keeps only technically valid skills using context.
     """
     text_lower = text.lower()
+    rules_by_skill = get_taxonomy().disambiguation
     final_skills = []
 
     for skill in skills:
         s = skill.lower()
 
-        if s not in DISAMBIGUATION_RULES:
+        if s not in rules_by_skill:
             # not ambiguous → keep
             final_skills.append(skill)
             continue
 
-        rules = DISAMBIGUATION_RULES[s]
+        rules = rules_by_skill[s]
 
         # if any tech-context word appears → accept
         if any(word in text_lower for word in rules["tech"]):
@@ -1,4 +1,8 @@
-from typing import Dict
+import re
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Tuple
+
+from nlp.analysis import analyze_document, analyze_documents
 from nlp.skills import (
     extract_skills,
     extract_experience_years,
@@ -6,71 +10,158 @@ from nlp.skills import (
     extract_job_titles
 )
 from nlp.disambiguation import disambiguate_skills
+from utils.profiler import profiled
+
+
+# -------------------------
+# Section headers
+# -------------------------
+# Section name -> header words / phrases, matched as whole words
+# (case-insensitive). Add sections with register_section().
+SECTION_HEADERS: Dict[str, List[str]] = {
+    "skills": ["skills", "skill"],
+    "experience": ["experience"],
+    "education": ["education"],
+    "projects": ["projects", "project"]
+}
+
+_HEADER_PUNCTUATION = ".:;,-"
 
+_header_pattern = None
+_header_lookup: Dict[str, str] = {}
 
-def split_into_sections(text: str) -> Dict[str, str]:
+
+def register_section(name: str, headers: List[str]) -> None:
+    """
+    Adds a section (or more headers for an existing one).
     """
-    Splits cleaned resume text into basic sections
-    based on simple keyword anchors.
+    global _header_pattern
+    known = SECTION_HEADERS.setdefault(name, [])
+    known.extend(h.lower() for h in headers if h.lower() not in known)
+    _header_pattern = None
+
+
+def _compiled_headers():
+    global _header_pattern, _header_lookup
+    if _header_pattern is None:
+        _header_lookup = {
+            header: name for name, headers in SECTION_HEADERS.items() for header in headers
+        }
+        # Longest first, so "work experience" wins over "experience"
+        alternatives = [
+            r"\s+".join(re.escape(word) for word in header.split())
+            for header in sorted(_header_lookup, key=len, reverse=True)
+        ]
+        _header_pattern = re.compile(r"\b(?:" + "|".join(alternatives) + r")\b", re.IGNORECASE)
+    return _header_pattern
+
+
+class SectionSpans(Mapping):
     """
+    Sections of one text as (start, end) offsets into it; nothing is copied
+    until a section's text is asked for.
 
-    sections = {
-        "skills": "",
-        "experience": "",
-        "education": "",
-        "projects": ""
-    }
+    Behaves like the old {section: text} dict: every registered section is
+    a key, sections[name] is its text (repeated headers joined with a
+    space) and values() works as before.
+    """
 
-    current_section = None
+    def __init__(self, text: str, spans: List[Tuple[str, int, int]]):
+        self.text = text
+        self.spans = spans   # (section, start, end) in document order
 
-    # We already cleaned text, so splitting by space is fine for now
-    words = text.split(" ")
+        self._names = list(SECTION_HEADERS)
+        for name, _, _ in spans:
+            if name not in self._names:
+                self._names.append(name)
 
-    for word in words:
-        w = word.lower()
+    def __getitem__(self, name: str) -> str:
+        if name not in self._names:
+            raise KeyError(name)
+        return " ".join(self.text[start:end] for section, start, end in self.spans if section == name)
 
-        # --- Detect section switches ---
-        if "skill" in w:
-            current_section = "skills"
-            continue
-        elif "experience" in w:
-            current_section = "experience"
-            continue
-        elif "education" in w:
-            current_section = "education"
-            continue
-        elif "project" in w:
-            current_section = "projects"
-            continue
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
 
-        # --- Collect words under current section ---
-        if current_section:
-            sections[current_section] += word + " "
+    def __len__(self) -> int:
+        return len(self._names)
 
-    return sections
+    def spans_for(self, name: str) -> List[Tuple[int, int]]:
+        return [(start, end) for section, start, end in self.spans if section == name]
 
+    def joined(self) -> str:
+        """
+        Text of all sections in document order (headers and any text before
+        the first header left out).
+        """
+        return " ".join(self.text[start:end] for _, start, end in self.spans)
 
-def build_profile(sections: Dict[str, str]) -> Dict:
+
+@profiled("nlp.sections")
+def split_into_sections(text: str) -> SectionSpans:
+    """
+    Splits cleaned resume text into sections at header words
+    (SECTION_HEADERS), in one regex pass.
+    """
+    pattern = _compiled_headers()
+    spans = []
+
+    current_section, section_start = None, 0
+    for match in pattern.finditer(text):
+        if current_section is not None:
+            spans.append((current_section, section_start, match.start()))
+        current_section = _header_lookup[" ".join(match.group().lower().split())]
+        section_start = match.end()
+
+    if current_section is not None:
+        spans.append((current_section, section_start, len(text)))
+
+    # Trim header punctuation ("skills:", "projects.") and whitespace around
+    # each span; a "." after a space is kept (".net")
+    trimmed = []
+    for section, start, end in spans:
+        while start < end and text[start] in _HEADER_PUNCTUATION:
+            start += 1
+        while start < end and (text[start].isspace() or text[start] in _HEADER_PUNCTUATION[1:]):
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            trimmed.append((section, start, end))
+
+    return SectionSpans(text, trimmed)
+
+
+def _section_text(sections: Mapping) -> str:
+    if isinstance(sections, SectionSpans):
+        return sections.joined()
+    return " ".join(sections.values())
+
+
+@profiled("nlp.profile")
+def build_profile(sections: Mapping, analysis=None) -> Dict:
     """
     Builds a structured candidate profile
     from extracted sections.
     """
 
-    # Combine all text for global extraction
-    combined_text = " ".join(sections.values()).lower()
+    # Combine all text for global extraction, analyzed (lowercased +
+    # tokenized) once and shared by every extractor below
+    if analysis is None:
+        analysis = analyze_document(_section_text(sections))
 
     # -------------------------
     # Raw extraction
     # -------------------------
-    raw_skills = extract_skills(combined_text)
-    exp_years = extract_experience_years(combined_text)
-    degrees = extract_degrees(combined_text)
-    titles = extract_job_titles(combined_text)
+    raw_skills = extract_skills(analysis)
+    exp_years = extract_experience_years(analysis)
+    degrees = extract_degrees(analysis)
+    titles = extract_job_titles(analysis)
 
     # -------------------------
     # Named Entity Disambiguation
     # -------------------------
-    skills = disambiguate_skills(raw_skills, combined_text)
+    skills = disambiguate_skills(raw_skills, analysis.text)
 
     profile = {
         "skills": skills,
@@ -80,3 +171,13 @@ def build_profile(sections: Dict[str, str]) -> Dict:
     }
 
     return profile
+
+
+@profiled("nlp.profile_batch")
+def build_profiles(sections_list: List[Mapping]) -> List[Dict]:
+    """
+    Batch version of build_profile: tokenizes all documents in one
+    nlp.tokenizer.pipe pass.
+    """
+    analyses = analyze_documents(_section_text(s) for s in sections_list)
+    return [build_profile(s, a) for s, a in zip(sections_list, analyses)]
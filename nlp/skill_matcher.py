@@ -0,0 +1,134 @@
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Tokens are runs of letters/digits/+/# ("c++", "c#"); dots split tokens, so
+# "node.js" is "node" "js". Skills and text are tokenized the same way, so
+# matches always sit on word boundaries: "c" never matches inside "cloud",
+# "java" never inside "javascript". A synonym must also cover whole dotted
+# compounds: "js" in "node.js" is not "javascript".
+TOKEN_RE = re.compile(r"[a-z0-9+#]+", re.IGNORECASE)
+
+_END = ""   # trie key marking "a skill ends here" (never a real token)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t.lower() for t in TOKEN_RE.findall(text)]
+
+
+class SkillMatcher:
+    """
+    Compiled token trie over a skill vocabulary.
+
+    find() tokenizes the text once and walks the trie from each token,
+    keeping the leftmost-longest match, so the cost grows with the text
+    length (times the longest skill, in tokens), not with vocabulary size.
+    """
+
+    def __init__(self, skills: Iterable[str], synonyms: Optional[Dict[str, str]] = None):
+        synonyms = synonyms or {}
+        self._trie: dict = {}
+        self.size = 0
+
+        for term in list(skills) + list(synonyms):
+            self.add(term, synonyms.get(term, term))
+
+    @classmethod
+    def from_trie(cls, trie: dict, size: int) -> "SkillMatcher":
+        """
+        Rebuilds a matcher from a trie saved with `trie` (plain nested
+        dicts of strings, so it round-trips through JSON).
+        """
+        matcher = cls([])
+        matcher._trie = trie
+        matcher.size = size
+        return matcher
+
+    @property
+    def trie(self) -> dict:
+        return self._trie
+
+    def copy(self) -> "SkillMatcher":
+        def _copy(node: dict) -> dict:
+            return {key: (_copy(child) if key != _END else child) for key, child in node.items()}
+
+        return SkillMatcher.from_trie(_copy(self._trie), self.size)
+
+    def add(self, term: str, canonical: str) -> None:
+        tokens = tokenize(term)
+        if not tokens:
+            return
+
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+
+        if _END not in node:
+            self.size += 1
+        node[_END] = canonical
+
+    def remove(self, term: str) -> None:
+        tokens = tokenize(term)
+        path = [self._trie]
+        for token in tokens:
+            node = path[-1].get(token)
+            if node is None:
+                return
+            path.append(node)
+
+        if not tokens or _END not in path[-1]:
+            return
+        del path[-1][_END]
+        self.size -= 1
+
+        # Prune branches that no longer lead to any term
+        for depth in range(len(tokens), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][tokens[depth - 1]]
+
+    def find(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        Returns (canonical_skill, start, end) for every non-overlapping
+        match, with character offsets into `text`.
+        """
+        tokens = [(m.group().lower(), m.start(), m.end()) for m in TOKEN_RE.finditer(text)]
+        # dotted[k]: tokens k and k + 1 are joined by a single "." ("node.js")
+        dotted = [text[a[2]:b[1]] == "." for a, b in zip(tokens, tokens[1:])] + [False]
+        matches = []
+
+        i = 0
+        while i < len(tokens):
+            node = self._trie
+            best = None
+
+            j = i
+            while j < len(tokens):
+                node = node.get(tokens[j][0])
+                if node is None:
+                    break
+                if _END in node and self._accepts(tokens, dotted, i, j, node[_END]):
+                    best = (node[_END], j)
+                j += 1
+
+            if best:
+                skill, last = best
+                matches.append((skill, tokens[i][1], tokens[last][2]))
+                i = last + 1
+            else:
+                i += 1
+
+        return matches
+
+    @staticmethod
+    def _accepts(tokens, dotted, i: int, j: int, canonical: str) -> bool:
+        """
+        Whether tokens i..j may match as `canonical`: a skill's own name
+        always does, a synonym only if it isn't a fragment of a dotted
+        compound (so "js" in "node.js" / "vue.js" is not "javascript").
+        """
+        if (i == 0 or not dotted[i - 1]) and not dotted[j]:
+            return True
+        return [t for t, _, _ in tokens[i:j + 1]] == tokenize(canonical)
+
+    def extract(self, text: str) -> Set[str]:
+        return {skill for skill, _, _ in self.find(text)}
@@ -1,104 +1,82 @@
 import re
 
-# -------------------------
-# Safe spaCy import
-# -------------------------
-try:
-    import spacy
-    from spacy.matcher import PhraseMatcher
-
-    nlp = spacy.load("en_core_web_sm")
-    SPACY_AVAILABLE = True
-except Exception:
-    SPACY_AVAILABLE = False
-    nlp = None
-    PhraseMatcher = None
+from nlp.analysis import DocumentAnalysis, as_analysis
+from nlp.taxonomy import get_taxonomy
+from utils.model_registry import get_model
+from utils.profiler import profiled
 
 
 # -------------------------
-# Normalization
+# Vocabulary (from the taxonomy file, see nlp/taxonomy.py)
 # -------------------------
-SKILL_SYNONYMS = {
-    "js": "javascript",
-    "nodejs": "node",
-    "py": "python",
-    "nlp": "natural language processing",
-    "ml": "machine learning",
-    "dl": "deep learning",
-    "db": "databases",
-    "sql db": "sql",
-    "postgres": "postgresql"
-}
+# SKILLS / SKILL_SYNONYMS are read from the live taxonomy on every access,
+# so they follow hot reloads of data/taxonomy/skills.json.
+def __getattr__(name):
+    if name == "SKILLS":
+        return get_taxonomy().skills
+    if name == "SKILL_SYNONYMS":
+        return get_taxonomy().synonyms
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # -------------------------
-# Skill vocabulary
+# spaCy model (registered in nlp/analysis.py)
 # -------------------------
-SKILLS = [
-    # Programming
-    "python", "java", "c", "c++", "javascript",
-
-    # Web
-    "html", "css", "responsive web design",
-    "react", "node", "express",
+def spacy_available() -> bool:
+    return get_model("spacy") is not None
 
-    # Backend
-    "django", "flask", "rest api",
 
-    # Databases
-    "sql", "mysql", "postgresql", "mongodb", "databases",
-
-    # DevOps / Cloud
-    "docker", "aws", "linux", "git",
-
-    # Data / AI
-    "machine learning", "deep learning", "nlp"
-]
+def find_skill_matches(text: str):
+    """
+    Returns (skill, start, end) for each skill mention, with offsets into `text`.
+    """
+    return get_taxonomy().matcher.find(text)
 
 
 # -------------------------
-# spaCy matcher (only if available)
+# Skill Extraction
 # -------------------------
-if SPACY_AVAILABLE:
-    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-    patterns = [nlp(skill) for skill in SKILLS]
-    matcher.add("SKILLS", patterns)
-else:
-    matcher = None
+@profiled("nlp.skills")
+def extract_skills(text):
+    """
+    Accepts raw text or a DocumentAnalysis (see nlp/analysis.py).
+    Passing an analysis reuses its tokens and caches the result on it.
+    """
+    analysis = as_analysis(text)
+    taxonomy = get_taxonomy()
 
+    cached = analysis.cached_skills(taxonomy.source_hash)
+    if cached is not None:
+        return list(cached)
 
-# -------------------------
-# Skill Extraction
-# -------------------------
-def extract_skills(text: str):
-    text = text.lower()
     found = set()
 
     # ---- spaCy-based extraction ----
-    if SPACY_AVAILABLE:
-        doc = nlp(text)
+    if analysis.doc is not None:
+        matcher = taxonomy.phrase_matcher(get_model("spacy"))
+        doc = analysis.doc
         matches = matcher(doc)
 
         for _, start, end in matches:
             skill = doc[start:end].text.lower()
-            skill = SKILL_SYNONYMS.get(skill, skill)
+            skill = taxonomy.synonyms.get(skill, skill)
             found.add(skill)
 
-    # ---- Rule-based fallback ----
+    # ---- Rule-based fallback (single pass over the text) ----
     else:
-        for skill in SKILLS:
-            if skill in text:
-                normalized = SKILL_SYNONYMS.get(skill, skill)
-                found.add(normalized)
+        found = taxonomy.matcher.extract(analysis.text)
 
-    return list(found)
+    skills = list(found)
+    analysis.cache_skills(taxonomy.source_hash, skills)
+    return list(skills)
 
 
 # -------------------------
 # Experience Extraction
 # -------------------------
-def extract_experience_years(text: str):
-    matches = re.findall(r"(\d+)\+?\s+years?", text.lower())
+@profiled("nlp.experience")
+def extract_experience_years(text):
+    matches = re.findall(r"(\d+)\+?\s+years?", _lowered(text))
     if matches:
         return max(int(x) for x in matches)
     return 0
@@ -107,8 +85,9 @@ def extract_experience_years(text: str):
 # -------------------------
 # Degree Extraction
 # -------------------------
-def extract_degrees(text: str):
-    text = text.lower()
+@profiled("nlp.degrees")
+def extract_degrees(text):
+    text = _lowered(text)
     degrees = []
 
     if "btech" in text or "b.tech" in text:
@@ -126,33 +105,13 @@ def extract_degrees(text: str):
 # -------------------------
 # Job Title Extraction
 # -------------------------
-def extract_job_titles(text: str):
-    text = text.lower()
-
-    COMMON_TITLES = [
-        "intern",
-        "trainee",
-        "developer",
-        "software developer",
-        "software engineer",
-        "backend developer",
-        "frontend developer",
-        "full stack developer",
-        "fullstack developer",
-        "data analyst",
-        "data scientist",
-        "ml engineer",
-        "ai engineer",
-        "campus ambassador",
-        "project lead",
-        "team lead",
-        "technical lead",
-        "engineering intern"
-    ]
+@profiled("nlp.job_titles")
+def extract_job_titles(text):
+    text = _lowered(text)
 
     found = set()
 
-    for title in COMMON_TITLES:
+    for title in get_taxonomy().job_titles:
         if title in text:
             found.add(title)
 
@@ -165,3 +124,10 @@ def extract_job_titles(text: str):
         found.add(role.strip())
 
     return list(found)
+
+
+def _lowered(text) -> str:
+    # DocumentAnalysis text is already lowercased
+    if isinstance(text, DocumentAnalysis):
+        return text.text
+    return text.lower()
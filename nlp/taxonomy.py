@@ -0,0 +1,265 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from nlp.skill_matcher import SkillMatcher
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TAXONOMY_PATH = os.environ.get(
+    "RESUME_SCREENER_TAXONOMY",
+    os.path.join(REPO_ROOT, "data", "taxonomy", "skills.json")
+)
+ARTIFACT_DIR = os.path.join(
+    os.environ.get("RESUME_SCREENER_CACHE_DIR", ".cache"),
+    "taxonomy"
+)
+
+# Bump when the compiled layout changes, so old artifacts are ignored
+ARTIFACT_VERSION = 2
+
+# How often (seconds) get_taxonomy() checks the file for changes
+RELOAD_CHECK_INTERVAL = 1.0
+
+
+class Taxonomy:
+    """
+    Compiled skill taxonomy: vocabulary, synonym map, job titles,
+    disambiguation contexts and the prebuilt skill trie.
+    """
+
+    def __init__(self, skills: List[str], synonyms: Dict[str, str], job_titles: List[str],
+                 disambiguation: Dict[str, dict], source_hash: str,
+                 matcher: Optional[SkillMatcher] = None):
+        self.skills = skills
+        self.synonyms = synonyms
+        self.job_titles = job_titles
+        self.disambiguation = disambiguation
+        self.source_hash = source_hash
+
+        self.matcher = matcher or SkillMatcher(skills, synonyms)
+
+        self._phrase_matcher = None
+        self._phrase_lock = threading.Lock()
+        # Tokenized PhraseMatcher patterns by skill, reused by the next
+        # version of the taxonomy on reload
+        self._pattern_docs: Dict[str, object] = {}
+        self._pattern_nlp = None
+
+    def phrase_matcher(self, nlp):
+        """
+        spaCy PhraseMatcher for this vocabulary, built on first use.
+        Patterns only need tokenization, so the full pipeline isn't run.
+        """
+        if self._phrase_matcher is None:
+            with self._phrase_lock:
+                if self._phrase_matcher is None:
+                    from spacy.matcher import PhraseMatcher
+
+                    if self._pattern_nlp is not nlp:
+                        self._pattern_docs = {}
+                    new = [s for s in self.skills if s not in self._pattern_docs]
+                    self._pattern_docs.update(zip(new, nlp.tokenizer.pipe(new)))
+                    self._pattern_nlp = nlp
+
+                    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+                    matcher.add("SKILLS", [self._pattern_docs[s] for s in self.skills])
+                    self._phrase_matcher = matcher
+
+        return self._phrase_matcher
+
+    # -------------------------
+    # Artifact (plain JSON: loading it never runs code)
+    # -------------------------
+    def to_artifact(self) -> dict:
+        return {
+            "artifact_version": ARTIFACT_VERSION,
+            "source_hash": self.source_hash,
+            "skills": self.skills,
+            "synonyms": self.synonyms,
+            "job_titles": self.job_titles,
+            "disambiguation": self.disambiguation,
+            "trie": self.matcher.trie,
+            "trie_size": self.matcher.size
+        }
+
+    @classmethod
+    def from_artifact(cls, data: dict) -> "Taxonomy":
+        return cls(
+            skills=data["skills"],
+            synonyms=data["synonyms"],
+            job_titles=data["job_titles"],
+            disambiguation=data["disambiguation"],
+            source_hash=data["source_hash"],
+            matcher=SkillMatcher.from_trie(data["trie"], data["trie_size"])
+        )
+
+    # spaCy objects and locks are rebuilt after unpickling
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_phrase_matcher"] = None
+        state["_pattern_docs"] = {}
+        state["_pattern_nlp"] = None
+        del state["_phrase_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._phrase_lock = threading.Lock()
+
+
+# -------------------------
+# Loading / compiling
+# -------------------------
+def _vocabulary(skills: List[str], synonyms: Dict[str, str]) -> Dict[str, str]:
+    # Every term the trie holds -> the skill it maps to
+    return {**{s: s for s in skills}, **synonyms}
+
+
+def _load_artifact(path: str, source_hash: str) -> Optional[Taxonomy]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["artifact_version"] != ARTIFACT_VERSION or data["source_hash"] != source_hash:
+            return None
+        return Taxonomy.from_artifact(data)
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing, corrupt or incompatible artifact -> rebuild
+        return None
+
+
+def compile_taxonomy(path: str = TAXONOMY_PATH, use_artifact: bool = True,
+                     previous: Optional[Taxonomy] = None) -> Taxonomy:
+    """
+    Loads the taxonomy file. The compiled result is cached on disk as JSON,
+    keyed by the file's content hash, so an unchanged file is never
+    re-parsed. With `previous` (the taxonomy being replaced), only the
+    terms that changed are re-tokenized into the trie and the spaCy
+    patterns.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    source_hash = hashlib.sha256(raw).hexdigest()
+    artifact_path = os.path.join(ARTIFACT_DIR, f"{source_hash}-v{ARTIFACT_VERSION}.json")
+
+    taxonomy = _load_artifact(artifact_path, source_hash) if use_artifact else None
+    if taxonomy is not None:
+        _reuse_patterns(taxonomy, previous)
+        return taxonomy
+
+    data = json.loads(raw.decode("utf-8"))
+
+    skills = data.get("skills", [])
+    if isinstance(skills, dict):
+        # Grouped by category -> flatten, keeping order
+        skills = [s for group in skills.values() for s in group]
+
+    skills = list(dict.fromkeys(s.lower() for s in skills))
+    synonyms = {k.lower(): v.lower() for k, v in data.get("synonyms", {}).items()}
+
+    matcher = None
+    if previous is not None:
+        # Patch a copy of the old trie with the terms that changed
+        old_terms = _vocabulary(previous.skills, previous.synonyms)
+        new_terms = _vocabulary(skills, synonyms)
+        matcher = previous.matcher.copy()
+        for term, canonical in old_terms.items():
+            if new_terms.get(term) != canonical:
+                matcher.remove(term)
+        for term, canonical in new_terms.items():
+            if old_terms.get(term) != canonical:
+                matcher.add(term, canonical)
+
+    taxonomy = Taxonomy(
+        skills=skills,
+        synonyms=synonyms,
+        job_titles=[t.lower() for t in data.get("job_titles", [])],
+        disambiguation=data.get("disambiguation", {}),
+        source_hash=source_hash,
+        matcher=matcher
+    )
+    _reuse_patterns(taxonomy, previous)
+
+    if use_artifact:
+        try:
+            os.makedirs(ARTIFACT_DIR, exist_ok=True)
+            tmp_path = f"{artifact_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(taxonomy.to_artifact(), f)
+            os.replace(tmp_path, artifact_path)
+        except OSError:
+            pass
+
+    return taxonomy
+
+
+def _reuse_patterns(taxonomy: Taxonomy, previous: Optional[Taxonomy]) -> None:
+    # spaCy patterns of skills kept from the previous version aren't re-tokenized
+    if previous is not None and previous._pattern_nlp is not None:
+        kept = set(taxonomy.skills)
+        taxonomy._pattern_docs = {s: doc for s, doc in previous._pattern_docs.items() if s in kept}
+        taxonomy._pattern_nlp = previous._pattern_nlp
+
+
+# -------------------------
+# Live taxonomy (hot reload)
+# -------------------------
+_current: Optional[Taxonomy] = None
+_current_stat = None
+_failed_stat = None     # (mtime, size) of a file version that failed to load
+_last_check = 0.0
+_reload_lock = threading.Lock()
+
+
+def get_taxonomy() -> Taxonomy:
+    """
+    Returns the current taxonomy. If the file changed on disk, it is
+    reloaded on the next call (checked at most every RELOAD_CHECK_INTERVAL).
+    A file that fails to load (e.g. half-written) is logged and the
+    previous taxonomy kept; it is retried once the file changes again.
+    """
+    global _last_check, _failed_stat
+
+    now = time.monotonic()
+    if _current is not None and now - _last_check < RELOAD_CHECK_INTERVAL:
+        return _current
+
+    _last_check = now
+    try:
+        stat = os.stat(TAXONOMY_PATH)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stat_key = None
+
+    if _current is None:
+        reload_taxonomy()
+    elif stat_key is not None and stat_key not in (_current_stat, _failed_stat):
+        try:
+            reload_taxonomy()
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            _failed_stat = stat_key
+            logging.warning(f"Taxonomy reload failed, keeping the previous version: {TAXONOMY_PATH}: {e}")
+
+    return _current
+
+
+def reload_taxonomy() -> Taxonomy:
+    """
+    Recompiles (or loads the cached artifact of) the taxonomy file and
+    swaps it in. Callers already holding the old object keep using it.
+    """
+    global _current, _current_stat
+
+    with _reload_lock:
+        stat = os.stat(TAXONOMY_PATH)
+        taxonomy = compile_taxonomy(TAXONOMY_PATH, previous=_current)
+
+        _current_stat = (stat.st_mtime_ns, stat.st_size)
+        _current = taxonomy
+
+    return taxonomy
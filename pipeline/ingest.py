@@ -0,0 +1,374 @@
+"""
+Streaming ingestion of resume folders and archives into the profile store.
+
+Usage:
+    python -m pipeline.ingest data/resumes
+    python -m pipeline.ingest resumes.zip --workers 8 --embed
+    python -m pipeline.ingest resumes.tar.gz --checkpoint ingest.jsonl
+    python -m pipeline.ingest --recompute-stale
+
+Files are read one at a time (zip/tar members straight out of the archive,
+never extracted to disk) and pass through bounded queues, so memory stays
+flat however large the source is: a slow stage blocks the one before it.
+Profiles are written to the store in batches, and each batch is recorded
+in the checkpoint only after it is committed, so re-running the same
+command after a crash skips everything already done.
+
+After a pipeline or taxonomy change, --recompute-stale re-profiles the
+stored raw text of every stale row instead of reading the files again.
+"""
+import argparse
+import json
+import os
+import queue
+import tarfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from processing.parser import SUPPORTED_EXTENSIONS
+from pipeline.screening import _init_worker, _safe_process_resume, process_resume_text
+from storage.profile_store import DEFAULT_DB_PATH, ProfileStore, content_hash
+from utils.model_registry import wait_for_loads
+
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_BATCH_SIZE = 100
+
+_DONE = object()
+
+
+# -------------------------
+# Sources
+# -------------------------
+def _supported(name: str) -> bool:
+    return os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS
+
+
+def iter_documents(source: str, skip=None) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yields (name, file_bytes) for every resume under `source`: a directory
+    (walked recursively), a zip or tar archive (members streamed in order),
+    or a single file. Archive members are named "<archive>/<member>".
+    Names for which skip(name) is true are not read at all.
+    """
+    skip = skip or (lambda name: False)
+
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for file_name in sorted(files):
+                path = os.path.join(root, file_name)
+                if _supported(path) and not skip(path):
+                    with open(path, "rb") as f:
+                        yield path, f.read()
+
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                name = os.path.join(source, info.filename)
+                if not info.is_dir() and _supported(name) and not skip(name):
+                    yield name, archive.read(info)
+
+    elif tarfile.is_tarfile(source):
+        # "r|*" reads the archive as a stream: no seeking, any compression
+        with tarfile.open(source, "r|*") as archive:
+            for member in archive:
+                name = os.path.join(source, os.path.normpath(member.name))
+                if member.isfile() and _supported(name) and not skip(name):
+                    yield name, archive.extractfile(member).read()
+
+    elif not skip(source):
+        with open(source, "rb") as f:
+            yield source, f.read()
+
+
+# -------------------------
+# Checkpoint
+# -------------------------
+class Checkpoint:
+    """
+    Append-only JSON-lines log of finished documents (name, hash, status).
+    """
+
+    def __init__(self, path: str, retry_failed: bool = False):
+        self.path = path
+        self.done = set()
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        # Torn last line from a crash mid-write
+                        continue
+                    if not (retry_failed and event["status"] == "failed"):
+                        self.done.add(event["name"])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.done
+
+    def record(self, events: List[dict]) -> None:
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.done.update(event["name"] for event in events)
+
+
+# -------------------------
+# Pipeline
+# -------------------------
+def _read_ahead(documents: Iterable[Tuple[str, bytes]], out: queue.Queue, stop: threading.Event) -> None:
+    """
+    Reader thread: hashes documents and feeds the bounded queue
+    (blocks when the workers fall behind, exits once `stop` is set).
+    """
+    def _put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                out.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for name, data in documents:
+            if not _put((name, data, content_hash(data))):
+                return
+    except Exception as e:
+        _put(e)
+    _put(_DONE)
+
+
+def ingest(
+    source: str,
+    store: Optional[ProfileStore] = None,
+    workers: Optional[int] = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    checkpoint: Optional[Checkpoint] = None,
+    embed: bool = False
+) -> Iterator[dict]:
+    """
+    Parses and profiles every resume in `source` into `store`.
+
+    Stages: reader thread -> bounded queue -> process pool (at most
+    2 x workers documents in flight) -> batched store writes. Resumes whose
+    content is already in the store at the current pipeline version, or
+    appeared earlier in this run, are not reprocessed. With `embed`, SBERT
+    embeddings are computed per batch and stored too.
+
+    Yields one event per document once it is persisted:
+    {"name", "content_hash", "status": "stored" | "unchanged" | "failed", "error"}.
+    """
+    if store is None:
+        store = ProfileStore()
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    documents = iter_documents(source, skip=checkpoint.__contains__ if checkpoint else None)
+    read_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    reader = threading.Thread(target=_read_ahead, args=(documents, read_queue, stop), daemon=True)
+    reader.start()
+
+    batch: List[dict] = []
+
+    def _flush() -> List[dict]:
+        stored = [e for e in batch if e["status"] == "stored"]
+        if stored:
+            if embed:
+                from scoring.similarity import encode_texts
+                vectors = encode_texts([e["record"]["clean_text"] for e in stored])
+                for event, vector in zip(stored, vectors):
+                    event["record"]["embedding"] = vector
+            store.put_many(e["record"] for e in stored)
+
+        events = [{k: v for k, v in e.items() if k != "record"} for e in batch]
+        if checkpoint is not None:
+            checkpoint.record(events)
+        batch.clear()
+        return events
+
+    def _collect(name: str, digest: str, outcome) -> None:
+        item, error = outcome
+        if error:
+            batch.append({"name": name, "content_hash": digest, "status": "failed", "error": error})
+        else:
+            record = dict(item, content_hash=digest, name=os.path.basename(name))
+            batch.append({"name": name, "content_hash": digest, "status": "stored", "error": None,
+                          "record": record})
+
+    pool = None
+    if workers > 1:
+        wait_for_loads()
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    in_flight = deque()
+    # Digests already in flight or batched this run (not yet in the store)
+    seen = set()
+
+    try:
+        while True:
+            entry = read_queue.get()
+            if entry is _DONE:
+                break
+            if isinstance(entry, Exception):
+                raise entry
+
+            name, data, digest = entry
+
+            if digest in seen or store.get_many([digest], with_raw_text=False):
+                batch.append({"name": name, "content_hash": digest, "status": "unchanged", "error": None})
+            elif pool is None:
+                seen.add(digest)
+                _collect(name, digest, _safe_process_resume((name, data)))
+            else:
+                seen.add(digest)
+                in_flight.append((name, digest, pool.submit(_safe_process_resume, (name, data))))
+                # Backpressure: wait for the oldest document before taking more
+                while len(in_flight) >= 2 * workers:
+                    done_name, done_digest, future = in_flight.popleft()
+                    _collect(done_name, done_digest, future.result())
+
+            if len(batch) >= batch_size:
+                yield from _flush()
+
+        while in_flight:
+            done_name, done_digest, future = in_flight.popleft()
+            _collect(done_name, done_digest, future.result())
+
+        if batch:
+            yield from _flush()
+    finally:
+        stop.set()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def _safe_process_resume_text(raw_text: str):
+    try:
+        return process_resume_text(raw_text), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def recompute_stale(
+    store: Optional[ProfileStore] = None,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    embed: bool = False
+) -> Iterator[dict]:
+    """
+    Re-profiles stale rows from their stored raw text (see
+    ProfileStore.stale_records) and writes them back at the current
+    pipeline version. Rows that had an embedding, or all rows with
+    `embed`, are re-embedded.
+
+    Yields one event per row, as ingest() does, with status "stored" or "failed".
+    """
+    if store is None:
+        store = ProfileStore()
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    pool = None
+    if workers > 1:
+        wait_for_loads()
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+    def _run(batch: List[dict]) -> List[dict]:
+        texts = [old["raw_text"] for old in batch]
+        outcomes = pool.map(_safe_process_resume_text, texts) if pool else map(_safe_process_resume_text, texts)
+
+        events, records, to_embed = [], [], []
+        for old, (item, error) in zip(batch, outcomes):
+            events.append({"name": old["name"], "content_hash": old["content_hash"],
+                           "status": "failed" if error else "stored", "error": error})
+            if not error:
+                record = dict(item, content_hash=old["content_hash"], name=old["name"])
+                records.append(record)
+                if embed or old["embedding"] is not None:
+                    to_embed.append(record)
+
+        if to_embed:
+            from scoring.similarity import encode_texts
+            for record, vector in zip(to_embed, encode_texts([r["clean_text"] for r in to_embed])):
+                record["embedding"] = vector
+        if records:
+            store.put_many(records)
+        return events
+
+    try:
+        batch = []
+        for old in store.stale_records():
+            batch.append(old)
+            if len(batch) >= batch_size:
+                yield from _run(batch)
+                batch = []
+        if batch:
+            yield from _run(batch)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", nargs="?", help="folder, .zip / .tar(.gz) archive, or single resume")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="profile store (SQLite file)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--checkpoint", default=None,
+                        help="progress log (default: <db>.<source name>.ingest.jsonl)")
+    parser.add_argument("--retry-failed", action="store_true", help="retry documents that failed before")
+    parser.add_argument("--embed", action="store_true", help="also compute and store SBERT embeddings")
+    parser.add_argument("--recompute-stale", action="store_true",
+                        help="re-profile stale rows from their stored raw text (no source needed)")
+    args = parser.parse_args()
+
+    if not args.source and not args.recompute_stale:
+        parser.error("a source is required unless --recompute-stale is given")
+
+    store = ProfileStore(args.db)
+    counts = {"stored": 0, "unchanged": 0, "failed": 0}
+    start = time.perf_counter()
+
+    def _report(events: Iterable[dict]) -> None:
+        for n, event in enumerate(events, start=1):
+            counts[event["status"]] += 1
+            if event["status"] == "failed":
+                print("Error processing:", event["name"], event["error"])
+            if n % args.batch_size == 0:
+                print(f"{n} documents ({n / (time.perf_counter() - start):.1f}/s)")
+
+    if args.recompute_stale:
+        _report(recompute_stale(store, args.workers, args.batch_size, args.embed))
+        still_stale = len(store.stale())
+        print(
+            f"Recomputed in {time.perf_counter() - start:.1f}s: {counts['stored']} stored, "
+            f"{counts['failed']} failed, {still_stale} still stale"
+            + (" (older parser or no raw text: re-ingest their files)" if still_stale else "")
+        )
+        counts = {"stored": 0, "unchanged": 0, "failed": 0}
+        start = time.perf_counter()
+
+    if args.source:
+        checkpoint_path = args.checkpoint or f"{args.db}.{os.path.basename(os.path.normpath(args.source))}.ingest.jsonl"
+        checkpoint = Checkpoint(checkpoint_path, retry_failed=args.retry_failed)
+
+        _report(ingest(args.source, store, args.workers, args.queue_size, args.batch_size, checkpoint, args.embed))
+
+        print(
+            f"Done in {time.perf_counter() - start:.1f}s: {counts['stored']} stored, "
+            f"{counts['unchanged']} unchanged, {counts['failed']} failed "
+            f"({len(checkpoint.done)} in checkpoint {checkpoint_path})"
+        )
@@ -0,0 +1,160 @@
+"""
+Many-to-many matching: M job descriptions x N resumes.
+
+Usage:
+    python -m pipeline.matrix --jds data/jds --resumes data/resumes \
+        --top-k 5 --by-jd top_candidates.csv --by-candidate top_jobs.csv
+
+Output files ending in .parquet are written with pyarrow (if installed),
+anything else as CSV. Rows are written in batches as they are produced.
+"""
+import argparse
+import csv
+import glob
+import os
+from typing import Iterable, List
+
+import numpy as np
+
+from processing.parser import parse_text_file
+from pipeline.screening import process_resumes
+from scoring.job_profile import JobProfile
+from scoring.matrix import score_matrix, top_k
+from scoring.similarity import encode_texts
+
+# -------------------------
+# Parquet Safe Import
+# -------------------------
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+RANKING_COLUMNS = ["query", "rank", "match", "final", "skills", "keywords", "semantic"]
+WRITE_BATCH_ROWS = 10000
+
+
+def build_jobs(jd_paths: List[str]) -> List[JobProfile]:
+    """
+    JobProfiles for all JDs, with every JD embedded in one encode call.
+    """
+    jobs = [JobProfile.build(parse_text_file(p), with_embedding=False) for p in jd_paths]
+    for job, vector in zip(jobs, encode_texts([job.text for job in jobs])):
+        job.embedding = vector
+    return jobs
+
+
+def iter_rankings(scores: dict, query_names: List[str], match_names: List[str], k: int) -> Iterable[dict]:
+    """
+    Top-k matches per row of scores["final"], one dict per (query, match).
+    """
+    indices, _ = top_k(scores["final"], k)
+
+    for row, query in enumerate(query_names):
+        for rank, col in enumerate(indices[row], start=1):
+            yield {
+                "query": query,
+                "rank": rank,
+                "match": match_names[col],
+                "final": float(scores["final"][row, col]),
+                "skills": float(scores["skills"][row, col]),
+                "keywords": float(scores["keywords"][row, col]),
+                "semantic": float(scores["semantic"][row, col])
+            }
+
+
+def write_rankings(path: str, rows: Iterable[dict]) -> int:
+    """
+    Streams ranking rows to CSV or Parquet. Returns the number of rows written.
+    """
+    count = 0
+
+    if path.lower().endswith(".parquet"):
+        if not PARQUET_AVAILABLE:
+            raise ImportError("pyarrow is required to write Parquet output")
+
+        writer = None
+        batch = []
+
+        def _flush():
+            nonlocal writer
+            table = pa.Table.from_pylist(batch)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            batch.clear()
+
+        for row in rows:
+            batch.append(row)
+            count += 1
+            if len(batch) >= WRITE_BATCH_ROWS:
+                _flush()
+        if batch:
+            _flush()
+        if writer is not None:
+            writer.close()
+
+        return count
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RANKING_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+
+    return count
+
+
+def _collect(path_or_dir: str, patterns: List[str]) -> List[str]:
+    if os.path.isfile(path_or_dir):
+        return [path_or_dir]
+    paths = []
+    for pattern in patterns:
+        paths.extend(glob.glob(os.path.join(path_or_dir, "**", pattern), recursive=True))
+    return sorted(paths)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jds", required=True, help="JD .txt file or folder")
+    parser.add_argument("--resumes", required=True, help="resume file or folder (PDF/DOCX)")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--by-jd", default="top_candidates_per_jd.csv")
+    parser.add_argument("--by-candidate", default="top_jds_per_candidate.csv")
+    args = parser.parse_args()
+
+    jd_paths = _collect(args.jds, ["*.txt"])
+    resume_paths = _collect(args.resumes, ["*.pdf", "*.docx"])
+
+    if not jd_paths:
+        raise SystemExit(f"No JD .txt files found in {args.jds}")
+    if not resume_paths:
+        raise SystemExit(f"No PDF/DOCX resumes found in {args.resumes}")
+
+    jobs = build_jobs(jd_paths)
+
+    candidates = []
+    for result in process_resumes(resume_paths, args.workers):
+        if result["error"]:
+            print("Error processing:", result["path"], result["error"])
+        else:
+            candidates.append(result)
+
+    if not jobs or not candidates:
+        raise SystemExit("Need at least one JD and one resume that could be processed.")
+
+    scores = score_matrix(jobs, candidates)
+    jd_names = [os.path.basename(p) for p in jd_paths]
+    resume_names = [os.path.basename(c["path"]) for c in candidates]
+
+    n_jd = write_rankings(args.by_jd, iter_rankings(scores, jd_names, resume_names, args.top_k))
+
+    transposed = {name: np.ascontiguousarray(m.T) for name, m in scores.items()}
+    n_cand = write_rankings(args.by_candidate, iter_rankings(transposed, resume_names, jd_names, args.top_k))
+
+    print(f"{len(jobs)} JDs x {len(candidates)} resumes scored")
+    print(f"Wrote {n_jd} rows to {args.by_jd} and {n_cand} rows to {args.by_candidate}")
@@ -0,0 +1,298 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from processing.parser import parse_resume, parse_resume_bytes
+from processing.cleaner import clean_text
+from nlp.extractor import split_into_sections, build_profile
+
+from scoring.job_profile import JobProfile
+from scoring.similarity import compute_similarity_batch, compute_semantic_similarity_batch, encode_texts
+from scoring.engine import calculate_match_score
+from scoring.final_score import compute_final_score_for_job
+from scoring.matrix import score_matrix
+
+from storage.profile_store import ProfileStore, content_hash
+
+from utils.identity import extract_candidate_identity
+from utils.model_registry import wait_for_loads, warm_up
+from utils import profiler
+
+
+# A resume is either a file path or an in-memory (file_name, file_bytes) upload
+ResumeInput = Union[str, Tuple[str, bytes]]
+
+
+# -------------------------
+# Worker side (runs in the process pool)
+# -------------------------
+def _init_worker(profile_settings=(False, False)):
+    # Workers do not inherit a profiler enabled at runtime in the parent,
+    # but forked ones do inherit its samples so far
+    profiler.enable(*profile_settings)
+    profiler.reset()
+
+    # Load spaCy once per worker instead of once per resume
+    warm_up(["spacy"], background=False)
+
+
+def process_resume(resume: ResumeInput) -> dict:
+    """
+    Parse -> clean -> sections -> profile for one resume.
+    """
+    if isinstance(resume, tuple):
+        raw_resume = parse_resume_bytes(resume[1], resume[0])
+    else:
+        raw_resume = parse_resume(resume)
+
+    return process_resume_text(raw_resume)
+
+
+def process_resume_text(raw_resume: str) -> dict:
+    """
+    Clean -> sections -> profile for resume text that is already extracted.
+    """
+    clean_resume = clean_text(raw_resume)
+    sections = split_into_sections(clean_resume)
+    profile = build_profile(sections)
+
+    return {
+        "raw_text": raw_resume,
+        "clean_text": clean_resume,
+        "profile": profile,
+        "candidate_name": extract_candidate_identity(raw_resume)
+    }
+
+
+def _read_bytes(resume: ResumeInput) -> bytes:
+    if isinstance(resume, tuple):
+        return resume[1]
+    with open(resume, "rb") as f:
+        return f.read()
+
+
+def _safe_process_resume(resume: ResumeInput):
+    try:
+        return process_resume(resume), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _profiled_process_resume(resume: ResumeInput):
+    # Ships this worker's stage timings back with each result
+    return _safe_process_resume(resume), profiler.drain()
+
+
+# -------------------------
+# Engine
+# -------------------------
+def process_resumes(
+    resume_paths: List[ResumeInput],
+    workers: Optional[int] = None,
+    store: Optional[ProfileStore] = None
+) -> List[dict]:
+    """
+    Runs process_resume over all inputs in a process pool of `workers`
+    processes (default: CPU count; 1 = run inline).
+    Returns one dict per input, in order, with "path" and "error" set.
+
+    With a `store`, resumes already profiled by the current pipeline
+    version are read back instead of processed, and new ones are saved.
+    Results then also carry "content_hash".
+    """
+    resume_paths = list(resume_paths)
+    processed = [None] * len(resume_paths)
+    todo = list(range(len(resume_paths)))
+
+    if store is not None:
+        hashes = []
+        for i, resume in enumerate(resume_paths):
+            try:
+                hashes.append(content_hash(_read_bytes(resume)))
+            except OSError as e:
+                hashes.append(None)
+                processed[i] = (None, f"{type(e).__name__}: {e}")
+
+        stored = store.get_many([h for h in hashes if h])
+        for i, h in enumerate(hashes):
+            if h in stored:
+                processed[i] = (stored[h], None)
+        todo = [i for i in todo if processed[i] is None]
+
+        # The same file uploaded twice is processed (and stored) once
+        first = {}
+        for i in todo:
+            first.setdefault(hashes[i], i)
+        duplicates = {i: first[hashes[i]] for i in todo if first[hashes[i]] != i}
+        todo = [i for i in todo if i not in duplicates]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(todo))
+
+    pending = [resume_paths[i] for i in todo]
+    if workers > 1:
+        # Never fork while a warm-up thread is mid-import (see wait_for_loads)
+        wait_for_loads()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(profiler.settings(),)
+        ) as pool:
+            if profiler.is_enabled():
+                fresh = []
+                for outcome, samples in pool.map(_profiled_process_resume, pending):
+                    profiler.merge(samples)
+                    fresh.append(outcome)
+            else:
+                fresh = list(pool.map(_safe_process_resume, pending))
+    else:
+        fresh = [_safe_process_resume(p) for p in pending]
+
+    for i, outcome in zip(todo, fresh):
+        processed[i] = outcome
+    if store is not None:
+        for i, original in duplicates.items():
+            processed[i] = processed[original]
+
+    results = []
+    for i, (resume, (item, error)) in enumerate(zip(resume_paths, processed)):
+        path = resume[0] if isinstance(resume, tuple) else resume
+        result = {"path": path, "error": error}
+        if item:
+            result.update(item)
+        if store is not None:
+            result["content_hash"] = hashes[i]
+        results.append(result)
+
+    if store is not None:
+        store.put_many(
+            dict(results[i], name=os.path.basename(results[i]["path"]))
+            for i, (item, _) in zip(todo, fresh) if item
+        )
+
+    return results
+
+
+def screen_batch(
+    jd_text: Union[str, JobProfile],
+    resume_paths: List[ResumeInput],
+    workers: Optional[int] = None,
+    batch_size: int = 32,
+    weights: dict = None,
+    store: Optional[ProfileStore] = None,
+    semantic_chunking: Optional[str] = None,
+    semantic_pooling: str = "max"
+) -> List[dict]:
+    """
+    Screens many resumes against one JD (raw text or a prebuilt JobProfile).
+    All JD-side work happens once, up front, in the JobProfile.
+
+    Parsing and profile extraction fan out to a process pool of `workers`
+    processes (default: CPU count; 1 = run inline). Similarity is then
+    computed for all resumes in one batched step.
+
+    Entries of `resume_paths` may also be (file_name, file_bytes) pairs,
+    which are parsed from memory (and skip parsing on a parse-cache hit).
+    With a profile `store`, previously profiled resumes skip parsing and
+    NLP entirely (see process_resumes).
+    `semantic_chunking` / `semantic_pooling` embed long resumes chunk by
+    chunk (see compute_semantic_similarity_batch).
+
+    Returns one dict per resume, in the same order as `resume_paths`;
+    "path" is the file path or the file name of an upload.
+    A resume that fails has "error" set and no scores; the others are
+    unaffected.
+    """
+    job = jd_text if isinstance(jd_text, JobProfile) else JobProfile.build(jd_text)
+
+    results = process_resumes(resume_paths, workers, store)
+    ok = [r for r in results if r["error"] is None]
+
+    # -------------------------
+    # Similarity (one batch each)
+    # -------------------------
+    clean_resumes = [r["clean_text"] for r in ok]
+    tfidf_scores = compute_similarity_batch(job, clean_resumes)
+    semantic_scores = compute_semantic_similarity_batch(
+        job,
+        clean_resumes,
+        batch_size=batch_size,
+        chunking=semantic_chunking,
+        pooling=semantic_pooling
+    )
+
+    # -------------------------
+    # Skill matching + final score
+    # -------------------------
+    for result, tfidf_score, semantic_score in zip(ok, tfidf_scores, semantic_scores):
+        try:
+            profile = result["profile"]
+            skill_result = calculate_match_score(profile, job)
+
+            final_score_result = compute_final_score_for_job(
+                job,
+                profile,
+                skill_match_percent=skill_result["skill_match_percent"],
+                semantic_similarity=semantic_score,
+                keyword_similarity=tfidf_score,
+                weights=weights
+            )
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+            continue
+
+        result.update({
+            "tfidf": tfidf_score,
+            "semantic": semantic_score,
+            "skill_result": skill_result,
+            "final_score": final_score_result
+        })
+
+    return results
+
+
+def screen_stored(
+    jd_text: Union[str, JobProfile],
+    store: ProfileStore,
+    min_experience: Optional[float] = None,
+    all_skills: List[str] = (),
+    top_n: Optional[int] = None,
+    weights: dict = None
+) -> List[dict]:
+    """
+    Screens every current candidate in `store` (optionally pre-filtered on
+    the indexed experience / skill columns) without touching any files.
+    Stored embeddings are reused; missing ones are encoded once and saved.
+
+    Returns the stored records sorted by final score, each with a "scores"
+    dict (final, skills, experience, education, keywords, semantic).
+    """
+    job = jd_text if isinstance(jd_text, JobProfile) else JobProfile.build(jd_text)
+
+    hashes = store.find(min_experience=min_experience, all_skills=all_skills)
+    candidates = list(store.iter_records(hashes))
+    if not candidates:
+        return []
+
+    missing = [c for c in candidates if c["embedding"] is None]
+    if missing:
+        vectors = encode_texts([c["clean_text"] for c in missing])
+        store.put_embeddings([c["content_hash"] for c in missing], vectors)
+        for candidate, vector in zip(missing, vectors):
+            candidate["embedding"] = vector
+
+    scores = score_matrix(
+        [job],
+        candidates,
+        candidate_embeddings=np.stack([c["embedding"] for c in candidates]),
+        weights=weights
+    )
+
+    for i, candidate in enumerate(candidates):
+        candidate["scores"] = {name: float(matrix[0, i]) for name, matrix in scores.items()}
+
+    candidates.sort(key=lambda c: c["scores"]["final"], reverse=True)
+    return candidates[:top_n] if top_n else candidates
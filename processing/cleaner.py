@@ -1,19 +1,75 @@
-import re
+from typing import Tuple
 
+import numpy as np
+
+from utils.profiler import profiled
+
+# Characters kept after lowercasing; everything else becomes a space
+_KEPT = b"abcdefghijklmnopqrstuvwxyz0123456789.,-+"
+
+# bytes.translate table over the lowercased text, encoded as ASCII with
+# every non-ASCII character replaced by "?" (never kept, so -> space)
+_TABLE = bytes(c if c in _KEPT else 32 for c in range(256))
+_SPACE = 32
+
+
+def _translated(text: str) -> Tuple[str, bytes]:
+    lowered = text.lower()
+    return lowered, lowered.encode("ascii", "replace").translate(_TABLE)
+
+
+@profiled("processing.clean")
 def clean_text(text: str) -> str:
+    """
+    Lowercases, replaces characters other than letters, digits and . , - +
+    with spaces, and collapses / strips whitespace. One translate pass
+    over the text instead of three regex passes; same output.
+    """
     if not text:
         return ""
 
-    # 1. Lowercase everything
-    text = text.lower()
+    return " ".join(_translated(text)[1].decode("ascii").split())
+
+
+@profiled("processing.clean")
+def clean_text_with_offsets(text: str) -> Tuple[str, np.ndarray]:
+    """
+    Same as clean_text, plus offsets[i] = position in `text` that clean
+    character i came from (a collapsed run of whitespace maps to its first
+    character), so matches on the clean text can be shown on the original.
+    """
+    if not text:
+        return "", np.zeros(0, dtype=np.int64)
+
+    lowered, translated = _translated(text)
+    codes = np.frombuffer(translated, dtype=np.uint8)
+    is_char = codes != _SPACE
+
+    if not is_char.any():
+        return "", np.zeros(0, dtype=np.int64)
+
+    # Keep every character, plus the first space of each run between two
+    # characters (leading / trailing runs are dropped)
+    keep = is_char.copy()
+    keep[1:] |= is_char[:-1]
+    keep[len(codes) - int(np.argmax(is_char[::-1])):] = False
+
+    offsets = np.flatnonzero(keep)
+    clean = codes[keep].tobytes().decode("ascii")
 
-    # 2. Remove unwanted characters (keep letters, numbers, basic punctuation)
-    text = re.sub(r"[^a-z0-9\s\.\,\-\+]", " ", text)
+    if len(lowered) != len(text):
+        # Some characters lowercase to more than one (e.g. "İ" -> "i̇")
+        raw_of = np.repeat(np.arange(len(text)), [len(ch.lower()) for ch in text])
+        offsets = raw_of[offsets]
 
-    # 3. Replace multiple spaces/newlines with a single space
-    text = re.sub(r"\s+", " ", text)
+    return clean, offsets
 
-    # 4. Strip leading/trailing spaces
-    text = text.strip()
 
-    return text
+def raw_span(offsets: np.ndarray, start: int, end: int) -> Tuple[int, int]:
+    """
+    Maps a [start, end) span of clean text back to the original text.
+    """
+    if start >= end:
+        raw = int(offsets[start]) if start < len(offsets) else (int(offsets[-1]) + 1 if len(offsets) else 0)
+        return raw, raw
+    return int(offsets[start]), int(offsets[end - 1]) + 1
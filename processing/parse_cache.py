@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Optional
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("RESUME_SCREENER_CACHE_DIR", ".cache"),
+    "parsed"
+)
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Eviction trims the cache to this fraction of max_bytes, so the directory
+# scan it needs runs once per batch of writes rather than on every put
+EVICT_TO = 0.9
+# Other processes' writes are only seen by a scan: rescan this often anyway
+RESCAN_EVERY = 1000
+
+
+def document_key(data: bytes, parser_version: int) -> str:
+    """
+    Cache key for one document: hash of the raw file bytes + parser version.
+    """
+    return f"{hashlib.sha256(data).hexdigest()}-v{parser_version}"
+
+
+class ParseCache:
+    """
+    Persistent cache of parsed documents, one JSON file per key.
+
+    Each record holds the extracted text plus metadata (page count,
+    OCR usage, extraction time). Hits refresh the file's mtime, and when
+    the cache grows past `max_bytes` the least recently used files are
+    deleted. The total size is tracked in memory (seeded by one directory
+    scan), so a put only scans the directory when eviction is due.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None     # None -> not scanned yet
+        self._puts_since_scan = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return record
+
+    def put(self, key: str, record: dict) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Write-then-rename so concurrent readers never see partial JSON
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        size = os.path.getsize(tmp_path)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._puts_since_scan += 1
+            if self._total_bytes is not None:
+                self._total_bytes += size - replaced
+            if (self._total_bytes is None or self._total_bytes > self.max_bytes
+                    or self._puts_since_scan >= RESCAN_EVERY):
+                self._evict()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._total_bytes = None
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _evict(self) -> None:
+        """
+        Scans the directory for the exact size; if over max_bytes, deletes
+        least recently used files down to EVICT_TO of it. Caller holds _lock.
+        """
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes * EVICT_TO:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    # Another process got there first
+                    pass
+                total -= size
+
+        self._total_bytes = total
+        self._puts_since_scan = 0
+
+
+# -------------------------
+# Shared default cache
+# -------------------------
+_default_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> ParseCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ParseCache()
+    return _default_cache
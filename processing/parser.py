@@ -1,43 +1,169 @@
+import multiprocessing
 import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
 import PyPDF2
 import docx
 
+from processing.parse_cache import document_key, get_parse_cache
+from utils.model_registry import wait_for_loads
+from utils.profiler import profiled
+
 # -------------------------
 # OCR Safe Imports
 # -------------------------
 try:
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
     import pytesseract
     OCR_AVAILABLE = True
 except ImportError:
     OCR_AVAILABLE = False
 
+# -------------------------
+# OCR tuning
+# -------------------------
+OCR_DPI = 200
+OCR_WORKERS = min(4, os.cpu_count() or 1)
+OCR_MEMORY_LIMIT_MB = 256   # budget for page images held at the same time
+
+# -------------------------
+# Text-layer tuning
+# -------------------------
+PDF_PAGE_WORKERS = min(4, os.cpu_count() or 1)
+# Each page worker re-opens the PDF, so only long documents gain from it
+PDF_PARALLEL_MIN_PAGES = 64
+
+# Bump when extraction changes, so cached parses are not reused
+PARSER_VERSION = 2
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
 
-def parse_resume(file_path: str) -> str:
+@profiled("processing.parse")
+def parse_resume(file_path: str, use_cache: bool = True, workers: Optional[int] = None) -> str:
     """
     Extract text from PDF/DOCX.
     If PDF text extraction fails, fall back to OCR (if available).
+    Results are cached by file content; pass use_cache=False to bypass.
+    `workers` is passed on to parse_document.
     """
+    _check_supported(file_path)
+
+    if not use_cache:
+        return parse_document(file_path, workers)["text"]
+
+    with open(file_path, "rb") as f:
+        data = f.read()
+
+    return _parse_cached(data, lambda: parse_document(file_path, workers))["text"]
+
+
+@profiled("processing.parse")
+def parse_resume_bytes(data: bytes, file_name: str, use_cache: bool = True,
+                       workers: Optional[int] = None) -> str:
+    """
+    Same as parse_resume, for file contents already in memory (uploads).
+    On a cache hit nothing is written to disk or parsed.
+    """
+    suffix = _check_supported(file_name)
+
+    def _parse():
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            tmp.write(data)
+            tmp_path = tmp.name
+        try:
+            return parse_document(tmp_path, workers)
+        finally:
+            os.remove(tmp_path)
+
+    if not use_cache:
+        return _parse()["text"]
+
+    return _parse_cached(data, _parse)["text"]
 
-    if file_path.lower().endswith(".pdf"):
-        text = extract_text_from_pdf(file_path)
 
-        # ---- OCR FALLBACK (GUARDED) ----
-        if not text.strip():
+@profiled("processing.extract")
+def parse_document(file_path: str, workers: Optional[int] = None) -> dict:
+    """
+    Uncached parse of one PDF/DOCX file.
+    Returns the text plus metadata about how it was extracted.
+
+    Long PDFs have their text layer extracted by `workers` processes
+    (default: PDF_PAGE_WORKERS, or 1 when already running inside a pool
+    worker, so batch screening doesn't nest pools).
+    """
+    suffix = _check_supported(file_path)
+    start = time.perf_counter()
+
+    if workers is None:
+        workers = PDF_PAGE_WORKERS if multiprocessing.parent_process() is None else 1
+
+    ocr_page_numbers = []
+
+    if suffix == ".pdf":
+        pages = extract_pdf_pages(file_path, workers)
+
+        # ---- OCR FALLBACK (GUARDED), only for image-only pages ----
+        blank_pages = [i for i, page_text in enumerate(pages) if not page_text.strip()]
+
+        if not pages or blank_pages:
             if OCR_AVAILABLE:
-                print("⚠️ No text found in PDF. Using OCR fallback...")
-                text = ocr_from_pdf(file_path)
-            else:
-                print("⚠️ OCR not available. Skipping OCR fallback.")
-                text = ""
+                print("⚠️ No text found in PDF page(s). Using OCR fallback...")
+                ocr_pages = ocr_pdf_pages(file_path, pages=blank_pages if pages else None)
 
-        return text
+                if not pages:
+                    pages = [ocr_pages[i] for i in sorted(ocr_pages)]
+                for i, page_text in ocr_pages.items():
+                    if i < len(pages):
+                        pages[i] = page_text
 
-    elif file_path.lower().endswith(".docx"):
-        return extract_text_from_docx(file_path)
+                ocr_page_numbers = sorted(ocr_pages)
+
+            elif not "".join(pages).strip():
+                print("⚠️ OCR not available. Skipping OCR fallback.")
+
+        text = "".join(pages)
+        page_count = len(pages)
 
     else:
+        text = extract_text_from_docx(file_path)
+        page_count = None
+
+    return {
+        "text": text,
+        "format": suffix[1:],
+        "page_count": page_count,
+        "ocr_used": bool(ocr_page_numbers),
+        "ocr_pages": ocr_page_numbers,
+        "extraction_time": round(time.perf_counter() - start, 4),
+        "parser_version": PARSER_VERSION
+    }
+
+
+def _parse_cached(data: bytes, parse) -> dict:
+    cache = get_parse_cache()
+    key = document_key(data, PARSER_VERSION)
+
+    record = cache.get(key)
+    if record is None:
+        record = parse()
+        try:
+            cache.put(key, record)
+        except OSError:
+            # Cache directory not writable -> still return the parse
+            pass
+
+    return record
+
+
+def _check_supported(file_name: str) -> str:
+    suffix = os.path.splitext(file_name)[1].lower()
+    if suffix not in SUPPORTED_EXTENSIONS:
         raise ValueError("Unsupported file format")
+    return suffix
 
 
 # -------------------------
@@ -45,19 +171,52 @@ def parse_resume(file_path: str) -> str:
 # -------------------------
 
 def extract_text_from_pdf(path: str) -> str:
-    text = ""
+    return "".join(extract_pdf_pages(path))
+
+
+def extract_pdf_pages(path: str, workers: int = 1) -> List[str]:
+    """
+    Returns the text of each PDF page ("" for pages without a text layer).
+    With workers > 1, page ranges of PDFs with at least
+    PDF_PARALLEL_MIN_PAGES pages are extracted in parallel processes.
+    Returns [] if the PDF can't be read at all.
+    """
     try:
         with open(path, "rb") as f:
             reader = PyPDF2.PdfReader(f)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text
+            page_count = len(reader.pages)
+
+            if workers <= 1 or page_count < max(2 * workers, PDF_PARALLEL_MIN_PAGES):
+                return [_extract_page(page) for page in reader.pages]
     except Exception:
         # Fail silently and allow OCR fallback
-        pass
+        return []
+
+    step = -(-page_count // workers)   # ceil division
+    ranges = [(path, start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+    wait_for_loads()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = pool.map(_extract_page_range, ranges)
+
+    return [page_text for chunk in chunks for page_text in chunk]
+
 
-    return text
+def _extract_page(page) -> str:
+    try:
+        return page.extract_text() or ""
+    except Exception:
+        return ""
+
+
+def _extract_page_range(args) -> List[str]:
+    path, start, end = args
+    try:
+        with open(path, "rb") as f:
+            reader = PyPDF2.PdfReader(f)
+            return [_extract_page(reader.pages[i]) for i in range(start, end)]
+    except Exception:
+        return [""] * (end - start)
 
 
 def extract_text_from_docx(path: str) -> str:
@@ -74,19 +233,69 @@ def ocr_from_pdf(pdf_path: str) -> str:
     Convert PDF pages to images and run OCR.
     Only executed if OCR_AVAILABLE is True.
     """
+    ocr_pages = ocr_pdf_pages(pdf_path)
+    return "".join(ocr_pages[i] for i in sorted(ocr_pages))
+
+
+@profiled("processing.ocr")
+def ocr_pdf_pages(
+    pdf_path: str,
+    pages: Optional[Iterable[int]] = None,
+    workers: int = OCR_WORKERS,
+    memory_limit_mb: int = OCR_MEMORY_LIMIT_MB,
+    dpi: int = OCR_DPI
+) -> Dict[int, str]:
+    """
+    OCRs the given 0-based pages (default: all) and returns {page: text}.
+
+    Each page is rendered on its own and released right after tesseract
+    reads it. Pages run concurrently (tesseract is a subprocess), but no
+    more at once than fit in `memory_limit_mb`.
+    """
     if not OCR_AVAILABLE:
-        return ""
+        return {}
+
+    if pages is None:
+        pages = range(_count_pdf_pages(pdf_path))
+    pages = list(pages)
+
+    window = max(1, min(workers, int(memory_limit_mb // _page_image_mb(dpi))))
+
+    with ThreadPoolExecutor(max_workers=window) as pool:
+        texts = pool.map(lambda i: _ocr_page(pdf_path, i, dpi), pages)
+        return dict(zip(pages, texts))
+
 
-    text = ""
+def _ocr_page(pdf_path: str, page_index: int, dpi: int) -> str:
     try:
-        images = convert_from_path(pdf_path)
-        for img in images:
-            text += pytesseract.image_to_string(img)
+        images = convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            first_page=page_index + 1,
+            last_page=page_index + 1
+        )
+        return "".join(pytesseract.image_to_string(img) for img in images)
     except Exception:
         # OCR failed → return empty string safely
+        return ""
+
+
+def _page_image_mb(dpi: int) -> float:
+    # Rough size of one rendered US-letter RGB page
+    return (8.5 * dpi) * (11 * dpi) * 3 / (1024 * 1024)
+
+
+def _count_pdf_pages(pdf_path: str) -> int:
+    try:
+        with open(pdf_path, "rb") as f:
+            return len(PyPDF2.PdfReader(f).pages)
+    except Exception:
         pass
 
-    return text
+    try:
+        return int(pdfinfo_from_path(pdf_path)["Pages"])
+    except Exception:
+        return 0
 
 
 # -------------------------
@@ -1,3 +1,7 @@
+from utils.profiler import profiled
+
+
+@profiled("recommendations.generate")
 def generate_recommendations(match_result: dict, under_emphasized: list = None) -> list:
     missing = match_result.get("missing_skills", [])
 
@@ -36,6 +40,7 @@ def generate_recommendations(match_result: dict, under_emphasized: list = None)
     return suggestions[:5]
 
 
+@profiled("recommendations.under_emphasized")
 def find_under_emphasized_strengths(resume_text: str, jd_skills: list):
     """
     Finds skills that exist in resume but are mentioned only once,
@@ -2,7 +2,10 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph
 from reportlab.lib.styles import getSampleStyleSheet
 from io import BytesIO
 
+from utils.profiler import profiled
 
+
+@profiled("reports.pdf")
 def generate_pdf_report_bytes(summary: dict):
     buffer = BytesIO()
     styles = getSampleStyleSheet()
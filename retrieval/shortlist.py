@@ -0,0 +1,55 @@
+from typing import Callable, List, Mapping, Union
+
+from retrieval.vector_index import VectorIndex
+from scoring.job_profile import JobProfile
+from scoring.matrix import score_matrix
+
+# How many nearest resumes to pull per JD before full scoring
+DEFAULT_SHORTLIST_SIZE = 200
+
+
+def retrieve_and_rank(
+    job: JobProfile,
+    index: VectorIndex,
+    candidates: Union[Mapping[str, dict], Callable[[str], dict]],
+    shortlist_size: int = DEFAULT_SHORTLIST_SIZE,
+    top_n: int = None,
+    nprobe: int = None,
+    weights: dict = None
+) -> List[dict]:
+    """
+    Retrieves the `shortlist_size` resumes nearest to the JD embedding and
+    runs the full weighted scoring only on those.
+
+    `candidates` maps resume ID -> candidate dict ("clean_text", "profile"),
+    either as a mapping or a loader function. The stored index vectors are
+    reused as the semantic embeddings, so nothing is re-encoded.
+    Returns dicts sorted by final score: id, final, skills, experience,
+    education, keywords, semantic.
+    """
+    if job.embedding is None:
+        raise ValueError("JobProfile has no embedding; build it with with_embedding=True")
+
+    hits = index.search(job.embedding, k=shortlist_size, nprobe=nprobe)
+    if not hits:
+        return []
+
+    load = candidates if callable(candidates) else candidates.__getitem__
+    ids = [resume_id for resume_id, _ in hits]
+    shortlist = [load(resume_id) for resume_id in ids]
+
+    scores = score_matrix(
+        [job],
+        shortlist,
+        candidate_embeddings=index.get_vectors(ids),
+        corpus=job.corpus,
+        weights=weights
+    )
+
+    ranked = [
+        {"id": resume_id, **{name: float(matrix[0, i]) for name, matrix in scores.items()}}
+        for i, resume_id in enumerate(ids)
+    ]
+    ranked.sort(key=lambda r: r["final"], reverse=True)
+
+    return ranked[:top_n] if top_n else ranked
@@ -0,0 +1,217 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from nlp.taxonomy import get_taxonomy
+
+_EMPTY = np.zeros(0, dtype=np.int32)
+
+
+def _npz_path(path: str) -> str:
+    """
+    np.savez appends ".npz" when missing; load() must look for the same file.
+    """
+    return path if path.endswith(".npz") else path + ".npz"
+
+
+def normalize_skill(skill: str) -> str:
+    skill = skill.strip().lower()
+    return get_taxonomy().synonyms.get(skill, skill)
+
+
+class SkillIndex:
+    """
+    Inverted index: normalized skill -> sorted int32 posting list of
+    candidate rows.
+
+    Resume IDs are mapped to increasing row numbers, so appending a new
+    resume keeps every posting list sorted and boolean queries are plain
+    NumPy set operations on sorted arrays. Re-adding an ID replaces the
+    old entry; deletes are tombstones until compact().
+    """
+
+    def __init__(self):
+        self._ids: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        self._alive = np.zeros(0, dtype=bool)
+
+        self._postings: Dict[str, np.ndarray] = {}
+        self._pending: Dict[str, List[int]] = {}   # rows appended since the last merge
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._row_of
+
+    @property
+    def skills(self) -> List[str]:
+        return sorted(set(self._postings) | set(self._pending))
+
+    # -------------------------
+    # Updates
+    # -------------------------
+    def add(self, resume_id: str, skills: Iterable[str]) -> None:
+        self.add_many([(resume_id, skills)])
+
+    def add_many(self, items: Iterable[Tuple[str, Iterable[str]]]) -> None:
+        """
+        Indexes (resume_id, skills) pairs, e.g. straight from profile["skills"].
+        """
+        items = list(items)
+        self.delete(resume_id for resume_id, _ in items)
+
+        start = len(self._ids)
+        alive = np.zeros(start + len(items), dtype=bool)
+        alive[:start] = self._alive
+        alive[start:] = True
+        self._alive = alive
+
+        for row, (resume_id, skills) in enumerate(items, start=start):
+            if resume_id in self._row_of:
+                # Same ID twice in one batch: the later entry wins
+                self._alive[self._row_of[resume_id]] = False
+            self._ids.append(resume_id)
+            self._row_of[resume_id] = row
+            for skill in {normalize_skill(s) for s in skills}:
+                self._pending.setdefault(skill, []).append(row)
+
+    def delete(self, resume_ids: Iterable[str]) -> None:
+        for resume_id in resume_ids:
+            row = self._row_of.pop(resume_id, None)
+            if row is not None:
+                self._alive[row] = False
+
+    def compact(self) -> None:
+        """
+        Drops deleted candidates and renumbers the remaining rows.
+        """
+        self._merge_pending()
+        keep = np.flatnonzero(self._alive)
+
+        new_row = np.full(len(self._ids), -1, dtype=np.int32)
+        new_row[keep] = np.arange(len(keep), dtype=np.int32)
+
+        postings = {}
+        for skill, rows in self._postings.items():
+            rows = new_row[rows]
+            rows = rows[rows >= 0]
+            if len(rows):
+                postings[skill] = rows
+
+        self._postings = postings
+        self._ids = [self._ids[i] for i in keep]
+        self._row_of = {resume_id: i for i, resume_id in enumerate(self._ids)}
+        self._alive = np.ones(len(keep), dtype=bool)
+
+    # -------------------------
+    # Queries
+    # -------------------------
+    def query(
+        self,
+        all_of: Sequence[str] = (),
+        any_of: Sequence[str] = (),
+        none_of: Sequence[str] = ()
+    ) -> List[str]:
+        """
+        Candidate IDs having every skill in `all_of`, at least one in
+        `any_of` (if given) and none in `none_of`, in indexing order.
+        e.g. query(all_of=["docker", "aws"], none_of=["java"])
+        """
+        rows = None
+
+        for skill in all_of:
+            posting = self.posting(skill)
+            rows = posting if rows is None else np.intersect1d(rows, posting, assume_unique=True)
+
+        if any_of:
+            union = self._union(any_of)
+            rows = union if rows is None else np.intersect1d(rows, union, assume_unique=True)
+
+        if rows is None:
+            rows = np.flatnonzero(self._alive).astype(np.int32)
+
+        if none_of:
+            rows = np.setdiff1d(rows, self._union(none_of), assume_unique=True)
+
+        return [self._ids[r] for r in rows if self._alive[r]]
+
+    def coverage(self, jd_skills: Sequence[str], top_n: Optional[int] = None, min_percent: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Ranks candidates by the share of JD skills they have, as
+        (resume_id, percent) with the same rounding as calculate_match_score.
+        Candidates with none of the skills are left out.
+        """
+        jd_skills = {normalize_skill(s) for s in jd_skills}
+        if not jd_skills:
+            return []
+
+        postings = [self.posting(skill) for skill in jd_skills]
+        counts = np.bincount(np.concatenate(postings), minlength=len(self._ids))
+        counts[~self._alive] = 0
+
+        percent = counts / len(jd_skills) * 100
+        rows = np.flatnonzero((counts > 0) & (percent >= min_percent))
+        rows = rows[np.argsort(-counts[rows], kind="stable")]
+        if top_n is not None:
+            rows = rows[:top_n]
+
+        return [(self._ids[r], round(float(percent[r]), 2)) for r in rows]
+
+    def posting(self, skill: str) -> np.ndarray:
+        """
+        Sorted rows of everyone indexed with `skill` (deleted rows included;
+        query() and coverage() filter them).
+        """
+        skill = normalize_skill(skill)
+        if skill in self._pending:
+            self._merge_pending(skill)
+        return self._postings.get(skill, _EMPTY)
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+    def save(self, path: str) -> None:
+        """
+        Writes the index as one npz: all posting lists concatenated, with
+        per-skill offsets (CSR layout).
+        """
+        self.compact()
+        skills = sorted(self._postings)
+        lengths = [len(self._postings[s]) for s in skills]
+
+        np.savez(
+            _npz_path(path),
+            ids=np.array(self._ids, dtype=str),
+            skills=np.array(skills, dtype=str),
+            offsets=np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+            rows=np.concatenate([self._postings[s] for s in skills]) if skills else _EMPTY
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "SkillIndex":
+        data = np.load(_npz_path(path))
+        index = cls()
+
+        index._ids = data["ids"].tolist()
+        index._row_of = {resume_id: i for i, resume_id in enumerate(index._ids)}
+        index._alive = np.ones(len(index._ids), dtype=bool)
+
+        offsets, rows = data["offsets"], data["rows"]
+        for i, skill in enumerate(data["skills"].tolist()):
+            index._postings[skill] = rows[offsets[i]:offsets[i + 1]]
+
+        return index
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    def _union(self, skills: Sequence[str]) -> np.ndarray:
+        postings = [self.posting(skill) for skill in skills]
+        return np.unique(np.concatenate(postings)) if postings else _EMPTY
+
+    def _merge_pending(self, skill: Optional[str] = None) -> None:
+        for name in [skill] if skill is not None else list(self._pending):
+            appended = np.asarray(self._pending.pop(name), dtype=np.int32)
+            existing = self._postings.get(name)
+            self._postings[name] = appended if existing is None else np.concatenate([existing, appended])
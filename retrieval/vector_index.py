@@ -0,0 +1,264 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Below this many vectors the index stays a flat (exact) scan
+MIN_TRAIN_SIZE = 1000
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+# Retrain once the index outgrows the size it was clustered at by this factor,
+# so lists stay ~sqrt(n) long (amortized O(1) retraining per added vector)
+RETRAIN_GROWTH = 2.0
+
+
+def _grown(array: np.ndarray, size: int) -> np.ndarray:
+    """
+    `array` with room for at least `size` rows (capacity doubles).
+    """
+    if size <= len(array):
+        return array
+    grown = np.zeros((max(size, 2 * len(array)),) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+def _npz_path(path: str) -> str:
+    """
+    np.savez appends ".npz" when missing; load() must look for the same file.
+    """
+    return path if path.endswith(".npz") else path + ".npz"
+
+
+def _normalized(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class VectorIndex:
+    """
+    Local, pure-NumPy IVF index over L2-normalized embeddings (cosine).
+
+    Vectors are clustered into `n_lists` inverted lists with spherical
+    k-means; a query only scans the `nprobe` lists whose centroids are
+    closest. Until MIN_TRAIN_SIZE vectors exist, search is an exact scan.
+
+    Resumes are addressed by string ID: add() with an existing ID replaces
+    it, delete() tombstones it (compact() reclaims the space).
+    """
+
+    def __init__(self, dim: int, n_lists: Optional[int] = None, nprobe: int = 16):
+        self.dim = dim
+        self.n_lists = n_lists
+        self._fixed_lists = n_lists     # None -> sized from the data at each train()
+        self._trained_size = 0
+        self.nprobe = nprobe
+
+        # Row buffers grow geometrically; only the first len(self._ids) rows are used
+        self._buffer = np.zeros((0, dim), dtype=np.float32)
+        self._ids: List[str] = []
+        self._alive = np.zeros(0, dtype=bool)
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._row_of: Dict[str, int] = {}
+
+        self.centroids: Optional[np.ndarray] = None
+        self._lists: Optional[List[np.ndarray]] = None   # rebuilt lazily after changes
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    @property
+    def _vectors(self) -> np.ndarray:
+        return self._buffer[:len(self._ids)]
+
+    # -------------------------
+    # Updates
+    # -------------------------
+    def add(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        ids = list(ids)
+        vectors = _normalized(vectors)
+        if vectors.shape != (len(ids), self.dim):
+            raise ValueError(f"Expected {len(ids)} x {self.dim} vectors, got {vectors.shape}")
+
+        if len(set(ids)) < len(ids):
+            # Same ID twice in one batch: the later entry wins
+            keep = sorted({resume_id: i for i, resume_id in enumerate(ids)}.values())
+            ids = [ids[i] for i in keep]
+            vectors = vectors[keep]
+
+        self.delete([i for i in ids if i in self._row_of])
+
+        start, end = len(self._ids), len(self._ids) + len(ids)
+        self._buffer = _grown(self._buffer, end)
+        self._alive = _grown(self._alive, end)
+        self._assign = _grown(self._assign, end)
+
+        self._buffer[start:end] = vectors
+        self._alive[start:end] = True
+        self._ids.extend(ids)
+        self._row_of.update((resume_id, start + i) for i, resume_id in enumerate(ids))
+
+        if self.centroids is not None:
+            self._assign[start:end] = self._nearest_centroid(vectors)
+            if len(self) > RETRAIN_GROWTH * self._trained_size:
+                self.train()
+        elif len(self) >= MIN_TRAIN_SIZE:
+            self.train()
+
+        self._lists = None
+
+    def delete(self, ids: Iterable[str]) -> None:
+        for resume_id in ids:
+            row = self._row_of.pop(resume_id, None)
+            if row is not None:
+                self._alive[row] = False
+        self._lists = None
+
+    def compact(self) -> None:
+        """
+        Drops deleted rows from memory.
+        """
+        keep = np.flatnonzero(self._alive[:len(self._ids)])
+
+        self._buffer = self._vectors[keep]
+        self._assign = self._assign[keep]
+        self._ids = [self._ids[i] for i in keep]
+        self._alive = np.ones(len(keep), dtype=bool)
+        self._row_of = {resume_id: i for i, resume_id in enumerate(self._ids)}
+        self._lists = None
+
+    def train(self, seed: int = 0) -> None:
+        """
+        (Re)clusters all live vectors into inverted lists.
+        """
+        self.compact()
+        n = len(self._ids)
+        if n == 0:
+            return
+
+        n_lists = self._fixed_lists or max(1, int(4 * np.sqrt(n)))
+        n_lists = min(n_lists, n)
+        rng = np.random.default_rng(seed)
+
+        sample_size = min(n, n_lists * KMEANS_SAMPLE_PER_LIST)
+        sample = self._vectors[rng.choice(n, sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            empty = np.bincount(labels, minlength=n_lists) == 0
+            sums[empty] = centroids[empty]
+            centroids = _normalized(sums)
+
+        self.centroids = centroids
+        self.n_lists = n_lists
+        self._trained_size = n
+        self._assign = self._nearest_centroid(self._vectors)
+        self._lists = None
+
+    # -------------------------
+    # Search
+    # -------------------------
+    def search(self, query: np.ndarray, k: int = 10, nprobe: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Top-k (resume_id, cosine similarity) for one query embedding.
+        """
+        return self.search_many(query, k, nprobe)[0]
+
+    def search_many(self, queries: np.ndarray, k: int = 10, nprobe: Optional[int] = None) -> List[List[Tuple[str, float]]]:
+        queries = _normalized(queries)
+        nprobe = nprobe or self.nprobe
+        results = []
+
+        for query in queries:
+            if self.centroids is None:
+                rows = np.flatnonzero(self._alive[:len(self._ids)])
+            else:
+                lists = self._inverted_lists()
+                probe = np.argsort(-(self.centroids @ query))[:nprobe]
+                rows = np.concatenate([lists[i] for i in probe])
+
+            scores = self._vectors[rows] @ query
+            top = min(k, len(rows))
+            if top == 0:
+                results.append([])
+                continue
+
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            results.append([(self._ids[rows[i]], float(scores[i])) for i in best])
+
+        return results
+
+    def exact_search(self, query: np.ndarray, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Brute-force reference search over all live vectors.
+        """
+        query = _normalized(query)[0]
+        rows = np.flatnonzero(self._alive[:len(self._ids)])
+        scores = self._vectors[rows] @ query
+        best = np.argsort(-scores, kind="stable")[:k]
+        return [(self._ids[rows[i]], float(scores[i])) for i in best]
+
+    def get_vectors(self, ids: Sequence[str]) -> np.ndarray:
+        return self._vectors[[self._row_of[i] for i in ids]]
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+    def save(self, path: str) -> None:
+        self.compact()
+        np.savez(
+            _npz_path(path),
+            dim=self.dim,
+            nprobe=self.nprobe,
+            n_lists=self.n_lists or 0,
+            fixed_lists=self._fixed_lists or 0,
+            trained_size=self._trained_size,
+            vectors=self._vectors,
+            ids=np.array(self._ids, dtype=str),
+            centroids=self.centroids if self.centroids is not None else np.zeros((0, self.dim), dtype=np.float32),
+            assign=self._assign[:len(self._ids)]
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "VectorIndex":
+        data = np.load(_npz_path(path))
+
+        # Files from before retraining did not record whether n_lists was fixed
+        fixed_lists = int(data["fixed_lists"]) if "fixed_lists" in data else 0
+        index = cls(int(data["dim"]), n_lists=fixed_lists or None, nprobe=int(data["nprobe"]))
+        index._buffer = data["vectors"]
+        index._ids = data["ids"].tolist()
+        index._alive = np.ones(len(index._ids), dtype=bool)
+        index._assign = np.zeros(len(index._ids), dtype=np.int32)
+        index._row_of = {resume_id: i for i, resume_id in enumerate(index._ids)}
+
+        if len(data["centroids"]):
+            index.centroids = data["centroids"]
+            index.n_lists = int(data["n_lists"])
+            index._assign = data["assign"]
+            index._trained_size = int(data["trained_size"]) if "trained_size" in data else len(index._ids)
+
+        return index
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    def _nearest_centroid(self, vectors: np.ndarray, chunk: int = 8192) -> np.ndarray:
+        labels = [
+            np.argmax(vectors[i:i + chunk] @ self.centroids.T, axis=1)
+            for i in range(0, len(vectors), chunk)
+        ]
+        return np.concatenate(labels).astype(np.int32) if labels else np.zeros(0, dtype=np.int32)
+
+    def _inverted_lists(self) -> List[np.ndarray]:
+        if self._lists is None:
+            live = np.flatnonzero(self._alive[:len(self._ids)])
+            order = live[np.argsort(self._assign[live], kind="stable")]
+            counts = np.bincount(self._assign[live], minlength=self.n_lists)
+            self._lists = np.split(order, np.cumsum(counts)[:-1])
+        return self._lists
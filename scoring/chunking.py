@@ -0,0 +1,114 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from nlp.extractor import split_into_sections
+
+# all-MiniLM-L6-v2 reads at most 256 word pieces (~190 words of resume
+# text); chunks stay below that so nothing is cut off
+CHUNK_WORDS = 150
+CHUNK_STRIDE = 100
+
+CHUNKING_MODES = ("section", "window")
+POOLING_METHODS = ("max", "mean", "best")
+
+
+# -------------------------
+# Chunking
+# -------------------------
+def window_chunks(words: Sequence[str], size: int = CHUNK_WORDS, stride: int = CHUNK_STRIDE) -> List[str]:
+    """
+    Overlapping windows of `size` words every `stride` words; the last
+    window ends at the last word.
+    """
+    if len(words) <= size:
+        return [" ".join(words)]
+
+    starts = list(range(0, len(words) - size, stride)) + [len(words) - size]
+    return [" ".join(words[start:start + size]) for start in starts]
+
+
+def section_chunks(text: str, size: int = CHUNK_WORDS, stride: int = CHUNK_STRIDE) -> List[str]:
+    """
+    One chunk per resume section (split_into_sections), with the text
+    before the first header as its own piece. Consecutive short sections
+    are packed together up to `size` words; longer ones are windowed.
+    """
+    sections = split_into_sections(text)
+    if not sections.spans:
+        return window_chunks(text.split(), size, stride)
+
+    pieces = [text[:sections.spans[0][1]]] + [text[start:end] for _, start, end in sections.spans]
+
+    chunks, current = [], []
+    for piece in pieces:
+        words = piece.split()
+        if len(current) + len(words) > size and current:
+            chunks.append(" ".join(current))
+            current = []
+        if len(words) > size:
+            chunks.extend(window_chunks(words, size, stride))
+        else:
+            current.extend(words)
+
+    if current or not chunks:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def chunk_text(text: str, mode: str = "section", size: int = CHUNK_WORDS, stride: int = CHUNK_STRIDE) -> List[str]:
+    if mode == "section":
+        return section_chunks(text, size, stride)
+    if mode == "window":
+        return window_chunks(text.split(), size, stride)
+    raise ValueError(f"Unknown chunking mode '{mode}' (expected one of {CHUNKING_MODES})")
+
+
+def chunk_documents(texts: Sequence[str], mode: str = "section") -> Tuple[List[str], np.ndarray]:
+    """
+    All chunks of all documents, flattened, plus offsets[i] = index of
+    document i's first chunk (every document has at least one chunk).
+    """
+    chunks, counts = [], []
+    for text in texts:
+        doc_chunks = chunk_text(text, mode)
+        chunks.extend(doc_chunks)
+        counts.append(len(doc_chunks))
+
+    offsets = np.zeros(len(counts), dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    return chunks, offsets
+
+
+# -------------------------
+# Pooling (one reduceat per operation)
+# -------------------------
+def _normalized(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def pool_chunks(chunk_embeddings: np.ndarray, offsets: np.ndarray, method: str = "max") -> np.ndarray:
+    """
+    One vector per document from its (L2-normalized) chunk vectors:
+    element-wise max or mean.
+    """
+    chunks = _normalized(chunk_embeddings)
+
+    if method == "max":
+        return np.maximum.reduceat(chunks, offsets, axis=0)
+    if method == "mean":
+        counts = np.diff(np.r_[offsets, len(chunks)])
+        return np.add.reduceat(chunks, offsets, axis=0) / counts[:, None]
+    raise ValueError(f"Unknown pooling '{method}' (expected 'max' or 'mean')")
+
+
+def best_chunk_similarity(chunk_embeddings: np.ndarray, offsets: np.ndarray, query_embedding: np.ndarray) -> np.ndarray:
+    """
+    Per document, the cosine similarity of its best-matching chunk to the
+    query (e.g. the JD).
+    """
+    similarities = _normalized(chunk_embeddings) @ _normalized(query_embedding[None, :])[0]
+    return np.maximum.reduceat(similarities, offsets)
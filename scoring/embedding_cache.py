@@ -0,0 +1,402 @@
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# -------------------------
+# Safe file-lock import (POSIX only)
+# -------------------------
+try:
+    import fcntl
+    LOCKING_AVAILABLE = True
+except ImportError:
+    fcntl = None
+    LOCKING_AVAILABLE = False
+
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("RESUME_SCREENER_CACHE_DIR", ".cache"),
+    "embeddings"
+)
+DEFAULT_MAX_ENTRIES = 20000
+
+# Read-only use still records LRU order: pending touches are written to
+# the journal once this many have piled up (and on every put_many)
+TOUCH_FLUSH_EVERY = 256
+
+# The journal is folded into index.json once it outgrows the index itself
+# (and at least this many bytes), so each write costs O(batch), amortized
+COMPACT_MIN_BYTES = 1024 * 1024
+
+
+def embedding_key(text: str, model_name: str) -> str:
+    """
+    Content address of one embedding: hash of model name + cleaned text.
+    """
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EmbeddingStore:
+    """
+    On-disk, content-addressed store of float32 embedding vectors.
+
+    Layout inside `cache_dir`:
+    - vectors.f32   : memory-mapped (max_entries x dim) float32 array
+    - index.json    : {key: [slot, last_used]} plus dim / capacity
+    - index.journal : JSON lines of changes made since index.json was written
+    - .lock         : fcntl lock file (shared for reads, exclusive for writes)
+
+    Writes append to the journal; other processes replay only the lines
+    they haven't seen. When the store is full, the least recently used
+    entries are evicted and their slots reused. Reads bump an entry's
+    recency in the shared journal too (batched, see TOUCH_FLUSH_EVERY), so
+    eviction order is least recently used across processes.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.journal_path = os.path.join(cache_dir, "index.journal")
+        self.vectors_path = os.path.join(cache_dir, "vectors.f32")
+        self.lock_path = os.path.join(cache_dir, ".lock")
+
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0        # vectors not stored because the batch exceeded capacity
+
+        self._dim = None
+        self._entries = {}      # key -> [slot, last_used]
+        self._owner: Dict[int, str] = {}       # slot -> key
+        self._free = set(range(max_entries))
+        self._clock = 0
+        self._index_mtime = None
+        self._index_bytes = 0
+        self._journal_offset = 0                # journal bytes already applied
+        self._vectors = None
+        self._touched: Dict[str, int] = {}     # key -> clock of reads not yet in the journal
+        self._mutex = threading.Lock()
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Returns {key: vector} for every key present in the store.
+        """
+        found = {}
+
+        with self._mutex, self._file_lock(exclusive=False):
+            self._refresh_index()
+
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                    continue
+
+                self._clock += 1
+                entry[1] = self._clock
+                self._touched[key] = self._clock
+                found[key] = np.array(self._vectors[entry[0]], dtype=np.float32)
+                self.hits += 1
+
+            flush = len(self._touched) >= TOUCH_FLUSH_EVERY
+
+        if flush:
+            with self._mutex, self._file_lock(exclusive=True):
+                self._refresh_index()
+                self._append_journal({})
+
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """
+        Stores vectors, evicting least recently used entries if needed.
+        """
+        if not items:
+            return
+
+        with self._mutex, self._file_lock(exclusive=True):
+            self._refresh_index()
+
+            dim = int(len(next(iter(items.values()))))
+            if self._dim is None:
+                self._dim = dim
+            elif dim != self._dim:
+                raise ValueError(f"Expected {self._dim}-dim vectors, got {dim}")
+            self._open_vectors(create=True)
+
+            new_keys = [k for k in items if k not in self._entries]
+            free_slots = self._free_slots(len(new_keys), protected=items)
+
+            written = {}
+            dropped = 0
+            for key, vector in items.items():
+                entry = self._entries.get(key)
+                if entry is None:
+                    if not free_slots:
+                        dropped += 1
+                        continue
+                    entry = self._assign(key, free_slots.pop(), 0)
+
+                self._clock += 1
+                entry[1] = self._clock
+                self._vectors[entry[0]] = np.asarray(vector, dtype=np.float32)
+                written[key] = entry
+
+            if dropped:
+                self.dropped += dropped
+                logging.warning(
+                    f"Embedding store full: {dropped} of {len(items)} vectors not cached "
+                    f"(max_entries={self.max_entries})"
+                )
+
+            self._vectors.flush()
+            if os.path.exists(self.index_path):
+                self._append_journal(written)
+            else:
+                self._write_index()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "dropped": self.dropped
+        }
+
+    def clear(self) -> None:
+        with self._mutex, self._file_lock(exclusive=True):
+            for path in (self.index_path, self.journal_path, self.vectors_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+            self._dim = None
+            self._entries = {}
+            self._owner = {}
+            self._free = set(range(self.max_entries))
+            self._clock = 0
+            self._index_mtime = None
+            self._index_bytes = 0
+            self._journal_offset = 0
+            self._vectors = None
+            self._touched = {}
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    def _free_slots(self, needed: int, protected=()) -> List[int]:
+        """
+        Up to `needed` free slots, evicting least recently used entries
+        (never one of the `protected` keys, i.e. the batch being written).
+        """
+        free = list(itertools.islice(self._free, needed))
+
+        if len(free) < needed:
+            # Evict least recently used entries to make room
+            oldest = heapq.nsmallest(
+                needed - len(free),
+                (kv for kv in self._entries.items() if kv[0] not in protected),
+                key=lambda kv: kv[1][1]
+            )
+            for key, (slot, _) in oldest:
+                del self._entries[key]
+                del self._owner[slot]
+                self._free.add(slot)
+                free.append(slot)
+
+        return free
+
+    def _assign(self, key: str, slot: int, last_used: int) -> list:
+        """
+        Points `key` at `slot`, dropping whichever key held the slot before.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] == slot:
+                entry[1] = max(entry[1], last_used)
+                return entry
+            del self._owner[entry[0]]
+            self._free.add(entry[0])
+
+        previous = self._owner.get(slot)
+        if previous is not None:
+            del self._entries[previous]
+
+        entry = [slot, last_used]
+        self._entries[key] = entry
+        self._owner[slot] = key
+        self._free.discard(slot)
+        return entry
+
+    def _refresh_index(self) -> None:
+        """
+        Reloads the index if another process rewrote it since we last read
+        it, then applies journal lines we haven't seen yet.
+        """
+        if not os.path.exists(self.index_path):
+            return
+
+        stat = os.stat(self.index_path)
+        try:
+            journal_size = os.path.getsize(self.journal_path)
+        except OSError:
+            journal_size = 0
+
+        if stat.st_mtime_ns != self._index_mtime or journal_size < self._journal_offset:
+            self._load_index(stat)
+
+        if journal_size > self._journal_offset:
+            self._replay_journal()
+
+        # Reads made here since our last write still count
+        for key, clock in self._touched.items():
+            entry = self._entries.get(key)
+            if entry is not None and clock > entry[1]:
+                entry[1] = clock
+
+    def _load_index(self, stat: os.stat_result) -> None:
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        # The on-disk layout wins over the constructor argument
+        self.max_entries = data["capacity"]
+        self._dim = data["dim"]
+        self._clock = max(self._clock, data.get("clock", 0))
+        self._entries = {k: list(v) for k, v in data["entries"].items()}
+        self._owner = {slot: key for key, (slot, _) in self._entries.items()}
+        self._free = set(range(self.max_entries)) - set(self._owner)
+        self._index_mtime = stat.st_mtime_ns
+        self._index_bytes = stat.st_size
+        self._journal_offset = 0
+        self._open_vectors(create=False)
+
+    def _replay_journal(self) -> None:
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._journal_offset)
+            data = f.read()
+
+        # Only whole lines: a torn last line is the tail of a crashed write
+        complete = data[:data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            try:
+                change = json.loads(line)
+            except ValueError:
+                continue
+            self._clock = max(self._clock, change.get("clock", 0))
+            for key, (slot, last_used) in change.get("set", {}).items():
+                self._assign(key, slot, last_used)
+            for key, clock in change.get("touch", {}).items():
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry[1] = max(entry[1], clock)
+
+        self._journal_offset += len(complete)
+
+    def _open_vectors(self, create: bool) -> None:
+        if self._vectors is not None:
+            return
+
+        exists = os.path.exists(self.vectors_path)
+        if not exists and not create:
+            self._entries = {}
+            return
+
+        self._vectors = np.memmap(
+            self.vectors_path,
+            dtype=np.float32,
+            mode="r+" if exists else "w+",
+            shape=(self.max_entries, self._dim)
+        )
+
+    def _append_journal(self, written: Dict[str, list]) -> None:
+        """
+        Appends one change (new/rewritten entries plus pending touches) to
+        the journal; compacts it into index.json once it gets large.
+        Caller holds the exclusive lock and has just refreshed.
+        """
+        touched = {k: c for k, c in self._touched.items() if k in self._entries and k not in written}
+        change = {"clock": self._clock, "set": written, "touch": touched}
+
+        with open(self.journal_path, "ab") as f:
+            # Drop a torn line left by a writer that crashed mid-append
+            if f.tell() > self._journal_offset:
+                f.truncate(self._journal_offset)
+            f.write(json.dumps(change).encode("utf-8") + b"\n")
+            f.flush()
+            self._journal_offset = f.tell()
+        self._touched = {}
+
+        if self._journal_offset > max(COMPACT_MIN_BYTES, self._index_bytes):
+            self._write_index()
+
+    def _write_index(self) -> None:
+        data = {
+            "dim": self._dim,
+            "capacity": self.max_entries,
+            "clock": self._clock,
+            "entries": self._entries
+        }
+
+        # Write-then-rename so readers never see a half-written index
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.index_path)
+
+        # Everything in the journal is now in the index
+        open(self.journal_path, "wb").close()
+
+        stat = os.stat(self.index_path)
+        self._index_mtime = stat.st_mtime_ns
+        self._index_bytes = stat.st_size
+        self._journal_offset = 0
+        self._touched = {}
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        if not LOCKING_AVAILABLE:
+            yield
+            return
+
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+# -------------------------
+# Shared default store
+# -------------------------
+_default_store: Optional[EmbeddingStore] = None
+
+
+def get_embedding_store() -> EmbeddingStore:
+    global _default_store
+    if _default_store is None:
+        _default_store = EmbeddingStore()
+    return _default_store
+
+
+def embedding_cache_stats() -> dict:
+    return get_embedding_store().stats()
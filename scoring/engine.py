@@ -1,10 +1,20 @@
 from nlp.skills import extract_skills
+from scoring.job_profile import JobProfile
+from utils.profiler import profiled
 
-def calculate_match_score(profile: dict, jd_text: str) -> dict:
+@profiled("scoring.skill_match")
+def calculate_match_score(profile: dict, jd_text) -> dict:
+    """
+    `jd_text` may also be a JobProfile (skills already extracted) or a
+    DocumentAnalysis (nlp/analysis.py; skills extracted once and cached).
+    """
     resume_skills = set(profile.get("skills", []))
 
     # 🔑 Extract skills from JD as well
-    jd_skills = set(extract_skills(jd_text))
+    if isinstance(jd_text, JobProfile):
+        jd_skills = set(jd_text.skills)
+    else:
+        jd_skills = set(extract_skills(jd_text))
 
     matched = list(resume_skills & jd_skills)
     missing = list(jd_skills - resume_skills)
@@ -1,4 +1,19 @@
 # scoring/final_score.py
+import numpy as np
+
+from scoring.job_profile import JobProfile
+from utils.profiler import profiled
+
+
+SIGNALS = ("skills", "experience", "education", "keywords")
+
+DEFAULT_WEIGHTS = {
+    "skills": 0.5,
+    "experience": 0.3,
+    "education": 0.1,
+    "keywords": 0.1
+}
+
 
 def compute_final_score(
     skill_match_percent: float,
@@ -17,58 +32,151 @@ def compute_final_score(
     - experience: 30%
     - education: 10%
     - keywords: 10%
+
+    Per-candidate view over compute_final_scores_batch (same numbers).
     """
 
     if weights is None:
-        weights = {
-            "skills": 0.5,
-            "experience": 0.3,
-            "education": 0.1,
-            "keywords": 0.1
-        }
+        weights = dict(DEFAULT_WEIGHTS)
+
+    components = component_scores(
+        skill_match_percent,
+        experience_years,
+        required_experience,
+        has_required_degree,
+        keyword_similarity
+    )
+    final_score = compute_final_scores_batch(
+        skill_match_percent,
+        experience_years,
+        required_experience,
+        has_required_degree,
+        keyword_similarity,
+        weights=weights
+    )[0]
+
+    return {
+    "final_match_percent": float(round(float(final_score), 2)),
+    "breakdown": {
+        name: float(round(float(components[name]), 2)) for name in SIGNALS
+    },
+    "weights_used": weights
+}
+
+
+def component_scores(
+    skill_match_percent,
+    experience_years,
+    required_experience,
+    has_required_degree,
+    keyword_similarity
+) -> dict:
+    """
+    Per-signal scores (0–100) as float64 arrays. Inputs can be scalars
+    or arrays of any broadcastable shape.
+    """
 
     # -------------------
     # 1. Skill score
     # -------------------
-    skill_score = skill_match_percent
+    skill_score = np.asarray(skill_match_percent, dtype=np.float64)
 
     # -------------------
-    # 2. Experience score
+    # 2. Experience score (neutral 50 if JD doesn't specify)
     # -------------------
-    if required_experience > 0:
-        exp_ratio = min(experience_years / required_experience, 1)
-        experience_score = exp_ratio * 100
-    else:
-        experience_score = 50  # neutral if JD doesn't specify
+    years = np.asarray(experience_years, dtype=np.float64)
+    required = np.asarray(required_experience, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exp_ratio = np.minimum(years / required, 1)
+    experience_score = np.where(required > 0, exp_ratio * 100, 50.0)
 
     # -------------------
     # 3. Education score
     # -------------------
-    education_score = 100 if has_required_degree else 50
+    education_score = np.where(np.asarray(has_required_degree, dtype=bool), 100.0, 50.0)
 
     # -------------------
     # 4. Keyword score
     # -------------------
-    keyword_score = keyword_similarity
+    keyword_score = np.asarray(keyword_similarity, dtype=np.float64)
 
-    # -------------------
-    # Final weighted score
-    # -------------------
-    final_score = (
-        skill_score * weights["skills"] +
-        experience_score * weights["experience"] +
-        education_score * weights["education"] +
-        keyword_score * weights["keywords"]
+    arrays = np.broadcast_arrays(skill_score, experience_score, education_score, keyword_score)
+    return dict(zip(SIGNALS, arrays))
+
+
+def weight_matrix(weights=None) -> np.ndarray:
+    """
+    (n_weights x 4) array from None (defaults), one weights dict,
+    a list of weights dicts, or an array already in SIGNALS order.
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    if isinstance(weights, dict):
+        weights = [weights]
+    if isinstance(weights, np.ndarray):
+        return np.atleast_2d(weights).astype(np.float64)
+
+    return np.array([[w[name] for name in SIGNALS] for w in weights], dtype=np.float64)
+
+
+@profiled("scoring.final_batch")
+def compute_final_scores_batch(
+    skill_match_percent,
+    experience_years,
+    required_experience,
+    has_required_degree,
+    keyword_similarity,
+    weights=None
+) -> np.ndarray:
+    """
+    Vectorized compute_final_score for many candidates and many weight
+    vectors at once. Signal inputs are scalars or arrays (broadcastable
+    to one shape S); `weights` is anything weight_matrix() accepts.
+
+    Returns an (n_weights, *S) array of unrounded final scores,
+    e.g. (n_weights x n_candidates) for 1-D signals.
+    """
+    components = component_scores(
+        skill_match_percent,
+        experience_years,
+        required_experience,
+        has_required_degree,
+        keyword_similarity
     )
+    w = weight_matrix(weights)
 
-    return {
-    "final_match_percent": float(round(final_score, 2)),
-    "breakdown": {
-        "skills": float(round(skill_score, 2)),
-        "experience": float(round(experience_score, 2)),
-        "education": float(round(education_score, 2)),
-        "keywords": float(round(keyword_score, 2))
-    },
-    "weights_used": weights
-}
+    shape = components["skills"].shape
+    columns = [w[:, i].reshape((-1,) + (1,) * len(shape)) for i in range(len(SIGNALS))]
+
+    # Same operation order as the scalar formula, so results are bit-identical
+    return (
+        components["skills"] * columns[0] +
+        components["experience"] * columns[1] +
+        components["education"] * columns[2] +
+        components["keywords"] * columns[3]
+    )
 
+
+@profiled("scoring.final")
+def compute_final_score_for_job(
+    job: JobProfile,
+    profile: dict,
+    skill_match_percent: float,
+    semantic_similarity: float,
+    keyword_similarity: float,
+    weights: dict = None
+) -> dict:
+    """
+    compute_final_score with the JD-side inputs (required experience,
+    degree requirement) taken from a prebuilt JobProfile.
+    """
+    return compute_final_score(
+        skill_match_percent=skill_match_percent,
+        semantic_similarity=semantic_similarity,
+        experience_years=profile["experience_years"],
+        required_experience=job.required_experience,
+        has_required_degree=job.has_required_degree(profile),
+        keyword_similarity=keyword_similarity,
+        weights=weights
+    )
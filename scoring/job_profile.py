@@ -0,0 +1,131 @@
+import json
+from typing import List, Optional
+
+import numpy as np
+
+from processing.cleaner import clean_text
+from processing.parser import extract_required_experience
+from nlp.analysis import analyze_document
+from nlp.skills import extract_skills, extract_degrees
+from scoring.keyword_corpus import KeywordCorpus
+from utils.profiler import profiled
+
+# Degree checked when the JD doesn't name one (the long-standing default)
+DEFAULT_REQUIRED_DEGREES = ["btech"]
+
+
+class JobProfile:
+    """
+    Everything about a JD that scoring needs, computed once and reused
+    for every candidate: skills, required experience, degree requirements,
+    SBERT embedding and (per keyword corpus) the TF-IDF vector.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        skills: List[str],
+        required_experience: int,
+        required_degrees: List[str],
+        embedding: Optional[np.ndarray] = None,
+        corpus: Optional[KeywordCorpus] = None
+    ):
+        self.text = text
+        self.skills = skills
+        self.required_experience = required_experience
+        self.required_degrees = required_degrees
+        self.embedding = embedding
+        self.corpus = corpus
+
+        # (corpus, corpus version, JD row), replaced as one value so
+        # concurrent readers never see a row paired with the wrong key
+        self._tfidf = None
+
+    @classmethod
+    @profiled("scoring.job_profile")
+    def build(cls, jd_text: str, corpus: Optional[KeywordCorpus] = None, with_embedding: bool = True) -> "JobProfile":
+        """
+        Builds the profile from raw JD text (cleaned here).
+        `corpus` is an optional pre-fitted keyword corpus to keep with the JD.
+        """
+        clean_jd = clean_text(jd_text)
+        analysis = analyze_document(clean_jd)
+
+        embedding = None
+        if with_embedding:
+            # Imported here: scoring.similarity itself accepts JobProfile
+            from scoring.similarity import encode_texts
+            embedding = encode_texts([clean_jd])[0]
+
+        return cls(
+            text=clean_jd,
+            skills=extract_skills(analysis),
+            required_experience=extract_required_experience(clean_jd),
+            required_degrees=extract_degrees(analysis) or list(DEFAULT_REQUIRED_DEGREES),
+            embedding=embedding,
+            corpus=corpus
+        )
+
+    # -------------------------
+    # Derived values
+    # -------------------------
+    def tfidf_vector(self, corpus: Optional[KeywordCorpus] = None):
+        """
+        The JD's TF-IDF row under `corpus` (default: the profile's own corpus).
+        Cached only for the profile's own corpus, once per corpus version;
+        any other (e.g. per-batch) corpus gets a fresh row.
+        """
+        corpus = corpus or self.corpus
+        if corpus is not self.corpus:
+            return corpus.transform([self.text])
+
+        # The corpus object itself (not its id) is kept, so a replaced
+        # self.corpus can never match a stale row
+        cached = self._tfidf
+        version = corpus.version
+        if cached is not None and cached[0] is corpus and cached[1] == version:
+            return cached[2]
+
+        vector = corpus.transform([self.text])
+        self._tfidf = (corpus, version, vector)
+        return vector
+
+    def has_required_degree(self, profile: dict) -> bool:
+        education = profile.get("education", [])
+        return any(degree in education for degree in self.required_degrees)
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+    def to_dict(self) -> dict:
+        return {
+            "text": self.text,
+            "skills": self.skills,
+            "required_experience": self.required_experience,
+            "required_degrees": self.required_degrees,
+            "embedding": self.embedding.tolist() if self.embedding is not None else None,
+            "corpus": self.corpus.to_dict() if self.corpus is not None else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JobProfile":
+        embedding = data.get("embedding")
+        corpus = data.get("corpus")
+
+        return cls(
+            text=data["text"],
+            skills=data["skills"],
+            required_experience=data["required_experience"],
+            required_degrees=data["required_degrees"],
+            embedding=np.asarray(embedding, dtype=np.float32) if embedding is not None else None,
+            corpus=KeywordCorpus.from_dict(corpus) if corpus is not None else None
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "JobProfile":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
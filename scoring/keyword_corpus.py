@@ -0,0 +1,150 @@
+import json
+from typing import Dict, Iterable, List
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+class KeywordCorpus:
+    """
+    Corpus-level TF-IDF model with a shared vocabulary.
+
+    Uses the same tokenization, stop words and smoothed IDF as
+    TfidfVectorizer(stop_words="english"), but keeps raw document
+    frequencies so new documents can be added with partial_fit()
+    without refitting the whole pool.
+    """
+
+    def __init__(self):
+        # sklearn is slow to import, so only pay for it when a corpus is built
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        self.vocabulary: Dict[str, int] = {}
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self.n_docs = 0
+        # Bumped on every (partial_)fit, so cached JD rows can tell the corpus changed
+        self.version = 0
+
+        self._analyzer = TfidfVectorizer(stop_words="english").build_analyzer()
+        self._idf = None
+
+    # -------------------------
+    # Fitting
+    # -------------------------
+    def fit(self, docs: Iterable[str]) -> "KeywordCorpus":
+        self.vocabulary = {}
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self.n_docs = 0
+        return self.partial_fit(docs)
+
+    def partial_fit(self, docs: Iterable[str]) -> "KeywordCorpus":
+        """
+        Adds documents to the corpus statistics.
+        Unseen terms are appended to the vocabulary.
+        """
+        seen_ids = []
+
+        for doc in docs:
+            ids = []
+            for term in set(self._analyzer(doc)):
+                idx = self.vocabulary.get(term)
+                if idx is None:
+                    idx = len(self.vocabulary)
+                    self.vocabulary[term] = idx
+                ids.append(idx)
+
+            seen_ids.extend(ids)
+            self.n_docs += 1
+
+        if len(self.vocabulary) > len(self.doc_freq):
+            grown = np.zeros(len(self.vocabulary), dtype=np.int64)
+            grown[:len(self.doc_freq)] = self.doc_freq
+            self.doc_freq = grown
+
+        np.add.at(self.doc_freq, np.asarray(seen_ids, dtype=np.int64), 1)
+        self._idf = None
+        self.version += 1
+        return self
+
+    @property
+    def idf(self) -> np.ndarray:
+        # Smoothed IDF, identical to sklearn's default
+        if self._idf is None:
+            self._idf = np.log((1 + self.n_docs) / (1 + self.doc_freq)) + 1
+        return self._idf
+
+    # -------------------------
+    # Transform / scoring
+    # -------------------------
+    def transform(self, docs: Iterable[str]) -> csr_matrix:
+        """
+        Returns L2-normalized TF-IDF rows; out-of-vocabulary terms are ignored.
+        """
+        docs = list(docs)
+        rows, cols, counts = [], [], []
+
+        for row, doc in enumerate(docs):
+            term_counts = {}
+            for term in self._analyzer(doc):
+                idx = self.vocabulary.get(term)
+                if idx is not None:
+                    term_counts[idx] = term_counts.get(idx, 0) + 1
+
+            rows.extend([row] * len(term_counts))
+            cols.extend(term_counts.keys())
+            counts.extend(term_counts.values())
+
+        idf = self.idf
+        values = np.asarray(counts, dtype=np.float64) * idf[np.asarray(cols, dtype=np.int64)]
+        matrix = csr_matrix(
+            (values, (rows, cols)),
+            shape=(len(docs), len(self.vocabulary))
+        )
+
+        norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A1
+        norms[norms == 0] = 1.0
+        return csr_matrix(matrix.multiply(1 / norms[:, None]))
+
+    def score(self, jd_text: str, resume_texts: List[str], jd_vector=None) -> List[float]:
+        """
+        Scores every resume against the JD with one sparse
+        matrix-vector product. Returns percentages (0–100).
+        A precomputed `jd_vector` (from transform) skips the JD side.
+        """
+        if not resume_texts:
+            return []
+
+        if jd_vector is None:
+            jd_vector = self.transform([jd_text])
+        resume_matrix = self.transform(resume_texts)
+
+        scores = (resume_matrix @ jd_vector.T).toarray().ravel()
+        return [round(float(s) * 100, 2) for s in scores]
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+    def to_dict(self) -> dict:
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        return {
+            "n_docs": self.n_docs,
+            "terms": terms,
+            "doc_freq": self.doc_freq.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KeywordCorpus":
+        corpus = cls()
+        corpus.n_docs = data["n_docs"]
+        corpus.vocabulary = {term: i for i, term in enumerate(data["terms"])}
+        corpus.doc_freq = np.asarray(data["doc_freq"], dtype=np.int64)
+        return corpus
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "KeywordCorpus":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
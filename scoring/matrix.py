@@ -0,0 +1,151 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from scoring.final_score import component_scores, compute_final_scores_batch
+from scoring.job_profile import JobProfile
+from scoring.keyword_corpus import KeywordCorpus
+from scoring.similarity import encode_texts
+from utils.profiler import profiled
+
+
+def membership_matrix(item_lists: Sequence[Sequence[str]], vocabulary: Dict[str, int]) -> csr_matrix:
+    """
+    Binary (len(item_lists) x len(vocabulary)) matrix: row i has a 1 for
+    every vocabulary item in item_lists[i]. Items outside the vocabulary
+    are ignored.
+    """
+    rows, cols = [], []
+    for row, items in enumerate(item_lists):
+        for col in {vocabulary[i] for i in items if i in vocabulary}:
+            rows.append(row)
+            cols.append(col)
+
+    return csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+        shape=(len(item_lists), len(vocabulary))
+    )
+
+
+def _normalized(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+@profiled("scoring.matrix")
+def score_matrix(
+    jobs: List[JobProfile],
+    candidates: List[dict],
+    candidate_embeddings: Optional[np.ndarray] = None,
+    corpus: Optional[KeywordCorpus] = None,
+    weights: dict = None
+) -> Dict[str, np.ndarray]:
+    """
+    Scores M jobs against N candidates in one go.
+
+    `candidates` are dicts with "clean_text" and "profile" (as returned by
+    pipeline.screening.process_resumes). Every signal is one matrix op:
+    - skills    : binary skill bitsets, J @ R.T overlap counts
+    - keywords  : one sparse TF-IDF product over a shared corpus
+    - semantic  : one dense product of normalized SBERT embeddings
+    - final     : compute_final_scores_batch broadcast over the M x N grid
+    Returns M x N arrays: "final", "skills", "experience", "education",
+    "keywords", "semantic" (all 0–100).
+    """
+    profiles = [c["profile"] for c in candidates]
+    texts = [c["clean_text"] for c in candidates]
+
+    # -------------------------
+    # Skills (bitset overlap)
+    # -------------------------
+    skill_vocab = {}
+    for job in jobs:
+        for skill in job.skills:
+            skill_vocab.setdefault(skill, len(skill_vocab))
+
+    job_skills = membership_matrix([job.skills for job in jobs], skill_vocab)
+    cand_skills = membership_matrix([p.get("skills", []) for p in profiles], skill_vocab)
+
+    matched = (job_skills @ cand_skills.T).toarray()
+    n_required = np.asarray(job_skills.sum(axis=1), dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        skill_scores = np.where(n_required > 0, matched / n_required * 100, 0.0)
+    skill_scores = np.round(skill_scores, 2)
+
+    # -------------------------
+    # Experience (broadcast M x 1 against 1 x N)
+    # -------------------------
+    required = np.array([job.required_experience for job in jobs], dtype=np.float64)[:, None]
+    years = np.array([p.get("experience_years", 0) for p in profiles], dtype=np.float64)[None, :]
+
+    # -------------------------
+    # Education (degree bitsets)
+    # -------------------------
+    degree_vocab = {}
+    for job in jobs:
+        for degree in job.required_degrees:
+            degree_vocab.setdefault(degree, len(degree_vocab))
+
+    job_degrees = membership_matrix([job.required_degrees for job in jobs], degree_vocab)
+    cand_degrees = membership_matrix([p.get("education", []) for p in profiles], degree_vocab)
+    has_degree = (job_degrees @ cand_degrees.T).toarray() > 0
+
+    # -------------------------
+    # Keywords (one sparse product)
+    # -------------------------
+    if corpus is None:
+        corpus = KeywordCorpus().fit([job.text for job in jobs] + texts)
+
+    keyword_scores = (corpus.transform([job.text for job in jobs]) @ corpus.transform(texts).T).toarray()
+    keyword_scores = np.round(keyword_scores * 100, 2)
+
+    # -------------------------
+    # Semantic (one dense product)
+    # -------------------------
+    missing = [job for job in jobs if job.embedding is None]
+    if missing:
+        for job, vector in zip(missing, encode_texts([job.text for job in missing])):
+            job.embedding = vector
+    if candidate_embeddings is None:
+        candidate_embeddings = encode_texts(texts)
+
+    job_embeddings = np.stack([job.embedding for job in jobs])
+    semantic_scores = _normalized(job_embeddings) @ _normalized(candidate_embeddings).T
+    semantic_scores = np.round(semantic_scores.astype(np.float64) * 100, 2)
+
+    # -------------------------
+    # Final weighted score
+    # -------------------------
+    signals = (skill_scores, years, required, has_degree, keyword_scores)
+    components = component_scores(*signals)
+    final_scores = compute_final_scores_batch(*signals, weights=weights)[0]
+
+    return {
+        "final": np.round(final_scores, 2),
+        "skills": components["skills"],
+        "experience": np.round(components["experience"], 2),
+        "education": components["education"],
+        "keywords": components["keywords"],
+        "semantic": semantic_scores
+    }
+
+
+def top_k(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Best k columns of every row, highest first.
+    Returns (indices, values), both shaped (rows x min(k, columns)).
+    """
+    k = min(k, scores.shape[1])
+    if k == 0:
+        empty = np.empty((scores.shape[0], 0))
+        return empty.astype(np.int64), empty
+
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    part_scores = np.take_along_axis(scores, part, axis=1)
+    order = np.argsort(-part_scores, axis=1, kind="stable")
+
+    indices = np.take_along_axis(part, order, axis=1)
+    return indices, np.take_along_axis(scores, indices, axis=1)
@@ -1,6 +1,13 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sentence_transformers import SentenceTransformer
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from scoring.chunking import best_chunk_similarity, chunk_documents, pool_chunks
+from scoring.embedding_cache import embedding_key, get_embedding_store
+from scoring.job_profile import JobProfile
+from scoring.keyword_corpus import KeywordCorpus
+from utils.model_registry import get_model, register_model
+from utils.profiler import profiled, stage
 
 
 def compute_similarity(text1: str, text2: str) -> float:
@@ -8,6 +15,9 @@ def compute_similarity(text1: str, text2: str) -> float:
     Computes keyword-based similarity using TF-IDF + cosine similarity.
     Returns a percentage (0–100).
     """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
     vectorizer = TfidfVectorizer(stop_words="english")
 
     tfidf = vectorizer.fit_transform([text1, text2])
@@ -16,7 +26,90 @@ def compute_similarity(text1: str, text2: str) -> float:
     return round(score * 100, 2)
 
 
-semantic_model = SentenceTransformer("all-MiniLM-L6-v2")
+@profiled("scoring.tfidf")
+def compute_similarity_batch(
+    jd: Union[str, JobProfile],
+    resume_texts: List[str],
+    corpus: Optional[KeywordCorpus] = None
+) -> List[float]:
+    """
+    Computes keyword similarity of many resumes against one JD
+    (cleaned text or a JobProfile).
+    Without a pre-fitted `corpus` (or one stored on the JobProfile), IDF is
+    fitted once over the JD plus all resumes in the batch (for one resume
+    this equals compute_similarity).
+    Returns percentages (0–100) in the same order as `resume_texts`.
+    """
+    job = jd if isinstance(jd, JobProfile) else None
+    jd_text = job.text if job else jd
+
+    if corpus is None and job is not None:
+        corpus = job.corpus
+    if corpus is None:
+        corpus = KeywordCorpus().fit([jd_text] + list(resume_texts))
+
+    jd_vector = job.tfidf_vector(corpus) if job else None
+    return corpus.score(jd_text, resume_texts, jd_vector=jd_vector)
+
+
+SEMANTIC_MODEL_NAME = "all-MiniLM-L6-v2"
+SEMANTIC_DIM = 384      # embedding size of SEMANTIC_MODEL_NAME
+
+
+def _load_semantic_model():
+    # Imported here: sentence_transformers pulls in torch, which is slow
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(SEMANTIC_MODEL_NAME)
+
+
+register_model("semantic", _load_semantic_model)
+
+
+def get_semantic_model():
+    return get_model("semantic")
+
+
+@profiled("scoring.encode")
+def encode_texts(texts: List[str], batch_size: int = 32, use_cache: bool = True) -> np.ndarray:
+    """
+    Encodes texts with the SBERT model, reading and writing the
+    on-disk embedding store so each text is only ever encoded once.
+    Returns a (len(texts) x dim) float32 array.
+    """
+    texts = list(texts)
+    if not texts:
+        return np.zeros((0, SEMANTIC_DIM), dtype=np.float32)
+
+    if not use_cache:
+        with stage("scoring.sbert_model"):
+            return np.asarray(get_semantic_model().encode(texts, batch_size=batch_size), dtype=np.float32)
+
+    store = get_embedding_store()
+    keys = [embedding_key(t, SEMANTIC_MODEL_NAME) for t in texts]
+    text_by_key = dict(zip(keys, texts))
+
+    try:
+        vectors = store.get_many(list(text_by_key))
+    except OSError:
+        # Unusable cache directory -> just encode
+        vectors = {}
+
+    missing = [k for k in text_by_key if k not in vectors]
+    if missing:
+        with stage("scoring.sbert_model"):
+            encoded = get_semantic_model().encode(
+                [text_by_key[k] for k in missing],
+                batch_size=batch_size
+            )
+        new_vectors = {k: np.asarray(v, dtype=np.float32) for k, v in zip(missing, encoded)}
+        vectors.update(new_vectors)
+
+        try:
+            store.put_many(new_vectors)
+        except OSError:
+            pass
+
+    return np.stack([vectors[k] for k in keys])
 
 
 def compute_semantic_similarity(text1: str, text2: str) -> float:
@@ -24,7 +117,9 @@ def compute_semantic_similarity(text1: str, text2: str) -> float:
     Computes semantic similarity using SBERT embeddings.
     Returns a percentage (0–100).
     """
-    embeddings = semantic_model.encode([text1, text2])
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    embeddings = encode_texts([text1, text2])
 
     score = cosine_similarity(
         [embeddings[0]],
@@ -32,3 +127,79 @@ def compute_semantic_similarity(text1: str, text2: str) -> float:
     )[0][0]
 
     return round(score * 100, 2)
+
+
+@profiled("scoring.encode_chunked")
+def encode_chunked(
+    texts: List[str],
+    chunking: str = "section",
+    batch_size: int = 32,
+    use_cache: bool = True
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Splits every text into model-sized chunks (by resume section or a
+    sliding window, see scoring/chunking.py) and encodes the chunks of all
+    texts in one encode_texts call, so repeated chunks come from the
+    embedding store.
+    Returns (chunk_embeddings, offsets): offsets[i] is the row of text i's
+    first chunk.
+    """
+    chunks, offsets = chunk_documents(texts, chunking)
+    return encode_texts(chunks, batch_size=batch_size, use_cache=use_cache), offsets
+
+
+@profiled("scoring.semantic")
+def compute_semantic_similarity_batch(
+    jd: Union[str, JobProfile],
+    resume_texts: List[str],
+    batch_size: int = 32,
+    resume_embeddings: Optional[np.ndarray] = None,
+    chunking: Optional[str] = None,
+    pooling: str = "max"
+) -> List[float]:
+    """
+    Computes semantic similarity of many resumes against one JD
+    (cleaned text or a JobProfile, whose stored embedding is reused).
+    The JD is encoded at most once, resumes not already in the embedding store
+    are encoded `batch_size` at a time (unless `resume_embeddings` are
+    passed in), and all scores come from a single matrix-vector product.
+
+    By default each resume is encoded whole, so the model only reads its
+    first 256 word pieces. With `chunking` ("section" or "window") every
+    chunk is encoded and the chunk vectors are pooled per resume
+    (`pooling` "max" / "mean"), or each resume scores as its best chunk
+    against the JD ("best"). Ignored when `resume_embeddings` are given.
+    Returns percentages (0–100) in the same order as `resume_texts`.
+    """
+    if not resume_texts:
+        return []
+
+    if isinstance(jd, JobProfile) and jd.embedding is not None:
+        jd_embedding = jd.embedding
+    else:
+        jd_embedding = encode_texts([jd.text if isinstance(jd, JobProfile) else jd])[0]
+
+    if resume_embeddings is None and chunking:
+        chunk_embeddings, offsets = encode_chunked(resume_texts, chunking, batch_size=batch_size)
+        if pooling == "best":
+            scores = best_chunk_similarity(chunk_embeddings, offsets, jd_embedding)
+            return [round(float(score) * 100, 2) for score in scores]
+        resume_embeddings = pool_chunks(chunk_embeddings, offsets, pooling)
+
+    if resume_embeddings is None:
+        resume_embeddings = encode_texts(resume_texts, batch_size=batch_size)
+
+    scores = _normalize_rows(resume_embeddings) @ _normalize_rows(jd_embedding[None, :])[0]
+
+    return [round(float(score) * 100, 2) for score in scores]
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    L2-normalizes each row; all-zero rows are left as zeros
+    (same behaviour as sklearn's cosine_similarity).
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
@@ -0,0 +1,146 @@
+"""
+Local load generator for service.server (no network beyond localhost).
+
+Sends the sample resumes / JDs from data/ with a fixed number of
+concurrent keep-alive connections, then prints client-side throughput and
+latency percentiles next to the server's own /metrics.
+
+Usage:
+    python -m service.server --port 8080 &
+    python -m service.loadgen --port 8080 --endpoint score --requests 500 --concurrency 32
+    python -m service.loadgen --endpoint rank --resumes-per-request 20
+"""
+import argparse
+import asyncio
+import base64
+import glob
+import json
+import os
+import random
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_samples() -> Tuple[List[dict], List[str]]:
+    resumes = []
+    for path in sorted(glob.glob(os.path.join(REPO_ROOT, "data", "resumes", "*.pdf"))):
+        with open(path, "rb") as f:
+            resumes.append({
+                "file_name": os.path.basename(path),
+                "content_base64": base64.b64encode(f.read()).decode("ascii")
+            })
+
+    jds = []
+    for path in sorted(glob.glob(os.path.join(REPO_ROOT, "data", "jds", "*.txt"))):
+        with open(path, "r", encoding="utf-8") as f:
+            jds.append(f.read())
+
+    return resumes, jds
+
+
+def build_request(endpoint: str, resumes: List[dict], jds: List[str], per_request: int, rng: random.Random) -> dict:
+    if endpoint == "profile":
+        return {"resume": rng.choice(resumes)}
+    if endpoint == "score":
+        return {"jd_text": rng.choice(jds), "resume": rng.choice(resumes)}
+    return {"jd_text": rng.choice(jds), "resumes": [rng.choice(resumes) for _ in range(per_request)]}
+
+
+class Connection:
+    """
+    One keep-alive HTTP/1.1 connection.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method: str, path: str, payload: dict = None) -> Tuple[int, dict]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        data = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+
+        return status, json.loads(data) if data else {}
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+async def run(args) -> None:
+    resumes, jds = load_samples()
+    rng = random.Random(args.seed)
+    payloads = [build_request(args.endpoint, resumes, jds, args.resumes_per_request, rng)
+                for _ in range(args.requests)]
+
+    latencies, statuses = [], []
+    next_request = iter(range(args.requests))
+
+    async def _client():
+        connection = Connection(args.host, args.port)
+        for i in next_request:
+            start = time.perf_counter()
+            try:
+                status, _ = await connection.request("POST", f"/{args.endpoint}", payloads[i])
+            except (ConnectionError, asyncio.IncompleteReadError):
+                status = 0
+                await connection.close()
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses.append(status)
+        await connection.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_client() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    values = np.array(latencies)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    ok = sum(1 for s in statuses if s == 200)
+
+    print(f"{args.requests} x POST /{args.endpoint}, concurrency {args.concurrency}")
+    print(f"  {args.requests / elapsed:.1f} req/s over {elapsed:.2f}s, {ok} OK, {args.requests - ok} failed")
+    print(f"  client latency ms: p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f}  max {values.max():.1f}")
+
+    connection = Connection(args.host, args.port)
+    _, metrics = await connection.request("GET", "/metrics")
+    await connection.close()
+    print("\nserver /metrics:")
+    print(json.dumps(metrics, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--endpoint", choices=["profile", "score", "rank"], default="score")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--resumes-per-request", type=int, default=10, help="for /rank")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,41 @@
+import time
+from collections import defaultdict, deque
+from typing import Dict
+
+import numpy as np
+
+# Percentiles are computed over the most recent samples per endpoint
+WINDOW = 10000
+
+
+class LatencyRecorder:
+    """
+    Per-endpoint request counts, errors and latency percentiles.
+    """
+
+    def __init__(self, window: int = WINDOW):
+        self.started = time.time()
+        self._latencies: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window))
+        self._counts: Dict[str, int] = defaultdict(int)
+        self._errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, endpoint: str, seconds: float, ok: bool = True) -> None:
+        self._latencies[endpoint].append(seconds * 1000)
+        self._counts[endpoint] += 1
+        if not ok:
+            self._errors[endpoint] += 1
+
+    def snapshot(self) -> dict:
+        endpoints = {}
+        for endpoint, samples in self._latencies.items():
+            values = np.fromiter(samples, dtype=np.float64)
+            p50, p95, p99 = np.percentile(values, [50, 95, 99]) if len(values) else (0.0, 0.0, 0.0)
+            endpoints[endpoint] = {
+                "count": self._counts[endpoint],
+                "errors": self._errors[endpoint],
+                "p50_ms": round(float(p50), 2),
+                "p95_ms": round(float(p95), 2),
+                "p99_ms": round(float(p99), 2),
+                "max_ms": round(float(values.max()), 2) if len(values) else 0.0
+            }
+        return {"uptime_s": round(time.time() - self.started, 1), "endpoints": endpoints}
@@ -0,0 +1,399 @@
+"""
+Local HTTP scoring service (asyncio, standard library only).
+
+Usage:
+    python -m service.server --port 8080 --workers 4 --max-batch-size 32 --max-wait-ms 10
+
+Endpoints (JSON in, JSON out):
+    POST /profile  {"resume": RESUME}
+    POST /score    {"jd_text": "...", "resume": RESUME}
+    POST /rank     {"jd_text": "...", "resumes": [RESUME, ...], "top_n": 10}
+    GET  /metrics  latency percentiles, encoder batching, queue depths
+    GET  /health
+
+RESUME is {"file_name": "cv.pdf", "content_base64": "..."} or {"text": "..."}.
+
+Parsing and profile extraction run in a process pool. Concurrent requests
+share the SBERT encoder through a micro-batcher: texts are grouped into
+one encode call of up to --max-batch-size, waiting at most --max-wait-ms
+for a batch to fill.
+"""
+import argparse
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import math
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from pipeline.screening import _init_worker, process_resume, process_resume_text
+from scoring.engine import calculate_match_score
+from scoring.final_score import SIGNALS, compute_final_score_for_job
+from scoring.job_profile import JobProfile
+from scoring.matrix import score_matrix
+from scoring.similarity import compute_similarity_batch, compute_semantic_similarity_batch, encode_texts
+from service.batcher import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, MicroBatcher
+from service.metrics import LatencyRecorder
+from storage.profile_store import content_hash
+from utils.model_registry import wait_for_loads, warm_up
+
+MAX_BODY_BYTES = 50 * 1024 * 1024
+JOB_CACHE_SIZE = 64
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error"
+}
+
+
+class RequestError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# -------------------------
+# Worker side (runs in the process pool)
+# -------------------------
+def _process(resume: Union[str, Tuple[str, bytes]]) -> dict:
+    if isinstance(resume, str):
+        result = process_resume_text(resume)
+    else:
+        result = process_resume(resume)
+        result["content_hash"] = content_hash(resume[1])
+
+    # Raw text is not needed past this point; don't ship it back
+    result.pop("raw_text", None)
+    return result
+
+
+def _resume_input(resume) -> Union[str, Tuple[str, bytes]]:
+    if not isinstance(resume, dict):
+        raise RequestError(400, "resume must be an object")
+    if isinstance(resume.get("text"), str):
+        return resume["text"]
+    if "file_name" in resume and "content_base64" in resume:
+        try:
+            return resume["file_name"], base64.b64decode(resume["content_base64"], validate=True)
+        except (binascii.Error, TypeError, ValueError):
+            raise RequestError(400, "content_base64 is not valid base64")
+    raise RequestError(400, 'resume needs "text" or "file_name" + "content_base64"')
+
+
+def _weights(weights) -> Optional[dict]:
+    if weights is None:
+        return None
+    if not isinstance(weights, dict) or set(weights) != set(SIGNALS):
+        raise RequestError(400, f"weights must be an object with keys {', '.join(SIGNALS)}")
+    for name, value in weights.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0:
+            raise RequestError(400, f"weight '{name}' must be a non-negative number")
+    return weights
+
+
+def _top_n(top_n) -> Optional[int]:
+    if top_n is None:
+        return None
+    if isinstance(top_n, bool) or not isinstance(top_n, int) or top_n < 1:
+        raise RequestError(400, "top_n must be a positive integer")
+    return top_n
+
+
+# -------------------------
+# Service
+# -------------------------
+class ScreeningService:
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        self.encoder = MicroBatcher(self._encode, max_batch_size, max_wait_ms)
+        self.metrics = LatencyRecorder()
+
+        self.parsing = 0   # resumes submitted to the pool and not yet back
+        self._jobs: "OrderedDict[str, JobProfile]" = OrderedDict()
+
+        self.routes = {
+            ("POST", "/profile"): self.handle_profile,
+            ("POST", "/score"): self.handle_score,
+            ("POST", "/rank"): self.handle_rank,
+            ("GET", "/metrics"): self.handle_metrics,
+            ("GET", "/health"): self.handle_health
+        }
+
+    async def start(self) -> None:
+        # Fork the parse workers now, before any thread in this process
+        # starts importing models (see wait_for_loads); then load SBERT /
+        # spaCy here in the background while requests are accepted
+        wait_for_loads()
+        self.pool.submit(os.getpid)
+        warm_up(background=True)
+        self.encoder.start()
+
+    async def close(self) -> None:
+        await self.encoder.stop()
+        self.pool.shutdown(cancel_futures=True)
+
+    # -------------------------
+    # Building blocks
+    # -------------------------
+    @staticmethod
+    def _encode(texts: List[str]) -> List[np.ndarray]:
+        return list(encode_texts(texts))
+
+    async def _profile(self, resume) -> dict:
+        self.parsing += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, _process, resume)
+        except Exception as e:
+            raise RequestError(422, f"{type(e).__name__}: {e}")
+        finally:
+            self.parsing -= 1
+
+    async def _job(self, jd_text) -> JobProfile:
+        if not isinstance(jd_text, str) or not jd_text.strip():
+            raise RequestError(400, "jd_text must be a non-empty string")
+
+        key = hashlib.sha256(jd_text.encode("utf-8")).hexdigest()
+        if key in self._jobs:
+            self._jobs.move_to_end(key)
+            return self._jobs[key]
+
+        job = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: JobProfile.build(jd_text, with_embedding=False)
+        )
+        job.embedding = await self.encoder.submit(job.text)
+
+        self._jobs[key] = job
+        while len(self._jobs) > JOB_CACHE_SIZE:
+            self._jobs.popitem(last=False)
+        return job
+
+    # -------------------------
+    # Endpoints
+    # -------------------------
+    async def handle_profile(self, body: dict) -> dict:
+        result = await self._profile(_resume_input(body.get("resume")))
+        return {
+            "candidate_name": result["candidate_name"],
+            "profile": result["profile"],
+            "content_hash": result.get("content_hash")
+        }
+
+    async def handle_score(self, body: dict) -> dict:
+        resume = _resume_input(body.get("resume"))
+        weights = _weights(body.get("weights"))
+        job, result = await asyncio.gather(self._job(body.get("jd_text")), self._profile(resume))
+        embedding = await self.encoder.submit(result["clean_text"])
+
+        def _score():
+            clean_resume = result["clean_text"]
+            tfidf = compute_similarity_batch(job, [clean_resume])[0]
+            semantic = compute_semantic_similarity_batch(job, [clean_resume], resume_embeddings=embedding[None, :])[0]
+            skill_result = calculate_match_score(result["profile"], job)
+            final_score = compute_final_score_for_job(
+                job,
+                result["profile"],
+                skill_match_percent=skill_result["skill_match_percent"],
+                semantic_similarity=semantic,
+                keyword_similarity=tfidf,
+                weights=weights
+            )
+            return tfidf, semantic, skill_result, final_score
+
+        tfidf, semantic, skill_result, final_score = await asyncio.get_running_loop().run_in_executor(None, _score)
+
+        return {
+            "candidate_name": result["candidate_name"],
+            "profile": result["profile"],
+            "tfidf": tfidf,
+            "semantic": semantic,
+            "skill_result": skill_result,
+            "final_score": final_score
+        }
+
+    async def handle_rank(self, body: dict) -> dict:
+        resumes = body.get("resumes")
+        if not isinstance(resumes, list) or not resumes:
+            raise RequestError(400, "resumes must be a non-empty list")
+        inputs = [_resume_input(r) for r in resumes]
+        weights = _weights(body.get("weights"))
+        top_n = _top_n(body.get("top_n"))
+
+        async def _try_profile(resume):
+            try:
+                return await self._profile(resume), None
+            except RequestError as e:
+                return None, str(e)
+
+        job, *processed = await asyncio.gather(self._job(body.get("jd_text")), *map(_try_profile, inputs))
+
+        ok = [(i, result) for i, (result, error) in enumerate(processed) if error is None]
+        errors = [
+            {"index": i, "name": _name(resumes[i], i), "error": error}
+            for i, (_, error) in enumerate(processed) if error is not None
+        ]
+        if not ok:
+            return {"results": [], "errors": errors}
+
+        candidates = [result for _, result in ok]
+        embeddings = np.stack(await self.encoder.submit_many([c["clean_text"] for c in candidates]))
+
+        scores = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: score_matrix([job], candidates, candidate_embeddings=embeddings, weights=weights)
+        )
+
+        ranked = [
+            {
+                "index": i,
+                "name": _name(resumes[i], i),
+                "candidate_name": result["candidate_name"],
+                **{name: float(matrix[0, j]) for name, matrix in scores.items()}
+            }
+            for j, (i, result) in enumerate(ok)
+        ]
+        ranked.sort(key=lambda r: r["final"], reverse=True)
+
+        return {"results": ranked[:top_n] if top_n else ranked, "errors": errors}
+
+    async def handle_metrics(self, body: dict) -> dict:
+        return {
+            **self.metrics.snapshot(),
+            "encoder": self.encoder.stats(),
+            "parsing": {"in_flight": self.parsing, "workers": self.workers},
+            "job_cache": len(self._jobs)
+        }
+
+    async def handle_health(self, body: dict) -> dict:
+        return {"status": "ok"}
+
+    # -------------------------
+    # HTTP
+    # -------------------------
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        path = path.split("?", 1)[0]
+        handler = self.routes.get((method, path))
+        start = time.perf_counter()
+        status = 200
+
+        try:
+            if handler is None:
+                known = any(p == path for _, p in self.routes)
+                raise RequestError(405 if known else 404, f"{method} {path} not supported")
+            try:
+                payload = json.loads(body) if body else {}
+            except ValueError:
+                raise RequestError(400, "body is not valid JSON")
+            if not isinstance(payload, dict):
+                raise RequestError(400, "body must be a JSON object")
+
+            return status, await handler(payload)
+
+        except RequestError as e:
+            status = e.status
+            return status, {"error": str(e)}
+        except Exception as e:
+            status = 500
+            return status, {"error": f"{type(e).__name__}: {e}"}
+        finally:
+            if handler is not None and path != "/metrics":
+                self.metrics.record(path, time.perf_counter() - start, ok=status < 400)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    writer.write(_response(400, {"error": "malformed request line"}, keep_alive=False))
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    writer.write(_response(400, {"error": "invalid Content-Length"}, keep_alive=False))
+                    break
+                if length > MAX_BODY_BYTES:
+                    writer.write(_response(413, {"error": "request body too large"}, keep_alive=False))
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self.dispatch(method, path, body)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def _name(resume: dict, index: int) -> str:
+    return resume.get("file_name") or f"resume-{index}"
+
+
+def _response(status: int, payload: dict, keep_alive: bool) -> bytes:
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def serve(host: str, port: int, service: ScreeningService) -> None:
+    await service.start()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"Serving on http://{host}:{port} ({service.workers} parse workers, "
+          f"encoder batch <= {service.encoder.max_batch_size}, wait <= {service.encoder.max_wait_ms} ms)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None, help="parse processes (default: CPU count)")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, ScreeningService(args.workers, args.max_batch_size, args.max_wait_ms)))
+    except KeyboardInterrupt:
+        pass
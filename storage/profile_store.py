@@ -0,0 +1,337 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from processing.parser import PARSER_VERSION
+from nlp.taxonomy import get_taxonomy
+
+DEFAULT_DB_PATH = os.environ.get(
+    "RESUME_SCREENER_PROFILE_DB",
+    os.path.join(os.environ.get("RESUME_SCREENER_CACHE_DIR", ".cache"), "profiles.sqlite3")
+)
+
+# Bump when cleaning / section splitting / profile extraction changes output
+PIPELINE_VERSION = 2
+
+# SQLite's default limit on bound parameters is 999
+_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    content_hash     TEXT PRIMARY KEY,
+    pipeline_version TEXT NOT NULL,
+    name             TEXT,
+    candidate_name   TEXT,
+    experience_years NUMERIC NOT NULL DEFAULT 0,
+    education        TEXT NOT NULL,
+    job_titles       TEXT NOT NULL,
+    skills           TEXT NOT NULL,
+    raw_text         BLOB,
+    clean_text       BLOB NOT NULL,
+    embedding        BLOB,
+    updated_at       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_experience ON candidates (experience_years);
+CREATE INDEX IF NOT EXISTS idx_candidates_version ON candidates (pipeline_version);
+
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    skill        TEXT NOT NULL,
+    content_hash TEXT NOT NULL REFERENCES candidates (content_hash) ON DELETE CASCADE,
+    PRIMARY KEY (skill, content_hash)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_candidate_skills_hash ON candidate_skills (content_hash);
+"""
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def pipeline_version() -> str:
+    """
+    Everything a stored profile depends on: extraction code, parser and
+    the skill taxonomy. A change to any of them marks old rows stale.
+    """
+    return f"{PIPELINE_VERSION}-p{PARSER_VERSION}-t{get_taxonomy().source_hash[:12]}"
+
+
+def _pack_text(text: Optional[str]) -> Optional[bytes]:
+    return zlib.compress(text.encode("utf-8")) if text is not None else None
+
+
+def _unpack_text(blob: Optional[bytes]) -> Optional[str]:
+    return zlib.decompress(blob).decode("utf-8") if blob is not None else None
+
+
+class ProfileStore:
+    """
+    SQLite store of processed candidates, keyed by the SHA-256 of the
+    resume file and tagged with the pipeline version that produced them.
+
+    A record is what pipeline.screening.process_resume returns ("raw_text",
+    "clean_text", "profile", "candidate_name") plus "content_hash", "name"
+    (file name) and optionally "embedding". Rows from an older pipeline
+    version are not returned by get_many(); stale() lists them so only
+    those resumes need recomputing, and stale_records() streams the ones
+    that can be recomputed from their stored raw text.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    # -------------------------
+    # Writes
+    # -------------------------
+    def put_many(self, records: Iterable[dict]) -> int:
+        """
+        Inserts or replaces records in one transaction. Returns the count.
+        Records sharing a content hash are written once (the last one wins).
+        """
+        version = pipeline_version()
+        now = time.time()
+        rows, skill_rows, hashes = [], [], []
+
+        unique = {record["content_hash"]: record for record in records}
+        for record in unique.values():
+            profile = record["profile"]
+            embedding = record.get("embedding")
+            skills = sorted(set(profile.get("skills", [])))
+
+            hashes.append(record["content_hash"])
+            rows.append((
+                record["content_hash"],
+                version,
+                record.get("name"),
+                record.get("candidate_name"),
+                profile.get("experience_years", 0),
+                json.dumps(profile.get("education", [])),
+                json.dumps(profile.get("job_titles", [])),
+                json.dumps(profile.get("skills", [])),
+                _pack_text(record.get("raw_text")),
+                _pack_text(record["clean_text"]),
+                np.asarray(embedding, dtype=np.float32).tobytes() if embedding is not None else None,
+                now
+            ))
+            skill_rows.extend((skill, record["content_hash"]) for skill in skills)
+
+        with self._lock, self._conn:
+            self._delete(hashes)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO candidates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.executemany("INSERT OR IGNORE INTO candidate_skills VALUES (?, ?)", skill_rows)
+
+        return len(rows)
+
+    def put_embeddings(self, hashes: Sequence[str], embeddings: np.ndarray) -> None:
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE candidates SET embedding = ? WHERE content_hash = ?",
+                [(vector.tobytes(), h) for h, vector in zip(hashes, embeddings)]
+            )
+
+    def delete(self, hashes: Sequence[str]) -> None:
+        with self._lock, self._conn:
+            self._delete(list(hashes))
+
+    # -------------------------
+    # Reads
+    # -------------------------
+    def get_many(self, hashes: Sequence[str], with_raw_text: bool = True) -> Dict[str, dict]:
+        """
+        Current-version records for `hashes` (missing / stale ones are absent).
+        """
+        version = pipeline_version()
+        columns = self._columns(with_raw_text)
+        found = {}
+
+        with self._lock:
+            for chunk in _chunks(list(dict.fromkeys(hashes))):
+                marks = ",".join("?" * len(chunk))
+                cursor = self._conn.execute(
+                    f"SELECT {columns} FROM candidates "
+                    f"WHERE pipeline_version = ? AND content_hash IN ({marks})",
+                    [version, *chunk]
+                )
+                for row in cursor:
+                    record = self._record(row, with_raw_text)
+                    found[record["content_hash"]] = record
+
+        return found
+
+    def iter_records(self, hashes: Optional[Sequence[str]] = None, with_raw_text: bool = False,
+                     batch_size: int = 1000) -> Iterable[dict]:
+        """
+        Streams current-version records (all of them, or just `hashes`).
+        """
+        if hashes is None:
+            hashes = self.find()
+        for chunk in _chunks(list(hashes), batch_size):
+            records = self.get_many(chunk, with_raw_text)
+            for h in chunk:
+                if h in records:
+                    yield records[h]
+
+    def find(
+        self,
+        min_experience: Optional[float] = None,
+        max_experience: Optional[float] = None,
+        all_skills: Sequence[str] = ()
+    ) -> List[str]:
+        """
+        Hashes of current-version candidates matching the filters, using
+        the experience and skill indexes. Skills are normalized with the
+        taxonomy's synonyms ("js" finds rows stored as "javascript").
+        """
+        sql = "SELECT c.content_hash FROM candidates c"
+        params: list = []
+        where = ["c.pipeline_version = ?"]
+        params_where: list = [pipeline_version()]
+
+        synonyms = get_taxonomy().synonyms
+        skills = sorted({synonyms.get(s.strip().lower(), s.strip().lower()) for s in all_skills})
+        if skills:
+            marks = ",".join("?" * len(skills))
+            sql += (
+                f" JOIN (SELECT content_hash FROM candidate_skills WHERE skill IN ({marks})"
+                " GROUP BY content_hash HAVING COUNT(*) = ?) s ON s.content_hash = c.content_hash"
+            )
+            params.extend(skills)
+            params.append(len(skills))
+
+        if min_experience is not None:
+            where.append("c.experience_years >= ?")
+            params_where.append(min_experience)
+        if max_experience is not None:
+            where.append("c.experience_years <= ?")
+            params_where.append(max_experience)
+
+        sql += " WHERE " + " AND ".join(where) + " ORDER BY c.rowid"
+
+        with self._lock:
+            return [row[0] for row in self._conn.execute(sql, params + params_where)]
+
+    def stale(self) -> List[dict]:
+        """
+        Rows written by an older pipeline version: {"content_hash", "name", "pipeline_version"}.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT content_hash, name, pipeline_version FROM candidates WHERE pipeline_version != ?",
+                [pipeline_version()]
+            )
+            return [{"content_hash": h, "name": n, "pipeline_version": v} for h, n, v in cursor]
+
+    def stale_records(self) -> Iterable[dict]:
+        """
+        Streams stale rows (with "raw_text") that only need re-profiling:
+        raw text stored and written by the current parser version. Rows
+        from an older parser need their original files re-ingested.
+        """
+        with self._lock:
+            hashes = [row[0] for row in self._conn.execute(
+                "SELECT content_hash FROM candidates "
+                "WHERE pipeline_version != ? AND pipeline_version LIKE ? AND raw_text IS NOT NULL "
+                "ORDER BY rowid",
+                [pipeline_version(), f"%-p{PARSER_VERSION}-%"]
+            )]
+
+        columns = self._columns(with_raw_text=True)
+        for chunk in _chunks(hashes):
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {columns} FROM candidates WHERE content_hash IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+            for row in rows:
+                yield self._record(row, with_raw_text=True)
+
+    def stats(self) -> dict:
+        version = pipeline_version()
+        with self._lock:
+            total, current, embedded = self._conn.execute(
+                "SELECT COUNT(*), SUM(pipeline_version = ?), SUM(embedding IS NOT NULL) FROM candidates",
+                [version]
+            ).fetchone()
+        return {
+            "candidates": total,
+            "current": current or 0,
+            "stale": total - (current or 0),
+            "with_embedding": embedded or 0,
+            "pipeline_version": version
+        }
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    def _delete(self, hashes: List[str]) -> None:
+        for chunk in _chunks(hashes):
+            marks = ",".join("?" * len(chunk))
+            self._conn.execute(f"DELETE FROM candidates WHERE content_hash IN ({marks})", chunk)
+
+    @staticmethod
+    def _columns(with_raw_text: bool) -> str:
+        return (
+            "content_hash, name, candidate_name, experience_years, education, job_titles, skills, "
+            "clean_text, embedding" + (", raw_text" if with_raw_text else "")
+        )
+
+    @staticmethod
+    def _record(row: tuple, with_raw_text: bool) -> dict:
+        record = {
+            "content_hash": row[0],
+            "name": row[1],
+            "candidate_name": row[2],
+            "profile": {
+                "skills": json.loads(row[6]),
+                "experience_years": row[3],
+                "education": json.loads(row[4]),
+                "job_titles": json.loads(row[5])
+            },
+            "clean_text": _unpack_text(row[7]),
+            "embedding": np.frombuffer(row[8], dtype=np.float32) if row[8] is not None else None
+        }
+        if with_raw_text:
+            record["raw_text"] = _unpack_text(row[9])
+        return record
+
+
+def _chunks(items: list, size: int = _CHUNK) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+# -------------------------
+# Shared default store
+# -------------------------
+_default_store: Optional[ProfileStore] = None
+
+
+def get_profile_store() -> ProfileStore:
+    global _default_store
+    if _default_store is None:
+        _default_store = ProfileStore()
+    return _default_store
@@ -1,48 +1,139 @@
+import html
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+from nlp.skill_matcher import tokenize
+from nlp.taxonomy import get_taxonomy
 
-def find_skill_context(text: str, skills: List[str]) -> Dict[str, dict]:
+CONTEXT_CHARS = 60
+MAX_SNIPPETS = 5
+
+# Skills sit on token boundaries, as in nlp.skill_matcher ("java" never
+# matches inside "javascript"); anything between tokens may vary. As there,
+# a synonym never matches part of a dotted compound ("js" in "node.js").
+_TOKEN_CHARS = "a-z0-9+#"
+_NOT_DOTTED = (rf"(?<![{_TOKEN_CHARS}]\.)", rf"(?!\.[{_TOKEN_CHARS}])")
+
+
+@lru_cache(maxsize=256)
+def _skill_pattern(skills: Tuple[str, ...], taxonomy_hash: str) -> Tuple[re.Pattern, Dict[str, str]]:
+    """
+    One compiled alternation over every skill and its synonyms, plus a map
+    from the normalized matched text back to the skill. Cached per skill
+    set and taxonomy version.
+    """
+    wanted = set(skills)
+    variants = {" ".join(tokenize(skill)): skill for skill in skills}
+    for synonym, canonical in get_taxonomy().synonyms.items():
+        if canonical in wanted:
+            variants.setdefault(" ".join(tokenize(synonym)), canonical)
+    variants.pop("", None)
+
+    # Longest first, so "machine learning" wins over "machine"
+    alternatives = []
+    for variant in sorted(variants, key=len, reverse=True):
+        alternative = rf"[^{_TOKEN_CHARS}]+".join(re.escape(token) for token in variant.split())
+        if variant != " ".join(tokenize(variants[variant])):
+            alternative = _NOT_DOTTED[0] + alternative + _NOT_DOTTED[1]
+        alternatives.append(alternative)
+    pattern = re.compile(
+        rf"(?<![{_TOKEN_CHARS}])(?:{'|'.join(alternatives)})(?![{_TOKEN_CHARS}])",
+        re.IGNORECASE
+    )
+    return pattern, variants
+
+
+def find_skill_hits(text: str, skills: List[str]) -> List[Tuple[str, int, int]]:
+    """
+    Every (skill, start, end) occurrence of `skills` in `text`, in one pass.
     """
-    Returns:
+    skills = tuple(sorted({s.lower() for s in skills}))
+    if not skills:
+        return []
+
+    pattern, variants = _skill_pattern(skills, get_taxonomy().source_hash)
+    return [
+        (variants[" ".join(tokenize(m.group()))], m.start(), m.end())
+        for m in pattern.finditer(text)
+    ]
+
+
+def find_skill_context(
+    text: str,
+    skills: List[str],
+    context_chars: int = CONTEXT_CHARS,
+    max_snippets: Optional[int] = MAX_SNIPPETS,
+    raw_text: Optional[str] = None,
+    offsets=None
+) -> Dict[Tuple[int, int], dict]:
+    """
+    Returns, keyed by the snippet's (start, end) in the text:
     {
-      snippet: {
+      (start, end): {
+         "snippet": snippet_text,
          "skills": [skill1, skill2],
          "highlighted": snippet_with_html_bold_skills
       }
     }
+
+    Every hit gets a window of `context_chars` on each side; overlapping
+    windows are merged, and snippets are ranked by how many distinct skills
+    they show (then by position). With `raw_text` and the clean-to-raw
+    `offsets` from processing.cleaner.clean_text_with_offsets, snippets are
+    cut from the original text instead.
     """
+    hits = find_skill_hits(text, skills)
+    if not hits:
+        return {}
 
-    snippet = None
-    found_skills = []
+    if raw_text is not None and offsets is not None:
+        from processing.cleaner import raw_span
+        hits = [(skill, *raw_span(offsets, start, end)) for skill, start, end in hits]
+        text = raw_text
 
-    for skill in skills:
-        pattern = re.compile(rf"{re.escape(skill)}", re.IGNORECASE)
-        match = pattern.search(text)
+    # -------------------------
+    # Merge overlapping windows
+    # -------------------------
+    windows = []   # [start, end, hits]
+    for hit in hits:
+        start = max(0, hit[1] - context_chars)
+        end = min(len(text), hit[2] + context_chars)
+        if windows and start <= windows[-1][1]:
+            windows[-1][1] = max(windows[-1][1], end)
+            windows[-1][2].append(hit)
+        else:
+            windows.append([start, end, [hit]])
 
-        if match:
-            if not snippet:
-                start = max(0, match.start() - 60)
-                end = min(len(text), match.end() + 60)
-                snippet = text[start:end].strip()
-                snippet = f"...{snippet}..."
+    ranked = sorted(
+        windows,
+        key=lambda w: (-len({skill for skill, _, _ in w[2]}), w[0])
+    )
+    if max_snippets is not None:
+        ranked = ranked[:max_snippets]
 
-            found_skills.append(skill)
+    # -------------------------
+    # Build snippets
+    # -------------------------
+    context = {}
+    for start, end, window_hits in ranked:
+        raw = text[start:end]
+        lead = len(raw) - len(raw.lstrip())
+        body = raw.strip()
+        base = start + lead
 
-    if not snippet:
-        return {}
+        parts, cursor = [], 0
+        for _, hit_start, hit_end in window_hits:
+            hit_start, hit_end = hit_start - base, hit_end - base
+            parts.append(html.escape(body[cursor:hit_start]))
+            parts.append(f"<strong>{html.escape(body[hit_start:hit_end])}</strong>")
+            cursor = hit_end
+        parts.append(html.escape(body[cursor:]))
 
-    highlighted = snippet
-    for skill in found_skills:
-        pattern = re.compile(rf"{re.escape(skill)}", re.IGNORECASE)
-        highlighted = pattern.sub(
-            lambda m: f"<strong>{m.group(0)}</strong>",
-            highlighted
-        )
-
-    return {
-        snippet: {
-            "skills": found_skills,
-            "highlighted": highlighted
+        context[(start, end)] = {
+            "snippet": f"...{body}...",
+            "skills": list(dict.fromkeys(skill for skill, _, _ in window_hits)),
+            "highlighted": f"...{''.join(parts)}..."
         }
-    }
+
+    return context
@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# -------------------------
+# Registry state
+# -------------------------
+_loaders: Dict[str, Callable[[], Any]] = {}
+_models: Dict[str, Any] = {}
+_load_times: Dict[str, float] = {}
+_locks: Dict[str, threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+# Loads in progress (a model loader or a whole warm-up run), see wait_for_loads()
+_loading = 0
+_load_state = threading.Condition()
+
+
+def register_model(name: str, loader: Callable[[], Any]) -> None:
+    """
+    Registers a zero-argument loader. Nothing is loaded until get_model(name).
+    """
+    with _registry_lock:
+        _loaders[name] = loader
+        _locks.setdefault(name, threading.Lock())
+
+
+def get_model(name: str) -> Any:
+    """
+    Returns the model, loading it on first use.
+    Concurrent callers wait for a single load (thread-safe singleton).
+    """
+    if name in _models:
+        return _models[name]
+
+    if name not in _loaders:
+        raise KeyError(f"No model registered under '{name}'")
+
+    with _locks[name]:
+        # Another thread may have finished loading while we waited
+        if name in _models:
+            return _models[name]
+
+        start = time.perf_counter()
+        _begin_load()
+        try:
+            model = _loaders[name]()
+        finally:
+            _end_load()
+        duration = round(time.perf_counter() - start, 3)
+
+        _load_times[name] = duration
+        _models[name] = model
+        logging.info(f"Loaded model '{name}' in {duration}s")
+
+    return model
+
+
+def _begin_load() -> None:
+    global _loading
+    with _load_state:
+        _loading += 1
+
+
+def _end_load() -> None:
+    global _loading
+    with _load_state:
+        _loading -= 1
+        _load_state.notify_all()
+
+
+def wait_for_loads(timeout: Optional[float] = None) -> bool:
+    """
+    Blocks until no model is being loaded (by warm_up or a first get_model).
+    Call before forking worker processes: a child forked while another
+    thread is inside a torch / spaCy import can deadlock on that module's
+    import lock. Returns False if `timeout` ran out first.
+    """
+    with _load_state:
+        return _load_state.wait_for(lambda: _loading == 0, timeout)
+
+
+def is_loaded(name: str) -> bool:
+    return name in _models
+
+
+def load_times() -> Dict[str, float]:
+    """
+    Seconds spent loading each model that has been loaded so far.
+    """
+    return dict(_load_times)
+
+
+def warm_up(names: Optional[Iterable[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+    """
+    Loads the given models (default: all registered ones).
+    With background=True this happens on a daemon thread, which is returned.
+    """
+    names = list(names) if names is not None else list(_loaders)
+
+    def _load_all():
+        try:
+            for name in names:
+                try:
+                    get_model(name)
+                except Exception as e:
+                    logging.warning(f"Warm-up of model '{name}' failed: {e}")
+        finally:
+            _end_load()
+
+    # Counted as one load from here on, so wait_for_loads() can't slip in
+    # between two models
+    _begin_load()
+    if not background:
+        _load_all()
+        return None
+
+    thread = threading.Thread(target=_load_all, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
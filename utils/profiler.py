@@ -0,0 +1,377 @@
+"""
+Per-stage timing for the screening pipeline.
+
+Off by default. Turn it on with RESUME_SCREENER_PROFILE=1 (or "memory" to
+also trace Python allocations per run), or call enable() at runtime.
+
+    with stage("scoring.tfidf"):
+        ...
+
+    @profiled("nlp.skills")
+    def extract_skills(...):
+        ...
+
+    with profile_run("Resume Screening", enabled=True) as report:
+        screen_batch(...)
+    print(report["stages"])
+
+A run collects its own samples (scoped with a context variable, so
+concurrent runs, e.g. several Streamlit sessions, don't mix or wipe each
+other's timings); outside a run, samples go to a process-wide buffer.
+While nothing is enabled, stage() returns a shared no-op context manager
+and profiled() functions make one flag check before calling straight
+through.
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+PROFILE_LOG_PATH = os.environ.get("RESUME_SCREENER_PROFILE_LOG", "profile_runs.jsonl")
+
+_mode = os.environ.get("RESUME_SCREENER_PROFILE", "").lower()
+_enabled = _mode not in ("", "0", "false", "no")
+_trace_memory = _mode == "memory"
+
+_samples: Dict[str, List[float]] = defaultdict(list)
+_lock = threading.Lock()
+
+# Samples of the ProfileRun active in the current context (thread / task)
+_run_samples: contextvars.ContextVar = contextvars.ContextVar("profile_run_samples", default=None)
+_active_runs = 0
+_tracing_runs = 0
+_owns_tracing = False
+
+
+def enable(on: bool = True, trace_memory: bool = False) -> None:
+    """
+    Process-wide switch (as RESUME_SCREENER_PROFILE). A ProfileRun can also
+    be enabled on its own without touching this.
+    """
+    global _enabled, _trace_memory
+    _enabled = on
+    _trace_memory = on and trace_memory
+
+
+def is_enabled() -> bool:
+    """
+    True if stages are recorded here: globally enabled or inside a run.
+    """
+    return _enabled or _run_samples.get() is not None
+
+
+def settings() -> tuple:
+    """
+    (enabled, trace_memory) for the current context, to hand to worker
+    processes.
+    """
+    return is_enabled(), _trace_memory or _tracing_runs > 0
+
+
+# -------------------------
+# Recording
+# -------------------------
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def stage(name: str):
+    """
+    Context manager timing one execution of stage `name`.
+    """
+    return _Stage(name) if _enabled or _active_runs else _NULL_STAGE
+
+
+def profiled(name: Optional[str] = None):
+    """
+    Decorator timing every call of the function as a stage
+    (default name: module.function).
+    """
+    def decorator(fn):
+        stage_name = name or f"{fn.__module__}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not (_enabled or _active_runs):
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(stage_name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def _target() -> Optional[Dict[str, List[float]]]:
+    # The current run's samples, else the process-wide buffer if enabled
+    samples = _run_samples.get()
+    if samples is None and _enabled:
+        samples = _samples
+    return samples
+
+
+def record(name: str, seconds: float) -> None:
+    samples = _target()
+    if samples is not None:
+        with _lock:
+            samples[name].append(seconds)
+
+
+def drain() -> Dict[str, List[float]]:
+    """
+    Returns and clears the process-wide samples (used to ship
+    worker-process timings back to the parent).
+    """
+    global _samples
+    with _lock:
+        samples, _samples = _samples, defaultdict(list)
+    return dict(samples)
+
+
+def merge(samples: Dict[str, List[float]]) -> None:
+    target = _target()
+    if target is None:
+        return
+    with _lock:
+        for name, values in samples.items():
+            target[name].extend(values)
+
+
+def reset() -> None:
+    drain()
+
+
+def _after_fork_in_child() -> None:
+    # A forked worker inherits the forking thread's context, including its
+    # run; it must record into its own buffer, which the parent merges back
+    global _active_runs, _tracing_runs, _owns_tracing
+    _run_samples.set(None)
+    _active_runs = _tracing_runs = 0
+    _owns_tracing = False
+    _samples.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+# -------------------------
+# Reporting
+# -------------------------
+def summary(samples: Optional[Dict[str, List[float]]] = None) -> List[dict]:
+    """
+    One row per stage: count, total / mean / p50 / p95 / p99 / max (ms),
+    sorted by total time. Defaults to the current run's samples (or the
+    process-wide ones outside a run).
+    """
+    if samples is None:
+        samples = _run_samples.get()
+    if samples is None:
+        samples = _samples
+    with _lock:
+        samples = {name: np.array(values) * 1000 for name, values in samples.items() if values}
+
+    rows = []
+    for name, values in samples.items():
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        rows.append({
+            "stage": name,
+            "count": len(values),
+            "total_ms": round(float(values.sum()), 2),
+            "mean_ms": round(float(values.mean()), 2),
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "max_ms": round(float(values.max()), 2)
+        })
+
+    return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Process peak: the high-water resident memory of this process, or of
+    its largest finished child, over their whole lifetime (MB).
+    """
+    if not RESOURCE_AVAILABLE:
+        return None
+    self_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return round(max(self_kb, children_kb) / 1024, 1)
+
+
+def current_rss_mb() -> Optional[float]:
+    """
+    Resident memory of this process right now (MB; Linux only).
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20, 1)
+
+
+class ProfileRun:
+    """
+    One profiled run: start() opens a sample collector for the current
+    context, stop() fills in and returns the report and appends it to
+    `export_path` as JSON lines. Also usable as a context manager.
+
+    The report has "label", "wall_ms", "stages" and, for memory,
+    "rss_delta_mb" (this process, end minus start of the run),
+    "peak_traced_mb" (Python allocations during the run, with
+    trace_memory; overlapping traced runs share one peak) and
+    "process_peak_rss_mb" (lifetime high-water mark, not per run).
+
+    `enabled` / `trace_memory` default to the process-wide settings;
+    while not enabled the run does nothing and the report stays empty.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        export_path: Optional[str] = PROFILE_LOG_PATH,
+        enabled: Optional[bool] = None,
+        trace_memory: Optional[bool] = None
+    ):
+        self.label = label
+        self.export_path = export_path
+        self.enabled = _enabled if enabled is None else enabled
+        self.trace_memory = self.enabled and (_trace_memory if trace_memory is None else trace_memory)
+        self.report: dict = {}
+        self._start = None
+        self._start_rss = None
+        self._samples = None
+        self._token = None
+
+    def start(self) -> "ProfileRun":
+        global _active_runs, _tracing_runs, _owns_tracing
+        if not self.enabled or self._start is not None:
+            return self
+
+        self._samples = defaultdict(list)
+        self._token = _run_samples.set(self._samples)
+
+        with _lock:
+            _active_runs += 1
+            if self.trace_memory:
+                _tracing_runs += 1
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _owns_tracing = True
+                elif _tracing_runs == 1:
+                    tracemalloc.reset_peak()
+
+        self._start_rss = current_rss_mb()
+        self._start = time.perf_counter()
+        return self
+
+    def stop(self) -> dict:
+        global _active_runs, _tracing_runs, _owns_tracing
+        if self._start is None:
+            return self.report
+
+        wall_ms = round((time.perf_counter() - self._start) * 1000, 2)
+        end_rss = current_rss_mb()
+        peak_traced = (
+            round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+            if self.trace_memory and tracemalloc.is_tracing() else None
+        )
+
+        try:
+            _run_samples.reset(self._token)
+        except ValueError:
+            # stop() from another context than start(): that one keeps it
+            pass
+        with _lock:
+            _active_runs -= 1
+            if self.trace_memory:
+                _tracing_runs -= 1
+                if _tracing_runs == 0 and _owns_tracing:
+                    tracemalloc.stop()
+                    _owns_tracing = False
+
+        self.report.update({
+            "label": self.label,
+            "timestamp": time.time(),
+            "wall_ms": wall_ms,
+            "rss_delta_mb": (
+                round(end_rss - self._start_rss, 1) if end_rss is not None and self._start_rss is not None else None
+            ),
+            "peak_traced_mb": peak_traced,
+            "process_peak_rss_mb": peak_rss_mb(),
+            "stages": summary(self._samples)
+        })
+        self._start = None
+        self._token = None
+
+        if self.export_path:
+            export_jsonl(self.report, self.export_path)
+
+        return self.report
+
+    def __enter__(self) -> dict:
+        self.start()
+        return self.report
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def profile_run(
+    label: str,
+    export_path: Optional[str] = PROFILE_LOG_PATH,
+    enabled: Optional[bool] = None,
+    trace_memory: Optional[bool] = None
+) -> ProfileRun:
+    return ProfileRun(label, export_path, enabled, trace_memory)
+
+
+def export_jsonl(run: dict, path: str = PROFILE_LOG_PATH) -> None:
+    """
+    Appends one JSON line per stage, each carrying the run's metadata.
+    """
+    meta = {k: v for k, v in run.items() if k != "stages"}
+    with open(path, "a", encoding="utf-8") as f:
+        for row in run.get("stages", []):
+            f.write(json.dumps({**meta, **row}) + "\n")